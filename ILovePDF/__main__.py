@@ -38,6 +38,13 @@ if not bot.API_TOKEN or not bot.API_HASH or not bot.API_ID:
     logger.debug(f"bot.API_TOKEN, bot.API_HASH, bot.API_ID : MANDATORY")
     sys.exit("Error: Missing mandatory bot credentials.")
 
+if settings.ROLE not in ("all", "front", "worker"):
+    sys.exit(f"Error: unknown ROLE {settings.ROLE}, use all, front or worker.")
+
+if settings.ROLE != "all" and not dataBASE.MONGODB_URI:
+    logger.debug(f"ROLE {settings.ROLE} : MONGODB_URI MANDATORY [shared job queue]")
+    sys.exit("Error: Missing MONGODB_URI for the shared job queue.")
+
 # PYROGRAM
 class Bot(ILovePDF):
     def __init__(self) -> None:
@@ -48,11 +55,18 @@ class Bot(ILovePDF):
         name, API ID, API hash, and bot token.
         """
         super().__init__(
-            name = "ILovePDF",                  # Type: str
+            # every worker needs a session file of its own
+            name = "ILovePDF" if settings.ROLE != "worker"
+                else f"ILovePDF-{settings.WORKER_ID}",
             api_id = bot.API_ID,                # Type: int or str
             api_hash = bot.API_HASH,            # Type: str
             bot_token = bot.API_TOKEN,          # Type: str
-            plugins = { "root" : "plugins" }    # Type: dict[str, str]
+            plugins = { "root" : "plugins" },   # Type: dict[str, str]
+            # queued jobs wait inside their handler, so keep enough
+            # handlers free for the updates of everyone else
+            workers = settings.QUEUE_SIZE + sum(scheduler.LANES.values()) + 8,
+            # workers only process the jobs queued by the front process
+            no_updates = settings.ROLE == "worker",
         )
 
     async def start(self, *args, **kwargs):
@@ -105,6 +119,10 @@ class Bot(ILovePDF):
                     DATA[user_id][1] = 1 if user.get("fname") else 0
                     DATA[user_id][2] = 1 if user.get("capt") else 0
 
+        # -----> Pre-warmed worker processes for pdf jobs <-----
+        progress.start()
+        await pool.start()
+
         # -----> Telebot/Pyrogram Client Starting <-----
         try:
             await super().start(*args, **kwargs)
@@ -123,6 +141,10 @@ class Bot(ILovePDF):
         # Retrieve and store bot ID
         myID.append(await app.get_me())
 
+        # -----> Claims the jobs of the shared job queue <-----
+        if settings.ROLE == "worker":
+            asyncio.ensure_future(jobqueue.serve(self))
+
         # Set bot commands
         command, _ = await util.translate(
             text = "BOT_COMMAND", lang_code = settings.DEFAULT_LANG
@@ -168,11 +190,17 @@ class Bot(ILovePDF):
             f"{iLovePDF}"
         )
 
+        # ----> RESUME THE JOBS OF THE LAST SHUTDOWN <----
+        resumed = await drain.resume(self)
+
         # ----> NOTIFY. BROKEN WORKS <----
-        if settings.SEND_RESTART:
-            # Notify users
+        # [workers send no notices, the front of their jobs talks to the users]
+        if settings.SEND_RESTART and settings.ROLE != "worker":
+            # Notify users [except the ones whose job is resumed]
             if len(works["u"]):
                 for u in works["u"]:
+                    if int(u) in resumed:
+                        continue
                     lang_code = await getLang(int(u))
                     msg, btn = await translate(
                         text = "RESTART['msg']", button = "RESTART['btn']", lang_code = lang_code
@@ -184,6 +212,8 @@ class Bot(ILovePDF):
             # Notify groups
             if len(works["g"]):
                 for g in works["g"]:
+                    if int(g[0]) in resumed:
+                        continue
                     await app.send_message(chat_id = int(g[0]), text = f"restarted.. {g[1]}")
 
         # Send a notification to the log channel about the bot's status.
@@ -232,32 +262,38 @@ class Bot(ILovePDF):
                 logger.debug(f"⚠️ ERROR IN LOG CHANNEL - {error}", exc_info = True)
 
     async def stop(self, *args):
+        # -----> Finishes or saves the running jobs <-----
+        await drain.drain()
         await super().stop()
+        pool.shutdown(wait=False)
+        progress.shutdown()
 
 
 if __name__ == "__main__":
-    # Define the path for the work directory
-    work_path: str = f"{os.path.abspath(os.getcwd())}/work/nabilanavab"
+    # Define the path for the work directory [every worker has its own one,
+    # so that it wipes only the directories of its own jobs, plugins/utils/work.py]
+    work_path: str = f"{os.path.abspath(os.getcwd())}/{work.ROOT}"
 
     # Check if the work directory exists
     if os.path.exists(work_path):
 
         # Iterate through chats in the directory
-        for chat in os.listdir("work/nabilanavab"):
+        for chat in os.listdir(work.ROOT):
 
             if f"{chat}".startswith("-100"):
                 # Append group chat data
                 works["g"].append(
-                    [chat, [user for user in os.listdir(f"work/nabilanavab/{chat}")]]
+                    [chat, [user for user in os.listdir(f"{work.ROOT}/{chat}")]]
                 )
             else:
                 works["u"].append(chat)
         
-        # Remove the entire work directory
-        shutil.rmtree(f"{os.path.abspath(os.getcwd())}/work")
+        # Remove the files of the broken works [work/resume.json keeps the
+        # jobs saved by the last shutdown, plugins/utils/drain.py]
+        shutil.rmtree(work_path)
 
     # Create the work directory again
-    os.makedirs("work/nabilanavab")
+    os.makedirs(work.ROOT)
 
     # Initialize and run the bot
     app = Bot()
@@ -116,6 +116,114 @@ class settings(object):
 
     STOP_BOT: bool = os.environ.get("STOP_BOT", False)
 
+    # number of worker processes used for pdf processing (Optional)
+    WORKERS: int = int(os.environ.get("WORKERS", 0)) or os.cpu_count() or 1
+
+    # number of worker processes OCRing page shards, and the maximum number of
+    # pages of a pdf accepted for OCR (Optional)
+    OCR_WORKERS: int = int(os.environ.get("OCR_WORKERS", 0)) or WORKERS
+
+    OCR_PAGES: int = int(os.environ.get("OCR_PAGES", 300))
+
+    # maximum number of jobs processed at the same time in each lane, admins can
+    # change it by /jobs <lane> <number> [fast: rename, rotate.. heavy: ocr, compress..] (Optional)
+    FAST_JOBS: int = int(os.environ.get("FAST_JOBS", 8))
+
+    MAX_JOBS: int = int(os.environ.get("MAX_JOBS", 0)) or WORKERS
+
+    HEAVY_JOBS: int = int(os.environ.get("HEAVY_JOBS", 0)) or max(1, WORKERS - 1)
+
+    # maximum number of jobs waiting in the queue [total, per chat] (Optional)
+    QUEUE_SIZE: int = int(os.environ.get("QUEUE_SIZE", 100))
+
+    CHAT_QUEUE_SIZE: int = int(os.environ.get("CHAT_QUEUE_SIZE", 3))
+
+    # jobs wait in the queue while admitting them would use more than these
+    # percentages of the RAM and of the disk holding the work directory (Optional)
+    MAX_RAM: int = int(os.environ.get("MAX_RAM", 85))
+
+    MAX_DISK: int = int(os.environ.get("MAX_DISK", 90))
+
+    WORK_DISK: str = os.environ.get("WORK_DISK", ".")
+
+    # maximum number of external programs [ghostscript, wkhtmltopdf..] running at
+    # the same time, and the cpu seconds each of them may use [wall clock limits:
+    # TIMEOUTS="gs=900 wkhtmltopdf=120", plugins/utils/watchdog.py] (Optional)
+    MAX_PROCESSES: int = int(os.environ.get("MAX_PROCESSES", 0)) or WORKERS
+
+    PROCESS_CPU: int = int(os.environ.get("PROCESS_CPU", 300))
+
+    # "all" runs everything in this process, "front" receives the updates and
+    # queues the jobs in MongoDB, "worker" processes them [needs MONGODB_URI] (Optional)
+    ROLE: str = os.environ.get("ROLE", "all").lower()
+
+    # unique name of a worker process, also names its session file and its work
+    # directory [work/<WORKER_ID>, wiped on start], so set it to reuse them across
+    # restarts [hostname-pid by default] (Optional)
+    WORKER_ID: str = os.environ.get("WORKER_ID", f"{os.uname().nodename}-{os.getpid()}")
+
+    # seconds a worker may stay silent before its jobs go to another worker,
+    # and the number of attempts of a job before it fails (Optional)
+    JOB_LEASE: int = int(os.environ.get("JOB_LEASE", 60))
+
+    JOB_RETRIES: int = int(os.environ.get("JOB_RETRIES", 3))
+
+    # seconds the running jobs get to finish on shutdown, the unfinished ones
+    # are saved and resumed on the next start [plugins/utils/drain.py] (Optional)
+    DRAIN_TIMEOUT: int = int(os.environ.get("DRAIN_TIMEOUT", 25))
+
+    # resolution of the pages of the raster colour transforms [black and white,
+    # gray, invert], the gray level from which a pixel gets white and the
+    # dithering of black and white pages: floyd, ordered or none (Optional)
+    RASTER_DPI: int = int(os.environ.get("RASTER_DPI", 72))
+
+    RASTER_THRESHOLD: int = int(os.environ.get("RASTER_THRESHOLD", 128))
+
+    RASTER_DITHER: str = os.environ.get("RASTER_DITHER", "floyd").lower()
+
+    # resolution of the pages converted to images [previews and photos are
+    # rendered smaller when telegram's limits need it] (Optional)
+    IMAGE_DPI: int = int(os.environ.get("IMAGE_DPI", 144))
+
+    # compression level of the zip archives of pdf pages: 0 stores the jpegs
+    # as they are, 1-9 deflates them [tar archives are never compressed] (Optional)
+    ARCHIVE_LEVEL: int = int(os.environ.get("ARCHIVE_LEVEL", 0))
+
+    # results kept to send again by file_id when the same pdf gets the same
+    # operation, and the seconds an unused result stays [needs MONGODB_URI,
+    # 0 results: no cache] (Optional)
+    CACHE_ENTRIES: int = int(os.environ.get("CACHE_ENTRIES", 10000))
+
+    CACHE_TTL: int = int(os.environ.get("CACHE_TTL", 7 * 24 * 60 * 60))
+
+    # megabytes of downloaded pdfs kept on disk, so the next operation on the
+    # same pdf doesn't download it again [0: no cache] (Optional)
+    INPUT_CACHE: int = int(os.environ.get("INPUT_CACHE", 1024))
+
+    # megabytes from which the page count, encryption and metadata of a pdf
+    # are read from a few ranges of it instead of the download, and the 1 MB
+    # ranges it may fetch for that [plugins/utils/ranged.py] (Optional)
+    INSPECT_SIZE: int = int(os.environ.get("INSPECT_SIZE", 20))
+
+    INSPECT_CHUNKS: int = int(os.environ.get("INSPECT_CHUNKS", 8))
+
+    # seconds a user or group document stays in the profile cache in front
+    # of the database [0: every lookup reads the database] (Optional)
+    PROFILE_TTL: int = int(os.environ.get("PROFILE_TTL", 300))
+
+    # users and groups kept in the profile cache, the least recently used
+    # ones are evicted first (Optional)
+    PROFILE_ENTRIES: int = int(os.environ.get("PROFILE_ENTRIES", 10000))
+
+    # keeps the profile cache of every running bot coherent through a mongodb
+    # change stream [needs a replica set or atlas] (Optional)
+    PROFILE_WATCH: bool = (
+        True if os.environ.get("PROFILE_WATCH", "False") == "True" else False
+    )
+
+    # maximum number of pdf files collected by /batch (Optional)
+    BATCH_SIZE: int = int(os.environ.get("BATCH_SIZE", 20))
+
 
 # If you have any questions or suggestions, please feel free to reach out.
 # Together, we can make this project even better, Happy coding! XD
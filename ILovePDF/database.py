@@ -6,13 +6,122 @@
 file_name: str = "ILovePDF/database.py"
 
 # pip install motor
+import copy
+import time
+import asyncio
 import datetime
+from collections import OrderedDict
+from logger import logger
 from configs.db import dataBASE
 from configs.config import settings
 from typing import Dict, Any, Tuple, List
+from pymongo import ReturnDocument
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCursor
 
 
+class Profiles:
+    """in-process write-through cache of the user and group documents."""
+
+
+    def __init__(self, ttl: int, entries: int) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl (int): Seconds a document stays cached [0: no cache].
+            entries (int): Documents kept at most, the least recently used
+                ones are evicted first.
+        """
+        self.ttl = ttl
+        self.entries = entries
+        # (typ, id) → (expiry, document) [None: no such user or group],
+        # least recently used first
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[float, Any]]" = OrderedDict()
+        # _id → (typ, id), for the deletions of the change stream
+        self._keys: Dict[Any, Tuple[str, int]] = {}
+        self.hits = 0
+        self.misses = 0
+
+
+    def get(self, typ: str, id: int) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Look up a cached document.
+
+        Args:
+            typ (str): 'user' or 'group'.
+            id (int): The unique identifier of the user or group.
+
+        Returns:
+            Tuple[bool, Dict[str, Any]]: Whether it was cached, and a deep copy
+                of the document [None if the user or group doesn't exist].
+        """
+        entry = self._entries.get((typ, id))
+        if entry is not None and entry[0] < time.monotonic():
+            self.drop(typ, id)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        self._entries.move_to_end((typ, id))
+        # callers change nested values [recipes, settings] without a write
+        return True, copy.deepcopy(entry[1])
+
+
+    def put(self, typ: str, id: int, document: Dict[str, Any]) -> None:
+        """
+        Cache a copy of a document read from [or written to] the database.
+
+        Args:
+            typ (str): 'user' or 'group'.
+            id (int): The unique identifier of the user or group.
+            document (Dict[str, Any]): The document, None if it doesn't exist.
+        """
+        if not self.ttl:
+            return
+        self.drop(typ, id)
+        self._entries[(typ, id)] = (time.monotonic() + self.ttl, copy.deepcopy(document))
+        if document is not None and "_id" in document:
+            self._keys[document["_id"]] = (typ, id)
+        while len(self._entries) > self.entries:
+            self.drop(*next(iter(self._entries)))
+
+
+    def update(self, typ: str, id: int, key: str, value: Any) -> None:
+        """
+        Write a changed key through to the cached document.
+
+        Args:
+            typ (str): 'user' or 'group'.
+            id (int): The unique identifier of the user or group.
+            key (str): The changed key.
+            value (Any): Its new value, None if it got removed.
+        """
+        entry = self._entries.get((typ, id))
+        if entry is None or entry[1] is None:
+            return
+        if value is None:
+            entry[1].pop(key, None)
+        else:
+            entry[1][key] = copy.deepcopy(value)
+
+
+    def drop(self, typ: str = None, id: int = None, _id: Any = None) -> None:
+        """
+        Invalidate a cached document, by id or by its _id.
+
+        Args:
+            typ (str): 'user' or 'group'.
+            id (int): The unique identifier of the user or group.
+            _id (Any): The _id of the document [change stream].
+        """
+        if _id is not None:
+            typ, id = self._keys.pop(_id, (typ, id))
+        entry = self._entries.pop((typ, id), None)
+        if entry is not None and entry[1] is not None:
+            self._keys.pop(entry[1].get("_id"), None)
+
+
 class Database:
     """performs various operations on the database."""
 
@@ -31,6 +140,64 @@ class Database:
         # clusters [users, group]
         self.col = self.db.users
         self.grp = self.db.groups
+        # shared job queue of the front and worker processes
+        self.jobs = self.db.jobs
+        # unfinished jobs of the last shutdown
+        self.resume = self.db.resume
+        # file_id of the results sent before [plugins/utils/cache.py]
+        self.cache = self.db.cache
+        # fingerprints of the pdfs seen before [plugins/utils/catalog.py]
+        self.catalog = self.db.catalog
+        # users and groups of the hot path [thumbName, ban checks, settings]
+        self.profiles = Profiles(settings.PROFILE_TTL, settings.PROFILE_ENTRIES)
+        self._watching = False
+
+
+    async def _profile(self, id: int, typ: str = "user") -> Dict[str, Any]:
+        """
+        Retrieve the document of a user or group through the profile cache.
+
+        Args:
+            id (int): The unique identifier of the user or group.
+            typ (str): 'user' or 'group'. Defaults to 'user'.
+
+        Returns:
+            Dict[str, Any]: The document; None if it doesn't exist.
+        """
+        if settings.PROFILE_WATCH and not self._watching:
+            self._watching = True
+            asyncio.ensure_future(self.watch_profiles())
+
+        found, document = self.profiles.get(typ, int(id))
+        if found:
+            return document
+        document = await (self.col if typ == "user" else self.grp).find_one(
+            {"id": int(id)}
+        )
+        self.profiles.put(typ, int(id), document)
+        return copy.deepcopy(document)
+
+
+    async def watch_profiles(self) -> None:
+        """
+        Keep the profile cache coherent with the other instances of the bot
+        through a change stream of the users and groups [needs a replica set].
+        """
+        try:
+            async with self.db.watch(
+                [{"$match": {"ns.coll": {"$in": ["users", "groups"]}}}],
+                full_document = "updateLookup",
+            ) as stream:
+                async for change in stream:
+                    typ = "user" if change["ns"]["coll"] == "users" else "group"
+                    document = change.get("fullDocument")
+                    if document is not None and "id" in document:
+                        self.profiles.put(typ, int(document["id"]), document)
+                    else:
+                        self.profiles.drop(_id = change["documentKey"]["_id"])
+        except Exception as Error:
+            # the ttl keeps the cache close enough without the stream
+            logger.debug("🚫 %s: %s" % (file_name, Error))
 
 
     def new_user(self, id: int, name: str, lang_code: str) -> Dict[str, Any]:
@@ -89,6 +256,7 @@ class Database:
             None: This method does not return a value.
         """
         await self.col.delete_many({"id": int(user_id)})
+        self.profiles.drop("user", int(user_id))
 
     
     async def is_user_exist(self, id: int) -> bool:
@@ -101,7 +269,7 @@ class Database:
         Returns:
             bool: True if the user exists, False otherwise.
         """
-        return bool(await self.col.find_one({"id": int(id)}))
+        return bool(await self._profile(id))
 
 
     async def is_chat_exist(self, chat: int) -> bool:
@@ -118,7 +286,7 @@ class Database:
         Returns:
             bool: True if the chat exists, False otherwise.
         """
-        return bool(await self.grp.find_one({"id": int(chat)}))
+        return bool(await self._profile(chat, "group"))
 
 
     async def add_user(self, id: int, name: str, lang_code: str) -> None:
@@ -136,6 +304,7 @@ class Database:
         await self.col.insert_one(
             self.new_user(id, name, lang_code)
         )
+        self.profiles.drop("user", int(id))
 
 
     async def add_chat(self, chat: int, title: str) -> None:
@@ -152,6 +321,7 @@ class Database:
         await self.grp.insert_one(
             self.new_group(chat, title)
         )
+        self.profiles.drop("group", int(chat))
 
 
     async def get_banned(self) -> Tuple[list[int], List[int]]:
@@ -206,6 +376,8 @@ class Database:
         Returns:
             Dict: Return rpdated user info.
         """
+        # written through to the profile cache
+        self.profiles.update("user" if typ == "user" else "group", int(id), key, value)
         if typ == "user":
             if value is None:
                 return await self.col.update_one(
@@ -239,9 +411,9 @@ class Database:
             Any: The value associated with the key if found; None otherwise.
         """
         if typ == "user":
-            user = await self.col.find_one({"id": int(id)})
+            user = await self._profile(id)
             return user.get(f"{key}", None) or None
-        group = await self.grp.find_one({"id": int(id)})
+        group = await self._profile(id, "group")
         return group.get(f"{key}", None) or None
 
 
@@ -258,6 +430,7 @@ class Database:
         Returns:
             Any: The value associated with the key if found; None otherwise.
         """
+        self.profiles.update("user" if typ == "user" else "group", int(id), key, None)
         if typ == "user":
             return await self.col.update_one(
                 {"id": int(id)}, {"$unset": {f"{key}": ""}}
@@ -278,7 +451,7 @@ class Database:
             dict: A dictionary containing the user's data if found;
                             None if the user does not exist.
         """
-        return await self.col.find_one({"id": int(id)}) or None
+        return await self._profile(id) or None
 
 
     async def get_chat_data(self, id) -> dict:
@@ -292,7 +465,7 @@ class Database:
             dict: A dictionary containing the chat's data if found;
                             None if the chat does not exist.
         """
-        return await self.grp.find_one({"id": int(id)}) or None
+        return await self._profile(id, "group") or None
 
 
     async def get_all_users(self) -> AsyncIOMotorCursor:
@@ -344,6 +517,291 @@ class Database:
         """
         return (await self.db.command("dbstats"))["dataSize"]
 
+
+    async def add_job(self, job: Dict[str, Any]) -> Any:
+        """
+        Add a job to the shared job queue.
+
+        Args:
+            job (Dict[str, Any]): The job [chat, message, data, params, lane..].
+
+        Returns:
+            Any: The id of the queued job.
+        """
+        job.update(
+            status = "queued",
+            attempts = 0,
+            worker = None,
+            lease = None,
+            created = datetime.datetime.utcnow(),
+        )
+        return (await self.jobs.insert_one(job)).inserted_id
+
+
+    async def claim_job(
+        self, worker: str, lanes: List[str], lease: int, retries: int
+    ) -> Dict[str, Any]:
+        """
+        Claim the oldest queued job of the given lanes, or a running job whose
+        worker stopped renewing its lease [died].
+
+        Args:
+            worker (str): The unique name of the claiming worker.
+            lanes (List[str]): The lanes the worker has free slots in.
+            lease (int): Seconds the job belongs to the worker without renewal.
+            retries (int): Maximum number of attempts of a job.
+
+        Returns:
+            Dict[str, Any]: The claimed job; None if there is nothing to do.
+        """
+        now = datetime.datetime.utcnow()
+        return await self.jobs.find_one_and_update(
+            {
+                "lane": {"$in": lanes},
+                "attempts": {"$lt": retries},
+                "$or": [
+                    {"status": "queued"},
+                    {"status": "running", "lease": {"$lt": now}},
+                ],
+            },
+            {
+                "$set": {
+                    "status": "running",
+                    "worker": worker,
+                    "lease": now + datetime.timedelta(seconds = lease),
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort = [("created", 1)],
+            return_document = ReturnDocument.AFTER,
+        )
+
+
+    async def renew_job(self, id: Any, worker: str, lease: int) -> bool:
+        """
+        Renew the lease of a running job [heartbeat].
+
+        Args:
+            id (Any): The id of the job.
+            worker (str): The worker running the job.
+            lease (int): Seconds the job belongs to the worker from now.
+
+        Returns:
+            bool: False if the job got cancelled or claimed by another worker.
+        """
+        result = await self.jobs.update_one(
+            {"_id": id, "worker": worker, "status": "running"},
+            {"$set": {
+                "lease": datetime.datetime.utcnow() + datetime.timedelta(seconds = lease)
+            }},
+        )
+        return result.matched_count == 1
+
+
+    async def ack_job(self, id: Any, worker: str, done: bool = True) -> None:
+        """
+        Remove a finished job, or give it back to the queue.
+
+        Args:
+            id (Any): The id of the job.
+            worker (str): The worker running the job.
+            done (bool): False hands the job to the next free worker.
+        """
+        if done:
+            await self.jobs.delete_one({"_id": id, "worker": worker})
+        else:
+            await self.jobs.update_one(
+                {"_id": id, "worker": worker},
+                {
+                    "$set": {"status": "queued", "worker": None, "lease": None},
+                    "$inc": {"attempts": -1},
+                },
+            )
+
+
+    async def cancel_job(self, path: str) -> None:
+        """
+        Cancel the queued and running jobs of a work directory.
+
+        Args:
+            path (str): The work directory of the job [chat/user].
+        """
+        await self.jobs.delete_many({"path": path, "status": "queued"})
+        await self.jobs.update_many(
+            {"path": path, "status": "running"}, {"$set": {"status": "cancelled"}}
+        )
+
+
+    async def dead_jobs(self, retries: int) -> List[Dict[str, Any]]:
+        """
+        Remove the jobs whose workers died on every attempt [or after the
+        job got cancelled].
+
+        Args:
+            retries (int): Maximum number of attempts of a job.
+
+        Returns:
+            List[Dict[str, Any]]: The removed jobs.
+        """
+        dead = []
+        while job := await self.jobs.find_one_and_delete(
+            {
+                "$or": [
+                    {"status": "running", "attempts": {"$gte": retries}},
+                    {"status": "cancelled"},
+                ],
+                "lease": {"$lt": datetime.datetime.utcnow()},
+            }
+        ):
+            dead.append(job)
+        return dead
+
+
+    async def count_jobs(self, lane: str = None, before: Any = None) -> Dict[str, int]:
+        """
+        Count the jobs of the shared job queue by status.
+
+        Args:
+            lane (str): Only count the jobs of this lane.
+            before (Any): Only count the jobs created before this time.
+
+        Returns:
+            Dict[str, int]: status → number of jobs.
+        """
+        match = {}
+        if lane is not None:
+            match["lane"] = lane
+        if before is not None:
+            match["created"] = {"$lt": before}
+        counts = self.jobs.aggregate(
+            [{"$match": match}, {"$group": {"_id": "$status", "count": {"$sum": 1}}}]
+        )
+        return {count["_id"]: count["count"] async for count in counts}
+
+
+    async def save_resume(self, jobs: List[Dict[str, Any]]) -> None:
+        """
+        Save the unfinished jobs of a shutdown for the next start.
+
+        Args:
+            jobs (List[Dict[str, Any]]): The jobs [chat, message, data, params].
+        """
+        if jobs:
+            await self.resume.insert_many(jobs)
+
+
+    async def load_resume(self) -> List[Dict[str, Any]]:
+        """
+        Retrieve and remove the jobs saved by the last shutdown.
+
+        Returns:
+            List[Dict[str, Any]]: The saved jobs.
+        """
+        jobs = [job async for job in self.resume.find({})]
+        await self.resume.delete_many(
+            {"_id": {"$in": [job["_id"] for job in jobs]}}
+        )
+        return jobs
+
+
+    async def cache_index(self, ttl: int) -> None:
+        """
+        Create the indexes of the result cache [unique key, expiry, eviction].
+
+        Args:
+            ttl (int): Seconds a result stays cached after its last use.
+        """
+        await self.cache.create_index("key", unique = True)
+        await self.cache.create_index("used", expireAfterSeconds = ttl)
+
+
+    async def get_result(self, key: str) -> Dict[str, Any]:
+        """
+        Retrieve a cached result and mark it as used.
+
+        Args:
+            key (str): The key of the result [pdf, operation, answers].
+
+        Returns:
+            Dict[str, Any]: The result [file_id, result]; None if not cached.
+        """
+        return await self.cache.find_one_and_update(
+            {"key": key}, {"$set": {"used": datetime.datetime.utcnow()}}
+        )
+
+
+    async def set_result(self, key: str, file_id: str, result: Any) -> None:
+        """
+        Cache the file_id of a sent result.
+
+        Args:
+            key (str): The key of the result [pdf, operation, answers].
+            file_id (str): The file_id of the sent document.
+            result (Any): What the operation returned besides the file [compress ratio..].
+        """
+        await self.cache.update_one(
+            {"key": key},
+            {"$set": {
+                "file_id": file_id,
+                "result": result,
+                "used": datetime.datetime.utcnow(),
+            }},
+            upsert = True,
+        )
+
+
+    async def evict_results(self, entries: int) -> None:
+        """
+        Remove the least recently used results beyond the size of the cache.
+
+        Args:
+            entries (int): Maximum number of cached results.
+        """
+        surplus = await self.cache.estimated_document_count() - entries
+        if surplus > 0:
+            old = self.cache.find({}, {"_id": 1}).sort("used", 1).limit(surplus)
+            await self.cache.delete_many(
+                {"_id": {"$in": [result["_id"] async for result in old]}}
+            )
+
+
+    async def drop_result(self, key: str) -> None:
+        """
+        Remove a cached result.
+
+        Args:
+            key (str): The key of the result.
+        """
+        await self.cache.delete_one({"key": key})
+
+
+    async def get_fingerprint(self, file_unique_id: str) -> Dict[str, Any]:
+        """
+        Retrieve the fingerprint of a pdf seen before.
+
+        Args:
+            file_unique_id (str): The file_unique_id of the pdf.
+
+        Returns:
+            Dict[str, Any]: The fingerprint [pages, encrypted, metadata..]; None if unknown.
+        """
+        return await self.catalog.find_one({"_id": file_unique_id})
+
+
+    async def set_fingerprint(self, file_unique_id: str, entry: Dict[str, Any]) -> None:
+        """
+        Record the fingerprint of a pdf.
+
+        Args:
+            file_unique_id (str): The file_unique_id of the pdf.
+            entry (Dict[str, Any]): The fingerprint [pages, encrypted, metadata..].
+        """
+        await self.catalog.replace_one(
+            {"_id": file_unique_id},
+            dict(entry, seen = datetime.datetime.utcnow()),
+            upsert = True,
+        )
+
 if dataBASE.MONGODB_URI:
     db: Database = Database(dataBASE.MONGODB_URI, "nabilanavab-iLovePDF")
 
@@ -89,6 +89,7 @@ _DRAW = "🎨 رسم PDF 🎨"
 _BAW = "⚫ أسود / أبيض ⚪"
 _SAT = "🪐 SATURARE 🪐"
 _INV = "🖌 عكس ملف PDF 🖌"
+_GRAY = "🩶 تدرج رمادي 🩶"
 _ADD_PG = "🟢 إضافة صفحات 🟢"
 _DEL_PG = "🔴 حذف الصفحات🔴"
 _ADD_PGNUM = "🔢 أضف الرقم 🔢"
@@ -134,6 +135,12 @@ _START_UPLOAD = " بدأ الرفع .. "
 _START_DOWNL = " تحميل ملفك ..  📥"
 _PROCESSING = "⚙️ المعالجة .."
 _W_I_P = "التقدم في العمل .. 🙇"
+_QUEUED = "⏳ `في قائمة الانتظار..`\n\n`الترتيب : {}`\n`الوقت المتوقع : ~{}`"
+_QUEUE_FULL = "قائمة الانتظار ممتلئة، حاول لاحقًا.. 🙇"
+_BUSY = "🔥 `الخادم مشغول، في قائمة الانتظار..`\n\n`الترتيب : {}`\n`الوقت المتوقع : ~{}`\n\n__يبدأ بمجرد توفر ذاكرة ومساحة كافية__"
+_TOO_BIG = "يحتاج هذا الملف إلى ذاكرة أو مساحة أكبر مما يملكه الخادم.. 🙇"
+_DRAINING = "♻️ يتم إعادة تشغيل البوت، ستستمر مهمتك مباشرة بعد ذلك.. 🙇"
+_OVERLOADED = "🔥 الخادم مشغول جدًا لهذا الملف، حاول مرة أخرى لاحقًا.. 🙇"
 _DL_IMG = "تحميل صورتك ..⏳`"
 _TAKE_TIME = "   ⚙️ جاري العمل ..\n قد يستغرق بعض الوقت ..   "
 _CONVERT = "`تم تحويلة: {} إلى {}`"
@@ -199,7 +206,7 @@ _ASK_MERGE = "__MERGE pdfs »إجمالي ملفات PDF في قائمة الا
 _ASK_PASS = "_PDF {} »n الآن ، الرجاء إدخال كلمة المرور: __\n\n/exit __ خروج __ "
 _ASK_PG = "من فضلك ادخل الجملة التي تريد استخدامها في صفحة الPDF ،\n\n بناء الجملة:\n\t نطاق الصفحة: `[البداية ، النهاية]` ،\n \ t صفحة محددة: `مفصولة بفواصل`.\n\n مثال:  1،3،5،12: 19 "
 _ASK_PG_ERROR = "`بناء جملة غير صالح لرقم الصفحة`\n` NB: يحتوي ملف Pdf على {} صفحات` ⭐ فقط.\n\n الرجاء إدخال بناء جملة صالح لرقم الصفحة ،\n مثل` [البداية: النهاية] `أو` [أرقام الصفحة] ` ."
-_MORE_PGS = "يحتوي علي عدد كبير جداً من الصفحات ،من فضلك ارسل ملف PDF يحتوي علي اقل من 5 صفحات 😐"
+_MORE_PGS = "يحتوي علي عدد كبير جداً من الصفحات ،من فضلك ارسل ملف PDF يحتوي علي اقل من {} صفحات 😐"
 _YOUR_ERROR = "لديك مشكلة كبيرة ..🙂"
 _OWN_RES = "المالك مقيد 😎🤏"
 _ENCRYPT_CAPT = "__ رقم الصفحة__: {}\n__ مفتاح__ 🔐: || {} ||"
@@ -210,6 +217,7 @@ _CANCELED_CB = "🍄 تم الإلغاء 🍄"
 _TOTAL_PG = "`إجمالي الصفحات: {} .. ⏳`"
 _CANCEL_AT = " تم الإلغاء عند {} / {} من الصفحات ..` 🙄"
 _UPLOADING_AL = " تحميل: {} / {} صفحات .. 🐬`"
+_PROCESSING_AL = "`جارٍ المعالجة: {}/{} صفحة.. ⚙️`"
 _SIZE_LOAD = " بسبب التحميل الزائد ، يدعم فقط٪ sMb PDFs .."
 _MERGE_DL = "`تنزيل {}`"
 _START_MERGE = "`بدأ في الدمج {} pdfs`"
@@ -231,6 +239,23 @@ _PRIVATE = "🔐 خاص 🔐"
 _GEN_LINK = "**ها هو! هذا ما كنت تبحث عنه .. **"
 _ERROR_ = "للأسف ، يبدو أنه حدث خطأ ما. يرجى المحاولة لاحقًا.\n\n` الخطأ: `{}"
 _AIO_PROCESS = "```{} العمل قيد التقدم ..🔰 \n قد يستغرق الأمر بعض الوقت .. 💔```"
+_RECIPE_SAVE = "💾 حفظ كوصفة 💾"
+_RECIPE_ASK = "__أرسل اسمًا لهذه الوصفة..__ 💾\n\n/exit __للإلغاء__"
+_RECIPE_SAVED = "`تم حفظ الوصفة {}..` 💾\n\n__اضغط ⚡ {} أسفل أي ملف pdf لتطبيقها، وأدر وصفاتك باستخدام__ /recipes"
+_RECIPE_FULL = "`يمكنك الاحتفاظ بـ {} وصفات فقط، احذف واحدة باستخدام` /recipes 💔"
+_RECIPE_NAME = "`استخدم اسمًا أقصر [حد أقصى {} بايت]، لا يبدأ بـ /` 💔"
+_RECIPE_EMPTY = "`لا توجد وصفات محفوظة بعد..` 🥲\n\n__اضبط خيارات ⚒️ الكل في واحد ⚒️ على ملف pdf واضغط 💾 حفظ كوصفة 💾__"
+_RECIPE_LIST = "**وصفاتك** 💾\n\n{}\n\n__⭐ وصفة تُطبق على كل pdf ترسله، اضغط على وصفة لتبديلها، 🗑 يحذفها__"
+_RECIPE_GONE = "الوصفة غير موجودة.. 💔"
+_RECIPE_NO_PDF = "#old_queue 💔 حاول بإرسال ملف جديد"
+_BATCH_START = "📚 وضع الدفعة 📚\n\n__أرسل لي حتى {} ملفات pdf، ثم اختر ما تريد فعله بها جميعًا..__ 😎"
+_BATCH_ADDED = "`تمت إضافة {} ملفات pdf إلى الدفعة..` 📚\n\n__اختر عملية أو وصفة، أو أرسل المزيد من ملفات pdf__"
+_BATCH_STATUS = "`جارٍ معالجة {} ملفات pdf..` 📚\n\n`تم: {}/{}`"
+_BATCH_DONE = "`تمت معالجة {} من {} ملفات pdf..` 📚"
+_BATCH_SKIPPED = "\n\n`تم تخطيها، قائمة الانتظار ممتلئة:` ⏳\n{}"
+_BATCH_EXPIRED = "انتهت هذه الدفعة، ابدأ دفعة جديدة باستخدام /batch 📚"
+_BATCH_ALBUM = "📤 كألبوم 📤"
+_BATCH_ZIP = "📦 كملف ZIP 📦"
 _VIEW_ONLY = "تم تقييد الرابط للعرض فقط .. 👀"
 _REFER_T = "🎁 رابط الإحالة 🎁"
 _REFER_D = "ادعُ صديقك .."
@@ -281,7 +306,8 @@ STATUS_MSG = {
         "📊 ↓ SERVER ↓ 📊" : "nabilanavab", "📶 STORAGE 📶" : "status|server", "🥥 DATABASE 🥥" : "status|db",
         "🌝 ↓ GET LIST ↓ 🌝": "nabilanavab", "💎 ADMIN 💎" : "status|admin", "👤 USERS 👤" : "status|users", _BACK_HOME : "Home|A"
     },
-    "DB" : """📂 DATABASE :\n\n**◍ Database Users :** `{}` 📍\n**◍ Database Chats :** `{}` 📍""",
+    "DB" : """📂 DATABASE :\n\n**◍ Database Users :** `{}` 📍\n**◍ Database Chats :** `{}` 📍
+**◍ Profile Cache :** `{}` hits, `{}` misses 📍""",
     "SERVER" : "**◍ Total Space     :** `{}`\n**◍ Used Space     :** `{}({}%)`\n**◍ Free Space      :** `{}`\n**◍ CPU Usage      :** `{}`%"
                "**◍ RAM Usage     :** `{}`%\n**◍ Current Work  :** `{}`\n**◍ Message Id     :** `{}`",
     "USERS" : "Users in Database are.", "NO_DB" : "No dataBASE set Yet 💩", "ADMIN" : "**Total ADMIN:** __{}__\n",
@@ -306,7 +332,7 @@ PDF_MESSAGE = {
 BUTTONS = {
     "format" : { _HELP : "nabilanavab|format", "1 × 1" : "#1-format", "✌ 1 × 2 ✌" : "#2-format-H", "✌ 2 × 1 ✌" : "#2-format-V",
                  "🤟 1 × 3 🤟" : "#3-format-H", "🤟 3 × 1 🤟" : "#3-format-V", "2 × 2" : "#4-format", _BACK : "pdf" },
-    "filter" : { _HELP : "nabilanavab|format", _DRAW : "#draw", _BAW : "#baw", _SAT : "#sat", _INV : "#inv", _BACK : "pdf" },
+    "filter" : { _HELP : "nabilanavab|format", _DRAW : "#draw", _BAW : "#baw", _SAT : "#sat", _GRAY : "#gray", _INV : "#inv", _BACK : "pdf" },
     "toImage" : { _P2IMG : "nabilanavab", _P2I : "pdf|img|img", _P2D : "pdf|img|doc", _P2Z : "pdf|img|zip", _P2T : "pdf|img|tar", _BACK : "pdf" },
     "imgRange" : { _P2IMG_ : "nabilanavab", _ALL : "#p2img|{}A", _CUSTOM : "#p2img|{}C", _BACK : "pdf|img" },
     "rotate" : { _B_ROTATE : "nabilanavab", "90°" : "#rot90", "180°" : "#rot180", "270°" : "#rot270", "360°" : "#rot360", _BACK : "pdf" },
@@ -340,7 +366,16 @@ AIO = {
     "aio_button" : {_HELP :"nabilanavab|aioInput", _YES:"aioInput|enc", _NO :"aioInput|dec", _MOVE :"aioInput|dec" },
     "out_button" : { _META : "nabilanavab|aio|met", _PREVIEW : "nabilanavab|aio|pre", _COMPRESS: "nabilanavab|aio|com", _B_TEXT_T : "nabilanavab|aio|txt", _ROTATE : "nabilanavab|aio|rot", _FORMAT : "nabilanavab|aio|for",
         _ENCRYPT : "nabilanavab|aio|enc", _WATERMARK : "nabilanavab|aio|wat", _RENAME : "nabilanavab|aio|rnm", _BACK : "aio", _PROCEED : "processAIO" },
-    "out_values": ["aio|met|{F}", "aio|pre|{F}", "aio|com|{F}", "aio|txt|{F}", "aio|rot|{F}", "aio|for|{F}", "aio|enc|{F}", "aio|wat|{F}", "aio|rnm|{F}" ]}
+    "out_values": ["aio|met|{F}", "aio|pre|{F}", "aio|com|{F}", "aio|txt|{F}", "aio|rot|{F}", "aio|for|{F}", "aio|enc|{F}", "aio|wat|{F}", "aio|rnm|{F}" ],
+    "save" : { _RECIPE_SAVE : "recipe|save" }}
+RECIPE = {
+    "ask" : _RECIPE_ASK, "saved" : _RECIPE_SAVED, "full" : _RECIPE_FULL, "badName" : _RECIPE_NAME, "empty" : _RECIPE_EMPTY,
+    "list" : _RECIPE_LIST, "gone" : _RECIPE_GONE, "noPDF" : _RECIPE_NO_PDF, "close" : _CLOSE, "noDB" : STATUS_MSG['NO_DB'] }
+BATCH = {
+    "start" : _BATCH_START, "added" : _BATCH_ADDED, "status" : _BATCH_STATUS, "done" : _BATCH_DONE, "skipped" : _BATCH_SKIPPED, "expired" : _BATCH_EXPIRED,
+    "album" : _BATCH_ALBUM, "zip" : _BATCH_ZIP, "close" : _CLOSE, "ask" : _WAIT_TXT, "inWork" : _W_I_P,
+    "operations" : { _COMPRESS : "batch|op|compress", _ROTATE : "batch|op|rotate", _B_TEXT_T : "batch|op|text",
+        _WATERMARK : "batch|op|watermark", _ENCRYPT : "batch|op|encrypt" }}
 gDOCUMENT = { "admin" : _ADMIN_ONLY, "notDOC" : _NOT_DOC, "Gadmin" : _G_ADMIN, "adminO" : _NOT_YOUR }
 gDOCUMENT.update(DOCUMENT)
 noHelp = _WASTE
@@ -357,10 +392,11 @@ LINK = {
     "typeBTN" : { _PUBLIC : "link-pub", _PRIVATE : "link-pvt" }, "link" : _GEN_LINK, "error" : _ERROR_ }
 INDEX = {
     "rot360" : _YOUR_ERROR, "ocrError" : _OWN_RES, "notEncrypt": _NOT_ENCRYPT, "largeNo" : _MORE_PGS, "inWork" : _W_I_P, "process" : _PROCESSING,
+    "queued" : _QUEUED, "queueFull" : _QUEUE_FULL, "busy" : _BUSY, "tooBig" : _TOO_BIG, "draining" : _DRAINING, "overloaded" : _OVERLOADED,
     "pyromodASK_1" : _ASK_PASS, "pyromodASK_2" : _ASK_NAME, "pyromodASK_3" : _ASK_MERGE, "download" : _START_DOWNL, "button" : { _CANCEL : "close|me" }, "error" : _ERROR,
     "decrypt_error" : _PASS_ERROR, "cantCompress" : _CANT_COMP, "completed" : _DL_COMPLETED, "upload" : _START_UPLOAD, "encrypt_caption" : _ENCRYPT_CAPT,
     "rename_caption" : _RENAME_CAPT, "exit" : _EXIT, "compress_caption" : _COMP_CAPT, "askImage" : _ASK_PG, "pdfToImgError" : _ASK_PG_ERROR,
-    "_total" : _TOTAL_PG, "_canceledAT" : _CANCEL_AT, "_upload" : _UPLOADING_AL, "finished" : _COMPLETED_SUCC, "cancelCB" : _EXIT,
+    "_total" : _TOTAL_PG, "_canceledAT" : _CANCEL_AT, "_upload" : _UPLOADING_AL, "_process" : _PROCESSING_AL, "finished" : _COMPLETED_SUCC, "cancelCB" : _EXIT,
     "_cancelCB" : {_CANCEL : "close|P2I"}, "_canceledCB" : {_CANCELED_CB : "close|P2IDONE"}, "_completed" : {_COMPLETED : "close|P2ICOMP"},
     "sizeLoad" : _SIZE_LOAD, "mergeDl" : _MERGE_DL, "merge" : _START_MERGE, "watermark_txt" : _WATERMARK_TXT, "watermark_pdf" : _WATERMARK_PDF,
     "watermark_img" : _WATERMARK_IMG, "adding_wa" : _ADD_WATERMARK, "readAgain" : _READ_AGAIN, "zipTAR" : _ZIP_CONVERT, "aio" : _AIO_PROCESS,}
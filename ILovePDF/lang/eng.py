@@ -89,6 +89,7 @@ _DRAW = "🎨 DRAW PDF 🎨"
 _BAW = "⚫ BLACK/WHITE ⚪"
 _SAT = "🪐 SATURATE PDF 🪐"
 _INV = "🖌 INVERT PDF 🖌"
+_GRAY = "🩶 GRAYSCALE PDF 🩶"
 _ADD_PG = "🟢 ADD PAGES 🟢"
 _DEL_PG = "🔴 DELETE PAGES 🔴"
 _ADD_PGNUM = "🔢 ADD NUMBER 🔢"
@@ -134,6 +135,12 @@ _START_UPLOAD = "`Started Uploading..`📤"
 _START_DOWNL = "`Downloading your file..` 📥"
 _PROCESSING = "⚙️ Processing.."
 _W_I_P = "WORK IN PROGRESS.. 🙇"
+_QUEUED = "⏳ `Queued..`\n\n`Position : {}`\n`ETA      : ~{}`"
+_QUEUE_FULL = "QUEUE IS FULL, TRY AGAIN LATER.. 🙇"
+_BUSY = "🔥 `Server busy, queued..`\n\n`Position : {}`\n`ETA      : ~{}`\n\n__starts as soon as there is enough memory and disk__"
+_TOO_BIG = "THIS FILE NEEDS MORE MEMORY OR DISK THAN THE SERVER HAS.. 🙇"
+_DRAINING = "♻️ BOT IS RESTARTING, YOUR JOB CONTINUES RIGHT AFTER IT.. 🙇"
+_OVERLOADED = "🔥 SERVER STAYED TOO BUSY FOR THIS FILE, TRY AGAIN LATER.. 🙇"
 _DL_IMG = "`Downloading your Image..⏳`"
 _TAKE_TIME = "`⚙️ Work in Progress..\nIt might take some time..`💛"
 _CONVERT = "`Converted: {} to {}`"
@@ -199,7 +206,7 @@ _ASK_MERGE = "__MERGE pdfs » Total PDFs in queue: {}\n\n/exit to cancel\n/merge
 _ASK_PASS = "_PDF {} »\nNow, please enter the PASSWORD :__\n\n/exit __to cancel__"
 _ASK_PG_ = "Please enter the PDF page syntax that you would like to use,\n\nSyntax:\n\tRange of page: `[start, end]`,\n\tSpecific page: `separated by commas`.\n\nExample: `1,3,5,12:19`"
 _ASK_PG_ERROR = "`Invalid syntax for page number`\n`NB: Pdf only have {} pages` ⭐.\n\nPlease enter a valid syntax for the page number,\nsuch as `[start:end]` or `[page_numbers]`."
-_MORE_PGS = "It contains too many pages, send me a pdf fewer than 5 pages 😐"
+_MORE_PGS = "It contains too many pages, send me a pdf fewer than {} pages 😐"
 _YOUR_ERROR = "You have some big problem..🙂"
 _OWN_RES = "Owner Restricted 😎🤏"
 _ENCRYPT_CAPT = "__Page Number__: {}\n__key__ 🔐: ||{}||"
@@ -210,6 +217,7 @@ _CANCELED_CB = "🍄 CANCELLED 🍄"
 _TOTAL_PG = "`Total pages: {}..⏳`"
 _CANCEL_AT = "`Cancelled at {}/{} pages..` 🙄"
 _UPLOADING_AL = "`Uploading: {}/{} pages.. 🐬`"
+_PROCESSING_AL = "`Processing: {}/{} pages.. ⚙️`"
 _SIZE_LOAD = "`Due to Overload Bot Only Support %sMb PDFs.."
 _MERGE_DL = "`Downloading {}`"
 _START_MERGE = "`started merging {} pdfs`"
@@ -231,6 +239,23 @@ _PRIVATE = "🔐 PRIVATE 🔐"
 _GEN_LINK = "**Here it is! This is what you were searching for..**"
 _ERROR_ = "Oops, it looks like something went wrong. Please try again later.\n\n`ERROR:` {}"
 _AIO_PROCESS = "`{} work in progress..🔰\nwait it might take some time.. 💔`"
+_RECIPE_SAVE = "💾 SAVE AS RECIPE 💾"
+_RECIPE_ASK = "__Send a name for this recipe..__ 💾\n\n/exit __to cancel__"
+_RECIPE_SAVED = "`recipe {} saved..` 💾\n\n__tap ⚡ {} under any pdf to apply it, manage your recipes with__ /recipes"
+_RECIPE_FULL = "`you can keep only {} recipes, delete one with` /recipes 💔"
+_RECIPE_NAME = "`use a shorter name [max {} bytes], not starting with /` 💔"
+_RECIPE_EMPTY = "`no recipes saved yet..` 🥲\n\n__set the options of ⚒️ ALL IN ONE ⚒️ on a pdf and tap 💾 SAVE AS RECIPE 💾__"
+_RECIPE_LIST = "**YOUR RECIPES** 💾\n\n{}\n\n__⭐ recipe applied to every pdf you send, tap a recipe to switch it, 🗑 deletes it__"
+_RECIPE_GONE = "recipe not found.. 💔"
+_RECIPE_NO_PDF = "#old_queue 💔 try by sending new file"
+_BATCH_START = "📚 BATCH MODE 📚\n\n__Send me up to {} pdf files, then pick what to do with all of them..__ 😎"
+_BATCH_ADDED = "`Added {} pdf files to the batch..` 📚\n\n__Pick an operation or a recipe, or send more pdf files__"
+_BATCH_STATUS = "`processing {} pdf files..` 📚\n\n`done: {}/{}`"
+_BATCH_DONE = "`{} of {} pdf files processed..` 📚"
+_BATCH_SKIPPED = "\n\n`skipped, the queue was full:` ⏳\n{}"
+_BATCH_EXPIRED = "This batch is over, start a new one with /batch 📚"
+_BATCH_ALBUM = "📤 AS ALBUM 📤"
+_BATCH_ZIP = "📦 AS ZIP 📦"
 _VIEW_ONLY = "The link has restricted view access only.. 👀"
 _REFER_T = "🎁 REFERAL LINK 🎁"
 _REFER_D = "Refer Your Friend.. "
@@ -284,7 +309,8 @@ STATUS_MSG = {
     "_HOME" : {
         "📊 ↓ SERVER ↓ 📊" : "nabilanavab", "📶 STORAGE 📶" : "status|server", "🥥 DATABASE 🥥" : "status|db",
         "🌝 ↓ GET LIST ↓ 🌝": "nabilanavab", "💎 ADMIN 💎" : "status|admin", "👤 USERS 👤" : "status|users", _BACK_HOME : "Home|A"},
-    "DB" : """📂 DATABASE :\n\n**◍ Database Users :** `{}` 📍\n**◍ Database Chats :** `{}` 📍""",
+    "DB" : """📂 DATABASE :\n\n**◍ Database Users :** `{}` 📍\n**◍ Database Chats :** `{}` 📍
+**◍ Profile Cache :** `{}` hits, `{}` misses 📍""",
     "SERVER" : "**◍ Total Space     :** `{}`\n**◍ Used Space     :** `{}({}%)`\n**◍ Free Space      :** `{}`\n**◍ CPU Usage      :** `{}%`\n"
                "**◍ RAM Usage     :** `{}`%\n**◍ Current Work  :** `{}`\n**◍ Message Id     :** `{}`",
     "USERS" : "Users in Database are.", "NO_DB" : "No dataBASE set Yet 💩", "ADMIN" : "**Total ADMIN:** __{}__\n",
@@ -309,7 +335,7 @@ PDF_MESSAGE = {
 BUTTONS = {
     "format" : { _HELP : "nabilanavab|format", "1 × 1" : "#1-format", "✌ 1 × 2 ✌" : "#2-format-H", "✌ 2 × 1 ✌" : "#2-format-V",
                  "🤟 1 × 3 🤟" : "#3-format-H", "🤟 3 × 1 🤟" : "#3-format-V", "2 × 2" : "#4-format", _BACK : "pdf" },
-    "filter" : { _HELP : "nabilanavab|format", _DRAW : "#draw", _BAW : "#baw", _SAT : "#sat", _INV : "#inv", _BACK : "pdf" },
+    "filter" : { _HELP : "nabilanavab|format", _DRAW : "#draw", _BAW : "#baw", _SAT : "#sat", _GRAY : "#gray", _INV : "#inv", _BACK : "pdf" },
     "toImage" : { _P2IMG : "nabilanavab", _P2I : "pdf|img|img", _P2D : "pdf|img|doc", _P2Z : "pdf|img|zip", _P2T : "pdf|img|tar", _BACK : "pdf" },
     "imgRange" : { _P2IMG_ : "nabilanavab", _ALL : "#p2img|{}A", _CUSTOM : "#p2img|{}C", _BACK : "pdf|img" },
     "rotate" : { _B_ROTATE : "nabilanavab", "90°" : "#rot90", "180°" : "#rot180", "270°" : "#rot270", "360°" : "#rot360", _BACK : "pdf" },
@@ -343,7 +369,16 @@ AIO = {
     "aio_button" : {_HELP :"nabilanavab|aioInput", _YES:"aioInput|enc", _NO :"aioInput|dec", _MOVE :"aioInput|dec" },
     "out_button" : { _META : "nabilanavab|aio|met", _PREVIEW : "nabilanavab|aio|pre", _COMPRESS: "nabilanavab|aio|com", _B_TEXT_T : "nabilanavab|aio|txt", _ROTATE : "nabilanavab|aio|rot", _FORMAT : "nabilanavab|aio|for",
         _ENCRYPT : "nabilanavab|aio|enc", _WATERMARK : "nabilanavab|aio|wat", _RENAME : "nabilanavab|aio|rnm", _BACK : "aio", _PROCEED : "processAIO" },
-    "out_values": ["aio|met|{F}", "aio|pre|{F}", "aio|com|{F}", "aio|txt|{F}", "aio|rot|{F}", "aio|for|{F}", "aio|enc|{F}", "aio|wat|{F}", "aio|rnm|{F}" ]}
+    "out_values": ["aio|met|{F}", "aio|pre|{F}", "aio|com|{F}", "aio|txt|{F}", "aio|rot|{F}", "aio|for|{F}", "aio|enc|{F}", "aio|wat|{F}", "aio|rnm|{F}" ],
+    "save" : { _RECIPE_SAVE : "recipe|save" }}
+RECIPE = {
+    "ask" : _RECIPE_ASK, "saved" : _RECIPE_SAVED, "full" : _RECIPE_FULL, "badName" : _RECIPE_NAME, "empty" : _RECIPE_EMPTY,
+    "list" : _RECIPE_LIST, "gone" : _RECIPE_GONE, "noPDF" : _RECIPE_NO_PDF, "close" : _CLOSE, "noDB" : STATUS_MSG['NO_DB'] }
+BATCH = {
+    "start" : _BATCH_START, "added" : _BATCH_ADDED, "status" : _BATCH_STATUS, "done" : _BATCH_DONE, "skipped" : _BATCH_SKIPPED, "expired" : _BATCH_EXPIRED,
+    "album" : _BATCH_ALBUM, "zip" : _BATCH_ZIP, "close" : _CLOSE, "ask" : _WAIT_TXT, "inWork" : _W_I_P,
+    "operations" : { _COMPRESS : "batch|op|compress", _ROTATE : "batch|op|rotate", _B_TEXT_T : "batch|op|text",
+        _WATERMARK : "batch|op|watermark", _ENCRYPT : "batch|op|encrypt" }}
 gDOCUMENT = { "admin" : _ADMIN_ONLY, "notDOC" : _NOT_DOC, "Gadmin" : _G_ADMIN, "adminO" : _NOT_YOUR }
 gDOCUMENT.update(DOCUMENT)
 noHelp = _WASTE
@@ -360,10 +395,11 @@ LINK = {
     "typeBTN" : { _PUBLIC : "link-pub", _PRIVATE : "link-pvt" }, "link" : _GEN_LINK, "error" : _ERROR_ }
 INDEX = {
     "rot360" : _YOUR_ERROR, "ocrError" : _OWN_RES, "notEncrypt": _NOT_ENCRYPT, "largeNo" : _MORE_PGS, "inWork" : _W_I_P, "process" : _PROCESSING,
+    "queued" : _QUEUED, "queueFull" : _QUEUE_FULL, "busy" : _BUSY, "tooBig" : _TOO_BIG, "draining" : _DRAINING, "overloaded" : _OVERLOADED,
     "pyromodASK_1" : _ASK_PASS, "pyromodASK_2" : _ASK_NAME, "pyromodASK_3" : _ASK_MERGE, "download" : _START_DOWNL, "button" : { _CANCEL : "close|me" }, "error" : _ERROR,
     "decrypt_error" : _PASS_ERROR, "cantCompress" : _CANT_COMP, "completed" : _DL_COMPLETED, "upload" : _START_UPLOAD, "encrypt_caption" : _ENCRYPT_CAPT,
     "rename_caption" : _RENAME_CAPT, "exit" : _EXIT, "compress_caption" : _COMP_CAPT, "askImage" : _ASK_PG, "pdfToImgError" : _ASK_PG_ERROR,
-    "_total" : _TOTAL_PG, "_canceledAT" : _CANCEL_AT, "_upload" : _UPLOADING_AL, "finished" : _COMPLETED_SUCC, "cancelCB" : _EXIT,
+    "_total" : _TOTAL_PG, "_canceledAT" : _CANCEL_AT, "_upload" : _UPLOADING_AL, "_process" : _PROCESSING_AL, "finished" : _COMPLETED_SUCC, "cancelCB" : _EXIT,
     "_cancelCB" : {_CANCEL : "close|P2I"}, "_canceledCB" : {_CANCELED_CB : "close|P2IDONE"}, "_completed" : {_COMPLETED : "close|P2ICOMP"},
     "sizeLoad" : _SIZE_LOAD, "mergeDl" : _MERGE_DL, "merge" : _START_MERGE, "watermark_txt" : _WATERMARK_TXT, "watermark_pdf" : _WATERMARK_PDF,
     "watermark_img" : _WATERMARK_IMG, "adding_wa" : _ADD_WATERMARK, "readAgain" : _READ_AGAIN, "zipTAR" : _ZIP_CONVERT, "aio" : _AIO_PROCESS,
@@ -89,6 +89,7 @@ _DRAW = "🎨 DESSINER PDF 🎨"
 _BAW = "⚫ NOIR/BLANC ⚪"
 _SAT = "🪐 SATURER PDF 🪐"
 _INV = "🖌 INVERSER LE PDF 🖌"
+_GRAY = "🩶 PDF EN NIVEAUX DE GRIS 🩶"
 _ADD_PG = "🟢 AJOUTER DES PAGES 🟢"
 _DEL_PG = "🔴 SUPPRIMER DES PAGES 🔴"
 _ADD_PGNUM = "🔢 AJOUTER UN NUMÉRO 🔢"
@@ -134,6 +135,12 @@ _START_UPLOAD = "`Téléchargement commencé..`📤"
 _START_DOWNL = "`Téléchargement de votre fichier..` 📥"
 _PROCESSING = "⚙️ Traitement.."
 _W_I_P = "TRAVAIL EN COURS.. 🙇"
+_QUEUED = "⏳ `En file d'attente..`\n\n`Position : {}`\n`Attente  : ~{}`"
+_QUEUE_FULL = "FILE D'ATTENTE PLEINE, RÉESSAYEZ PLUS TARD.. 🙇"
+_BUSY = "🔥 `Serveur occupé, en file d'attente..`\n\n`Position : {}`\n`Attente  : ~{}`\n\n__démarre dès qu'il y a assez de mémoire et de disque__"
+_TOO_BIG = "CE FICHIER DEMANDE PLUS DE MÉMOIRE OU DE DISQUE QUE LE SERVEUR N'EN A.. 🙇"
+_DRAINING = "♻️ LE BOT REDÉMARRE, VOTRE TÂCHE REPREND JUSTE APRÈS.. 🙇"
+_OVERLOADED = "🔥 LE SERVEUR EST RESTÉ TROP OCCUPÉ POUR CE FICHIER, RÉESSAYEZ PLUS TARD.. 🙇"
 _DL_IMG = "`Téléchargement de votre image..⏳`"
 _TAKE_TIME = "```⚙️ Travail en cours..\nCela peut prendre un certain temps..```💛"
 _CONVERT = "`Converti : {} en {}`"
@@ -199,7 +206,7 @@ _ASK_MERGE = "__MERGE pdfs » Total de PDF dans la file d'attente : {}\n\n/ex
 _ASK_PASS = "_PDF {} »\nMaintenant, veuillez saisir le MOT DE PASSE :__\n\n/quitter __pour annuler__"
 _ASK_PG = "Veuillez saisir la syntaxe de page PDF que vous souhaitez utiliser,\n\nSyntaxe :\n	Plage de pages : `[début, fin]`,\n	Page spécifique : `séparés par des virgules`.\n\nExemple : `1,3,5,12:19`"
 _ASK_PG_ERROR = "`Syntaxe non valide pour le numéro de page`\n`NB : Le PDF n'a que {} pages` ⭐.\n\nVeuillez saisir une syntaxe valide pour le numéro de page,\ntelle que `[début : fin]` ou `[numéros de page]` ."
-_MORE_PGS = "Il contient trop de pages, envoyez-moi un pdf de moins de 5 pages 😐"
+_MORE_PGS = "Il contient trop de pages, envoyez-moi un pdf de moins de {} pages 😐"
 _YOUR_ERROR = "Vous avez un gros problème..🙂"
 _OWN_RES = "Propriétaire restreint 😎🤏"
 _ENCRYPT_CAPT = "__Numéro de page__ : {}\n__clé__ 🔐 : ||{}||"
@@ -210,6 +217,7 @@ _CANCELED_CB = "🍄 ANNULÉ 🍄"
 _TOTAL_PG = "`Nombre total de pages : {}..⏳`"
 _CANCEL_AT = "`Annulé à {}/{} pages..` 🙄"
 _UPLOADING_AL = "`Téléchargement : {}/{} pages.. 🐬`"
+_PROCESSING_AL = "`Traitement : {}/{} pages.. ⚙️`"
 _SIZE_LOAD = "`En raison de la surcharge, Bot ne prend en charge que %sMb de PDF.."
 _MERGE_DL = "`Téléchargement {}`"
 _START_MERGE = "`a commencé à fusionner {} pdfs`"
@@ -231,6 +239,23 @@ _PRIVATE = "🔐 PRIVÉ 🔐"
 _GEN_LINK = "**C'est ici! C'est ce que vous cherchiez..**"
 _ERROR_ = "Oups, on dirait que quelque chose s'est mal passé. Veuillez réessayer plus tard.\n\n`ERREUR :` {}"
 _AIO_PROCESS = "```{} travail en cours..🔰\nattendez cela peut prendre un certain temps.. 💔```"
+_RECIPE_SAVE = "💾 ENREGISTRER LA RECETTE 💾"
+_RECIPE_ASK = "__Envoyez un nom pour cette recette..__ 💾\n\n/exit __pour annuler__"
+_RECIPE_SAVED = "`recette {} enregistrée..` 💾\n\n__appuyez sur ⚡ {} sous un pdf pour l'appliquer, gérez vos recettes avec__ /recipes"
+_RECIPE_FULL = "`vous ne pouvez garder que {} recettes, supprimez-en une avec` /recipes 💔"
+_RECIPE_NAME = "`utilisez un nom plus court [max {} octets], ne commençant pas par /` 💔"
+_RECIPE_EMPTY = "`aucune recette enregistrée..` 🥲\n\n__réglez les options de ⚒️ TOUT EN UN ⚒️ sur un pdf et appuyez sur 💾 ENREGISTRER LA RECETTE 💾__"
+_RECIPE_LIST = "**VOS RECETTES** 💾\n\n{}\n\n__⭐ recette appliquée à chaque pdf envoyé, appuyez sur une recette pour la changer, 🗑 la supprime__"
+_RECIPE_GONE = "recette introuvable.. 💔"
+_RECIPE_NO_PDF = "#old_queue 💔 essayez en envoyant un nouveau fichier"
+_BATCH_START = "📚 MODE LOT 📚\n\n__Envoyez-moi jusqu'à {} fichiers pdf, puis choisissez quoi faire de tous..__ 😎"
+_BATCH_ADDED = "`{} fichiers pdf ajoutés au lot..` 📚\n\n__Choisissez une opération ou une recette, ou envoyez d'autres fichiers pdf__"
+_BATCH_STATUS = "`traitement de {} fichiers pdf..` 📚\n\n`terminé : {}/{}`"
+_BATCH_DONE = "`{} sur {} fichiers pdf traités..` 📚"
+_BATCH_SKIPPED = "\n\n`ignorés, la file d'attente était pleine :` ⏳\n{}"
+_BATCH_EXPIRED = "Ce lot est terminé, commencez-en un nouveau avec /batch 📚"
+_BATCH_ALBUM = "📤 EN ALBUM 📤"
+_BATCH_ZIP = "📦 EN ZIP 📦"
 _VIEW_ONLY = "Le lien a un accès restreint à la vue uniquement.. 👀"
 _REFER_T = "🎁 LIEN DE PARRAINAGE 🎁"
 _REFER_D = "Parrainez votre ami.."
@@ -281,7 +306,8 @@ STATUS_MSG = {
         "📊 ↓ SERVER ↓ 📊" : "nabilanavab", "📶 STORAGE 📶" : "status|server", "🥥 DATABASE 🥥" : "status|db",
         "🌝 ↓ GET LIST ↓ 🌝": "nabilanavab", "💎 ADMIN 💎" : "status|admin", "👤 USERS 👤" : "status|users", _BACK_HOME : "Home|A"
     },
-    "DB" : """📂 DATABASE :\n\n**◍ Database Users :** `{}` 📍\n**◍ Database Chats :** `{}` 📍""",
+    "DB" : """📂 DATABASE :\n\n**◍ Database Users :** `{}` 📍\n**◍ Database Chats :** `{}` 📍
+**◍ Profile Cache :** `{}` hits, `{}` misses 📍""",
     "SERVER" : "**◍ Total Space     :** `{}`\n**◍ Used Space     :** `{}({}%)`\n**◍ Free Space      :** `{}`\n**◍ CPU Usage      :** `{}`%"
                "**◍ RAM Usage     :** `{}`%\n**◍ Current Work  :** `{}`\n**◍ Message Id     :** `{}`",
     "USERS" : "Users in Database are.", "NO_DB" : "No dataBASE set Yet 💩", "ADMIN" : "**Total ADMIN:** __{}__\n",
@@ -306,7 +332,7 @@ PDF_MESSAGE = {
 BUTTONS = {
     "format" : { _HELP : "nabilanavab|format", "1 × 1" : "#1-format", "✌ 1 × 2 ✌" : "#2-format-H", "✌ 2 × 1 ✌" : "#2-format-V",
                  "🤟 1 × 3 🤟" : "#3-format-H", "🤟 3 × 1 🤟" : "#3-format-V", "2 × 2" : "#4-format", _BACK : "pdf" },
-    "filter" : { _HELP : "nabilanavab|format", _DRAW : "#draw", _BAW : "#baw", _SAT : "#sat", _INV : "#inv", _BACK : "pdf" },
+    "filter" : { _HELP : "nabilanavab|format", _DRAW : "#draw", _BAW : "#baw", _SAT : "#sat", _GRAY : "#gray", _INV : "#inv", _BACK : "pdf" },
     "toImage" : { _P2IMG : "nabilanavab", _P2I : "pdf|img|img", _P2D : "pdf|img|doc", _P2Z : "pdf|img|zip", _P2T : "pdf|img|tar", _BACK : "pdf" },
     "imgRange" : { _P2IMG_ : "nabilanavab", _ALL : "#p2img|{}A", _CUSTOM : "#p2img|{}C", _BACK : "pdf|img" },
     "rotate" : { _B_ROTATE : "nabilanavab", "90°" : "#rot90", "180°" : "#rot180", "270°" : "#rot270", "360°" : "#rot360", _BACK : "pdf" },
@@ -340,7 +366,16 @@ AIO = {
     "aio_button" : {_HELP :"nabilanavab|aioInput", _YES:"aioInput|enc", _NO :"aioInput|dec", _MOVE :"aioInput|dec" },
     "out_button" : { _META : "nabilanavab|aio|met", _PREVIEW : "nabilanavab|aio|pre", _COMPRESS: "nabilanavab|aio|com", _B_TEXT_T : "nabilanavab|aio|txt", _ROTATE : "nabilanavab|aio|rot", _FORMAT : "nabilanavab|aio|for",
         _ENCRYPT : "nabilanavab|aio|enc", _WATERMARK : "nabilanavab|aio|wat", _RENAME : "nabilanavab|aio|rnm", _BACK : "aio", _PROCEED : "processAIO" },
-    "out_values": ["aio|met|{F}", "aio|pre|{F}", "aio|com|{F}", "aio|txt|{F}", "aio|rot|{F}", "aio|for|{F}", "aio|enc|{F}", "aio|wat|{F}", "aio|rnm|{F}" ]}
+    "out_values": ["aio|met|{F}", "aio|pre|{F}", "aio|com|{F}", "aio|txt|{F}", "aio|rot|{F}", "aio|for|{F}", "aio|enc|{F}", "aio|wat|{F}", "aio|rnm|{F}" ],
+    "save" : { _RECIPE_SAVE : "recipe|save" }}
+RECIPE = {
+    "ask" : _RECIPE_ASK, "saved" : _RECIPE_SAVED, "full" : _RECIPE_FULL, "badName" : _RECIPE_NAME, "empty" : _RECIPE_EMPTY,
+    "list" : _RECIPE_LIST, "gone" : _RECIPE_GONE, "noPDF" : _RECIPE_NO_PDF, "close" : _CLOSE, "noDB" : STATUS_MSG['NO_DB'] }
+BATCH = {
+    "start" : _BATCH_START, "added" : _BATCH_ADDED, "status" : _BATCH_STATUS, "done" : _BATCH_DONE, "skipped" : _BATCH_SKIPPED, "expired" : _BATCH_EXPIRED,
+    "album" : _BATCH_ALBUM, "zip" : _BATCH_ZIP, "close" : _CLOSE, "ask" : _WAIT_TXT, "inWork" : _W_I_P,
+    "operations" : { _COMPRESS : "batch|op|compress", _ROTATE : "batch|op|rotate", _B_TEXT_T : "batch|op|text",
+        _WATERMARK : "batch|op|watermark", _ENCRYPT : "batch|op|encrypt" }}
 gDOCUMENT = { "admin" : _ADMIN_ONLY, "notDOC" : _NOT_DOC, "Gadmin" : _G_ADMIN, "adminO" : _NOT_YOUR }
 gDOCUMENT.update(DOCUMENT)
 noHelp = _WASTE
@@ -357,10 +392,11 @@ LINK = {
     "typeBTN" : { _PUBLIC : "link-pub", _PRIVATE : "link-pvt" }, "link" : _GEN_LINK, "error" : _ERROR_ }
 INDEX = {
     "rot360" : _YOUR_ERROR, "ocrError" : _OWN_RES, "notEncrypt": _NOT_ENCRYPT, "largeNo" : _MORE_PGS, "inWork" : _W_I_P, "process" : _PROCESSING,
+    "queued" : _QUEUED, "queueFull" : _QUEUE_FULL, "busy" : _BUSY, "tooBig" : _TOO_BIG, "draining" : _DRAINING, "overloaded" : _OVERLOADED,
     "pyromodASK_1" : _ASK_PASS, "pyromodASK_2" : _ASK_NAME, "pyromodASK_3" : _ASK_MERGE, "download" : _START_DOWNL, "button" : { _CANCEL : "close|me" }, "error" : _ERROR,
     "decrypt_error" : _PASS_ERROR, "cantCompress" : _CANT_COMP, "completed" : _DL_COMPLETED, "upload" : _START_UPLOAD, "encrypt_caption" : _ENCRYPT_CAPT,
     "rename_caption" : _RENAME_CAPT, "exit" : _EXIT, "compress_caption" : _COMP_CAPT, "askImage" : _ASK_PG, "pdfToImgError" : _ASK_PG_ERROR,
-    "_total" : _TOTAL_PG, "_canceledAT" : _CANCEL_AT, "_upload" : _UPLOADING_AL, "finished" : _COMPLETED_SUCC, "cancelCB" : _EXIT,
+    "_total" : _TOTAL_PG, "_canceledAT" : _CANCEL_AT, "_upload" : _UPLOADING_AL, "_process" : _PROCESSING_AL, "finished" : _COMPLETED_SUCC, "cancelCB" : _EXIT,
     "_cancelCB" : {_CANCEL : "close|P2I"}, "_canceledCB" : {_CANCELED_CB : "close|P2IDONE"}, "_completed" : {_COMPLETED : "close|P2ICOMP"},
     "sizeLoad" : _SIZE_LOAD, "mergeDl" : _MERGE_DL, "merge" : _START_MERGE, "watermark_txt" : _WATERMARK_TXT, "watermark_pdf" : _WATERMARK_PDF,
     "watermark_img" : _WATERMARK_IMG, "adding_wa" : _ADD_WATERMARK, "readAgain" : _READ_AGAIN, "zipTAR" : _ZIP_CONVERT, "aio" : _AIO_PROCESS,}
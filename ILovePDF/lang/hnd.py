@@ -89,6 +89,7 @@ _DRAW = "🎨 पीडीएफ बनाएं 🎨"
 _BAW = "⚫ काला/सफ़ेद ⚪"
 _SAT = "🪐सैटुरारे पीडीएफ 🪐"
 _INV = "🖌 पीडीएफ पलटें 🖌"
+_GRAY = "🩶 ग्रेस्केल पीडीएफ 🩶"
 _ADD_PG = "🟢 पेज जोड़ें 🟢"
 _DEL_PG = "🔴 पेज हटाएं 🔴"
 _ADD_PGNUM = "🔢नंबर जोड़ें 🔢"
@@ -134,6 +135,12 @@ _START_UPLOAD = "`अपलोड करना शुरू कर दिया.
 _START_DOWNL = "`आपकी फ़ाइल डाउनलोड हो रही है..` 📥"
 _PROCESSING = "⚙️ प्रसंस्करण.."
 _W_I_P = "कार्य प्रगति पर है.. 🙇"
+_QUEUED = "⏳ `कतार में..`\n\n`स्थान : {}`\n`अनुमानित समय : ~{}`"
+_QUEUE_FULL = "कतार भरी हुई है, बाद में प्रयास करें.. 🙇"
+_BUSY = "🔥 `सर्वर व्यस्त है, कतार में..`\n\n`स्थान : {}`\n`अनुमानित समय : ~{}`\n\n__पर्याप्त मेमोरी और डिस्क मिलते ही शुरू होगा__"
+_TOO_BIG = "इस फ़ाइल को सर्वर से अधिक मेमोरी या डिस्क चाहिए.. 🙇"
+_DRAINING = "♻️ बॉट पुनः आरंभ हो रहा है, आपका काम उसके तुरंत बाद जारी रहेगा.. 🙇"
+_OVERLOADED = "🔥 इस फ़ाइल के लिए सर्वर बहुत व्यस्त रहा, बाद में पुनः प्रयास करें.. 🙇"
 _DL_IMG = "`आपकी छवि डाउनलोड हो रही है..⏳`"
 _TAKE_TIME = "```⚙️ कार्य प्रगति पर है..\nइसमें कुछ समय लग सकता है..```💛"
 _CONVERT = "`परिवर्तित: {} से {}`"
@@ -199,7 +206,7 @@ _ASK_MERGE = "__पीडीएफ को मर्ज करें » कता
 _ASK_PASS = "_पीडीएफ {} »\nअब, कृपया पासवर्ड दर्ज करें :__\n\n/रद्द करने के लिए __बाहर निकलें__"
 _ASK_PG = "कृपया पीडीएफ पेज सिंटैक्स दर्ज करें जिसे आप उपयोग करना चाहते हैं,\n\nसिंटेक्स:\n	पेज की सीमा: `[प्रारंभ, अंत]`,\n	विशिष्ट पृष्ठ: `अल्पविराम द्वारा अलग किया गया`।\n\nउदाहरण: `1,3,5,12:19`"
 _ASK_PG_ERROR = "`पेज नंबर के लिए अमान्य सिंटैक्स`\n`एनबी: पीडीएफ में केवल {} पेज हैं` ⭐.\n\nकृपया पेज नंबर के लिए एक वैध सिंटैक्स दर्ज करें,\nजैसे कि `[स्टार्ट:एंड]` या `[पेज_नंबर्स]` ."
-_MORE_PGS = "इसमें बहुत सारे पेज हैं, मुझे 5 पेज से कम की पीडीएफ भेजें 😐"
+_MORE_PGS = "इसमें बहुत सारे पेज हैं, मुझे {} पेज से कम की पीडीएफ भेजें 😐"
 _YOUR_ERROR = "आपको कोई बड़ी समस्या है..🙂"
 _OWN_RES = "मालिक प्रतिबंधित 😎🤏"
 _ENCRYPT_CAPT = "__पेज नंबर__: {}\n__key__ 🔐: ||{}||"
@@ -210,6 +217,7 @@ _CANCELED_CB = "🍄रद्द 🍄"
 _TOTAL_PG = "`कुल पृष्ठ: {}..⏳`"
 _CANCEL_AT = "`{}/{} पेजों पर रद्द किया गया..` 🙄"
 _UPLOADING_AL = "`अपलोड हो रहा है: {}/{} पेज.. 🐬`"
+_PROCESSING_AL = "`प्रोसेसिंग: {}/{} पेज.. ⚙️`"
 _SIZE_LOAD = "`अधिभार के कारण बॉट केवल %sMb PDF का समर्थन करता है.."
 _MERGE_DL = "`डाउनलोड हो रहा है {}`"
 _START_MERGE = "``{} पीडीएफ़ को मर्ज करना शुरू किया गया`"
@@ -231,6 +239,23 @@ _PRIVATE = "🔐निजी 🔐"
 _GEN_LINK = "**यह रहा! आप यही खोज रहे थे..**"
 _ERROR_ = "उफ़, ऐसा लगता है जैसे कुछ ग़लत हो गया है। कृपया बाद में पुनः प्रयास करें।\n\n`त्रुटि:` {}"
 _AIO_PROCESS = "```{} कार्य प्रगति पर है..🔰\nप्रतीक्षा करें इसमें कुछ समय लग सकता है.. 💔```"
+_RECIPE_SAVE = "💾 रेसिपी के रूप में सहेजें 💾"
+_RECIPE_ASK = "__इस रेसिपी के लिए एक नाम भेजें..__ 💾\n\n/exit __रद्द करने के लिए__"
+_RECIPE_SAVED = "`रेसिपी {} सहेजी गई..` 💾\n\n__इसे लागू करने के लिए किसी भी pdf के नीचे ⚡ {} दबाएं, अपनी रेसिपी__ /recipes __से प्रबंधित करें__"
+_RECIPE_FULL = "`आप केवल {} रेसिपी रख सकते हैं,` /recipes `से एक हटाएं` 💔"
+_RECIPE_NAME = "`छोटा नाम उपयोग करें [अधिकतम {} बाइट], / से शुरू न हो` 💔"
+_RECIPE_EMPTY = "`अभी तक कोई रेसिपी सहेजी नहीं गई..` 🥲\n\n__किसी pdf पर ⚒️ ऑल इन वन ⚒️ के विकल्प चुनें और 💾 रेसिपी के रूप में सहेजें 💾 दबाएं__"
+_RECIPE_LIST = "**आपकी रेसिपी** 💾\n\n{}\n\n__⭐ आपकी हर pdf पर लागू होने वाली रेसिपी, बदलने के लिए रेसिपी दबाएं, 🗑 इसे हटाता है__"
+_RECIPE_GONE = "रेसिपी नहीं मिली.. 💔"
+_RECIPE_NO_PDF = "#old_queue 💔 नई फ़ाइल भेजकर प्रयास करें"
+_BATCH_START = "📚 बैच मोड 📚\n\n__मुझे {} तक pdf फ़ाइलें भेजें, फिर चुनें कि उन सभी के साथ क्या करना है..__ 😎"
+_BATCH_ADDED = "`बैच में {} pdf फ़ाइलें जोड़ी गईं..` 📚\n\n__कोई ऑपरेशन या रेसिपी चुनें, या और pdf फ़ाइलें भेजें__"
+_BATCH_STATUS = "`{} pdf फ़ाइलें प्रोसेस हो रही हैं..` 📚\n\n`पूर्ण: {}/{}`"
+_BATCH_DONE = "`{} में से {} pdf फ़ाइलें प्रोसेस हुईं..` 📚"
+_BATCH_SKIPPED = "\n\n`छोड़ी गईं, कतार भरी हुई थी:` ⏳\n{}"
+_BATCH_EXPIRED = "यह बैच समाप्त हो गया, /batch से नया शुरू करें 📚"
+_BATCH_ALBUM = "📤 एल्बम के रूप में 📤"
+_BATCH_ZIP = "📦 ZIP के रूप में 📦"
 _VIEW_ONLY = "लिंक में केवल दृश्य पहुंच प्रतिबंधित है.. 👀"
 _REFER_T = "🎁रेफ़रल लिंक 🎁"
 _REFER_D = "अपने मित्र को रेफर करें.."
@@ -281,7 +306,8 @@ STATUS_MSG = {
         "📊 ↓ SERVER ↓ 📊" : "nabilanavab", "📶 STORAGE 📶" : "status|server", "🥥 DATABASE 🥥" : "status|db",
         "🌝 ↓ GET LIST ↓ 🌝": "nabilanavab", "💎 ADMIN 💎" : "status|admin", "👤 USERS 👤" : "status|users", _BACK_HOME : "Home|A"
     },
-    "DB" : """📂 DATABASE :\n\n**◍ Database Users :** `{}` 📍\n**◍ Database Chats :** `{}` 📍""",
+    "DB" : """📂 DATABASE :\n\n**◍ Database Users :** `{}` 📍\n**◍ Database Chats :** `{}` 📍
+**◍ Profile Cache :** `{}` hits, `{}` misses 📍""",
     "SERVER" : "**◍ Total Space     :** `{}`\n**◍ Used Space     :** `{}({}%)`\n**◍ Free Space      :** `{}`\n**◍ CPU Usage      :** `{}`%"
                "**◍ RAM Usage     :** `{}`%\n**◍ Current Work  :** `{}`\n**◍ Message Id     :** `{}`",
     "USERS" : "Users in Database are.", "NO_DB" : "No dataBASE set Yet 💩", "ADMIN" : "**Total ADMIN:** __{}__\n",
@@ -306,7 +332,7 @@ PDF_MESSAGE = {
 BUTTONS = {
     "format" : { _HELP : "nabilanavab|format", "1 × 1" : "#1-format", "✌ 1 × 2 ✌" : "#2-format-H", "✌ 2 × 1 ✌" : "#2-format-V",
                  "🤟 1 × 3 🤟" : "#3-format-H", "🤟 3 × 1 🤟" : "#3-format-V", "2 × 2" : "#4-format", _BACK : "pdf" },
-    "filter" : { _HELP : "nabilanavab|format", _DRAW : "#draw", _BAW : "#baw", _SAT : "#sat", _INV : "#inv", _BACK : "pdf" },
+    "filter" : { _HELP : "nabilanavab|format", _DRAW : "#draw", _BAW : "#baw", _SAT : "#sat", _GRAY : "#gray", _INV : "#inv", _BACK : "pdf" },
     "toImage" : { _P2IMG : "nabilanavab", _P2I : "pdf|img|img", _P2D : "pdf|img|doc", _P2Z : "pdf|img|zip", _P2T : "pdf|img|tar", _BACK : "pdf" },
     "imgRange" : { _P2IMG_ : "nabilanavab", _ALL : "#p2img|{}A", _CUSTOM : "#p2img|{}C", _BACK : "pdf|img" },
     "rotate" : { _B_ROTATE : "nabilanavab", "90°" : "#rot90", "180°" : "#rot180", "270°" : "#rot270", "360°" : "#rot360", _BACK : "pdf" },
@@ -340,7 +366,16 @@ AIO = {
     "aio_button" : {_HELP :"nabilanavab|aioInput", _YES:"aioInput|enc", _NO :"aioInput|dec", _MOVE :"aioInput|dec" },
     "out_button" : { _META : "nabilanavab|aio|met", _PREVIEW : "nabilanavab|aio|pre", _COMPRESS: "nabilanavab|aio|com", _B_TEXT_T : "nabilanavab|aio|txt", _ROTATE : "nabilanavab|aio|rot", _FORMAT : "nabilanavab|aio|for",
         _ENCRYPT : "nabilanavab|aio|enc", _WATERMARK : "nabilanavab|aio|wat", _RENAME : "nabilanavab|aio|rnm", _BACK : "aio", _PROCEED : "processAIO" },
-    "out_values": ["aio|met|{F}", "aio|pre|{F}", "aio|com|{F}", "aio|txt|{F}", "aio|rot|{F}", "aio|for|{F}", "aio|enc|{F}", "aio|wat|{F}", "aio|rnm|{F}" ]}
+    "out_values": ["aio|met|{F}", "aio|pre|{F}", "aio|com|{F}", "aio|txt|{F}", "aio|rot|{F}", "aio|for|{F}", "aio|enc|{F}", "aio|wat|{F}", "aio|rnm|{F}" ],
+    "save" : { _RECIPE_SAVE : "recipe|save" }}
+RECIPE = {
+    "ask" : _RECIPE_ASK, "saved" : _RECIPE_SAVED, "full" : _RECIPE_FULL, "badName" : _RECIPE_NAME, "empty" : _RECIPE_EMPTY,
+    "list" : _RECIPE_LIST, "gone" : _RECIPE_GONE, "noPDF" : _RECIPE_NO_PDF, "close" : _CLOSE, "noDB" : STATUS_MSG['NO_DB'] }
+BATCH = {
+    "start" : _BATCH_START, "added" : _BATCH_ADDED, "status" : _BATCH_STATUS, "done" : _BATCH_DONE, "skipped" : _BATCH_SKIPPED, "expired" : _BATCH_EXPIRED,
+    "album" : _BATCH_ALBUM, "zip" : _BATCH_ZIP, "close" : _CLOSE, "ask" : _WAIT_TXT, "inWork" : _W_I_P,
+    "operations" : { _COMPRESS : "batch|op|compress", _ROTATE : "batch|op|rotate", _B_TEXT_T : "batch|op|text",
+        _WATERMARK : "batch|op|watermark", _ENCRYPT : "batch|op|encrypt" }}
 gDOCUMENT = { "admin" : _ADMIN_ONLY, "notDOC" : _NOT_DOC, "Gadmin" : _G_ADMIN, "adminO" : _NOT_YOUR }
 gDOCUMENT.update(DOCUMENT)
 noHelp = _WASTE
@@ -357,10 +392,11 @@ LINK = {
     "typeBTN" : { _PUBLIC : "link-pub", _PRIVATE : "link-pvt" }, "link" : _GEN_LINK, "error" : _ERROR_ }
 INDEX = {
     "rot360" : _YOUR_ERROR, "ocrError" : _OWN_RES, "notEncrypt": _NOT_ENCRYPT, "largeNo" : _MORE_PGS, "inWork" : _W_I_P, "process" : _PROCESSING,
+    "queued" : _QUEUED, "queueFull" : _QUEUE_FULL, "busy" : _BUSY, "tooBig" : _TOO_BIG, "draining" : _DRAINING, "overloaded" : _OVERLOADED,
     "pyromodASK_1" : _ASK_PASS, "pyromodASK_2" : _ASK_NAME, "pyromodASK_3" : _ASK_MERGE, "download" : _START_DOWNL, "button" : { _CANCEL : "close|me" }, "error" : _ERROR,
     "decrypt_error" : _PASS_ERROR, "cantCompress" : _CANT_COMP, "completed" : _DL_COMPLETED, "upload" : _START_UPLOAD, "encrypt_caption" : _ENCRYPT_CAPT,
     "rename_caption" : _RENAME_CAPT, "exit" : _EXIT, "compress_caption" : _COMP_CAPT, "askImage" : _ASK_PG, "pdfToImgError" : _ASK_PG_ERROR,
-    "_total" : _TOTAL_PG, "_canceledAT" : _CANCEL_AT, "_upload" : _UPLOADING_AL, "finished" : _COMPLETED_SUCC, "cancelCB" : _EXIT,
+    "_total" : _TOTAL_PG, "_canceledAT" : _CANCEL_AT, "_upload" : _UPLOADING_AL, "_process" : _PROCESSING_AL, "finished" : _COMPLETED_SUCC, "cancelCB" : _EXIT,
     "_cancelCB" : {_CANCEL : "close|P2I"}, "_canceledCB" : {_CANCELED_CB : "close|P2IDONE"}, "_completed" : {_COMPLETED : "close|P2ICOMP"},
     "sizeLoad" : _SIZE_LOAD, "mergeDl" : _MERGE_DL, "merge" : _START_MERGE, "watermark_txt" : _WATERMARK_TXT, "watermark_pdf" : _WATERMARK_PDF,
     "watermark_img" : _WATERMARK_IMG, "adding_wa" : _ADD_WATERMARK, "readAgain" : _READ_AGAIN, "zipTAR" : _ZIP_CONVERT, "aio" : _AIO_PROCESS,}
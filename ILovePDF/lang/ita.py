@@ -89,6 +89,7 @@ _DRAW = "🎨 DISEGNA PDF 🎨"
 _BAW = "⚫ NERO/BIANCO ⚪"
 _SAT = "🪐 SATURARE PDF 🪐"
 _INV = "🖌 INVERTI PDF 🖌"
+_GRAY = "🩶 PDF IN SCALA DI GRIGI 🩶"
 _ADD_PG = "🟢 AGGIUNGI PAGINE 🟢"
 _DEL_PG = "🔴 ELIMINA PAGINE 🔴"
 _ADD_PGNUM = "🔢AGGIUNGI NUMERO🔢"
@@ -134,6 +135,12 @@ _START_UPLOAD = "`Caricamento avviato..`📤"
 _START_DOWNL = "`Download del file in corso...` 📥"
 _PROCESSING = "⚙️ Elaborazione.."
 _W_I_P = "LAVORI IN CORSO.. 🙇"
+_QUEUED = "⏳ `In coda..`\n\n`Posizione : {}`\n`Attesa    : ~{}`"
+_QUEUE_FULL = "CODA PIENA, RIPROVA PIÙ TARDI.. 🙇"
+_BUSY = "🔥 `Server occupato, in coda..`\n\n`Posizione : {}`\n`Attesa    : ~{}`\n\n__parte appena c'è abbastanza memoria e disco__"
+_TOO_BIG = "QUESTO FILE RICHIEDE PIÙ MEMORIA O DISCO DI QUANTO NE ABBIA IL SERVER.. 🙇"
+_DRAINING = "♻️ IL BOT SI STA RIAVVIANDO, IL TUO LAVORO RIPRENDE SUBITO DOPO.. 🙇"
+_OVERLOADED = "🔥 IL SERVER È RIMASTO TROPPO OCCUPATO PER QUESTO FILE, RIPROVA PIÙ TARDI.. 🙇"
 _DL_IMG = "`Download della tua immagine...⏳`"
 _TAKE_TIME = "```⚙️ Lavori in corso...\nPotrebbe volerci del tempo...```💛"
 _CONVERT = "`Convertito: {} in {}`"
@@ -199,7 +206,7 @@ _ASK_MERGE = "__UNISCI PDF » Totale PDF in coda: {}\n\n/esci per annullare\n/un
 _ASK_PASS = "_PDF {} »\nOra, inserisci la PASSWORD :__\n\n/esci __per cancellare__"
 _ASK_PG = "Inserisci la sintassi della pagina PDF che desideri utilizzare,\n\nSintassi:\n	Intervallo di pagine: `[inizio, fine]`,\n	Pagina specifica: `separata da virgole`.\n\nEsempio: `1,3,5,12:19`"
 _ASK_PG_ERROR = "`Sintassi non valida per il numero di pagina`\n`NB: Pdf ha solo {} pagine` ⭐.\n\nInserisci una sintassi valida per il numero di pagina,\ncome `[inizio:fine]` o `[num_pagina]` ."
-_MORE_PGS = "Contiene troppe pagine, mandami un pdf di meno di 5 pagine 😐"
+_MORE_PGS = "Contiene troppe pagine, mandami un pdf di meno di {} pagine 😐"
 _YOUR_ERROR = "Hai qualche grosso problema..🙂"
 _OWN_RES = "Proprietario Limitato 😎🤏"
 _ENCRYPT_CAPT = "__Numero pagina__: {}\n__key__ 🔐: ||{}||"
@@ -210,6 +217,7 @@ _CANCELED_CB = "🍄 ANNULLATO 🍄"
 _TOTAL_PG = "`Pagine totali: {}..⏳`"
 _CANCEL_AT = "`Annullato alle {}/{} pagine..` 🙄"
 _UPLOADING_AL = "`Caricamento: {}/{} pagine.. 🐬`"
+_PROCESSING_AL = "`Elaborazione: {}/{} pagine.. ⚙️`"
 _SIZE_LOAD = "`A causa del sovraccarico, il bot supporta solo %sMb PDF.."
 _MERGE_DL = "`Download in corso {}`"
 _START_MERGE = "`ha iniziato a unire {} pdf`"
@@ -231,6 +239,23 @@ _PRIVATE = "🔐 PRIVATO 🔐"
 _GEN_LINK = "**Ecco qui! Questo è quello che stavi cercando..**"
 _ERROR_ = "Spiacenti, sembra che qualcosa sia andato storto. Riprova più tardi.\n\n`ERRORE:` {}"
 _AIO_PROCESS = "```{} lavori in corso..🔰\naspetta potrebbe volerci del tempo.. 💔```"
+_RECIPE_SAVE = "💾 SALVA COME RICETTA 💾"
+_RECIPE_ASK = "__Invia un nome per questa ricetta..__ 💾\n\n/exit __per annullare__"
+_RECIPE_SAVED = "`ricetta {} salvata..` 💾\n\n__tocca ⚡ {} sotto un pdf per applicarla, gestisci le tue ricette con__ /recipes"
+_RECIPE_FULL = "`puoi tenere solo {} ricette, eliminane una con` /recipes 💔"
+_RECIPE_NAME = "`usa un nome più corto [max {} byte], che non inizi con /` 💔"
+_RECIPE_EMPTY = "`nessuna ricetta salvata..` 🥲\n\n__imposta le opzioni di ⚒️ TUTTO IN UNO ⚒️ su un pdf e tocca 💾 SALVA COME RICETTA 💾__"
+_RECIPE_LIST = "**LE TUE RICETTE** 💾\n\n{}\n\n__⭐ ricetta applicata a ogni pdf che invii, tocca una ricetta per cambiarla, 🗑 la elimina__"
+_RECIPE_GONE = "ricetta non trovata.. 💔"
+_RECIPE_NO_PDF = "#old_queue 💔 prova inviando un nuovo file"
+_BATCH_START = "📚 MODALITÀ LOTTO 📚\n\n__Inviami fino a {} file pdf, poi scegli cosa farne..__ 😎"
+_BATCH_ADDED = "`Aggiunti {} file pdf al lotto..` 📚\n\n__Scegli un'operazione o una ricetta, o invia altri file pdf__"
+_BATCH_STATUS = "`elaborazione di {} file pdf..` 📚\n\n`fatto: {}/{}`"
+_BATCH_DONE = "`{} di {} file pdf elaborati..` 📚"
+_BATCH_SKIPPED = "\n\n`saltati, la coda era piena:` ⏳\n{}"
+_BATCH_EXPIRED = "Questo lotto è finito, iniziane uno nuovo con /batch 📚"
+_BATCH_ALBUM = "📤 COME ALBUM 📤"
+_BATCH_ZIP = "📦 COME ZIP 📦"
 _VIEW_ONLY = "Il collegamento ha solo accesso limitato alla visualizzazione.. 👀"
 _REFER_T = "🎁 LINK DI RIFERIMENTO 🎁"
 _REFER_D = "Invita il tuo amico.."
@@ -281,7 +306,8 @@ STATUS_MSG = {
         "📊 ↓ SERVER ↓ 📊" : "nabilanavab", "📶 STORAGE 📶" : "status|server", "🥥 DATABASE 🥥" : "status|db",
         "🌝 ↓ GET LIST ↓ 🌝": "nabilanavab", "💎 ADMIN 💎" : "status|admin", "👤 USERS 👤" : "status|users", _BACK_HOME : "Home|A"
     },
-    "DB" : """📂 DATABASE :\n\n**◍ Database Users :** `{}` 📍\n**◍ Database Chats :** `{}` 📍""",
+    "DB" : """📂 DATABASE :\n\n**◍ Database Users :** `{}` 📍\n**◍ Database Chats :** `{}` 📍
+**◍ Profile Cache :** `{}` hits, `{}` misses 📍""",
     "SERVER" : "**◍ Total Space     :** `{}`\n**◍ Used Space     :** `{}({}%)`\n**◍ Free Space      :** `{}`\n**◍ CPU Usage      :** `{}`%"
                "**◍ RAM Usage     :** `{}`%\n**◍ Current Work  :** `{}`\n**◍ Message Id     :** `{}`",
     "USERS" : "Users in Database are.", "NO_DB" : "No dataBASE set Yet 💩", "ADMIN" : "**Total ADMIN:** __{}__\n",
@@ -306,7 +332,7 @@ PDF_MESSAGE = {
 BUTTONS = {
     "format" : { _HELP : "nabilanavab|format", "1 × 1" : "#1-format", "✌ 1 × 2 ✌" : "#2-format-H", "✌ 2 × 1 ✌" : "#2-format-V",
                  "🤟 1 × 3 🤟" : "#3-format-H", "🤟 3 × 1 🤟" : "#3-format-V", "2 × 2" : "#4-format", _BACK : "pdf" },
-    "filter" : { _HELP : "nabilanavab|format", _DRAW : "#draw", _BAW : "#baw", _SAT : "#sat", _INV : "#inv", _BACK : "pdf" },
+    "filter" : { _HELP : "nabilanavab|format", _DRAW : "#draw", _BAW : "#baw", _SAT : "#sat", _GRAY : "#gray", _INV : "#inv", _BACK : "pdf" },
     "toImage" : { _P2IMG : "nabilanavab", _P2I : "pdf|img|img", _P2D : "pdf|img|doc", _P2Z : "pdf|img|zip", _P2T : "pdf|img|tar", _BACK : "pdf" },
     "imgRange" : { _P2IMG_ : "nabilanavab", _ALL : "#p2img|{}A", _CUSTOM : "#p2img|{}C", _BACK : "pdf|img" },
     "rotate" : { _B_ROTATE : "nabilanavab", "90°" : "#rot90", "180°" : "#rot180", "270°" : "#rot270", "360°" : "#rot360", _BACK : "pdf" },
@@ -340,7 +366,16 @@ AIO = {
     "aio_button" : {_HELP :"nabilanavab|aioInput", _YES:"aioInput|enc", _NO :"aioInput|dec", _MOVE :"aioInput|dec" },
     "out_button" : { _META : "nabilanavab|aio|met", _PREVIEW : "nabilanavab|aio|pre", _COMPRESS: "nabilanavab|aio|com", _B_TEXT_T : "nabilanavab|aio|txt", _ROTATE : "nabilanavab|aio|rot", _FORMAT : "nabilanavab|aio|for",
         _ENCRYPT : "nabilanavab|aio|enc", _WATERMARK : "nabilanavab|aio|wat", _RENAME : "nabilanavab|aio|rnm", _BACK : "aio", _PROCEED : "processAIO" },
-    "out_values": ["aio|met|{F}", "aio|pre|{F}", "aio|com|{F}", "aio|txt|{F}", "aio|rot|{F}", "aio|for|{F}", "aio|enc|{F}", "aio|wat|{F}", "aio|rnm|{F}" ]}
+    "out_values": ["aio|met|{F}", "aio|pre|{F}", "aio|com|{F}", "aio|txt|{F}", "aio|rot|{F}", "aio|for|{F}", "aio|enc|{F}", "aio|wat|{F}", "aio|rnm|{F}" ],
+    "save" : { _RECIPE_SAVE : "recipe|save" }}
+RECIPE = {
+    "ask" : _RECIPE_ASK, "saved" : _RECIPE_SAVED, "full" : _RECIPE_FULL, "badName" : _RECIPE_NAME, "empty" : _RECIPE_EMPTY,
+    "list" : _RECIPE_LIST, "gone" : _RECIPE_GONE, "noPDF" : _RECIPE_NO_PDF, "close" : _CLOSE, "noDB" : STATUS_MSG['NO_DB'] }
+BATCH = {
+    "start" : _BATCH_START, "added" : _BATCH_ADDED, "status" : _BATCH_STATUS, "done" : _BATCH_DONE, "skipped" : _BATCH_SKIPPED, "expired" : _BATCH_EXPIRED,
+    "album" : _BATCH_ALBUM, "zip" : _BATCH_ZIP, "close" : _CLOSE, "ask" : _WAIT_TXT, "inWork" : _W_I_P,
+    "operations" : { _COMPRESS : "batch|op|compress", _ROTATE : "batch|op|rotate", _B_TEXT_T : "batch|op|text",
+        _WATERMARK : "batch|op|watermark", _ENCRYPT : "batch|op|encrypt" }}
 gDOCUMENT = { "admin" : _ADMIN_ONLY, "notDOC" : _NOT_DOC, "Gadmin" : _G_ADMIN, "adminO" : _NOT_YOUR }
 gDOCUMENT.update(DOCUMENT)
 noHelp = _WASTE
@@ -357,10 +392,11 @@ LINK = {
     "typeBTN" : { _PUBLIC : "link-pub", _PRIVATE : "link-pvt" }, "link" : _GEN_LINK, "error" : _ERROR_ }
 INDEX = {
     "rot360" : _YOUR_ERROR, "ocrError" : _OWN_RES, "notEncrypt": _NOT_ENCRYPT, "largeNo" : _MORE_PGS, "inWork" : _W_I_P, "process" : _PROCESSING,
+    "queued" : _QUEUED, "queueFull" : _QUEUE_FULL, "busy" : _BUSY, "tooBig" : _TOO_BIG, "draining" : _DRAINING, "overloaded" : _OVERLOADED,
     "pyromodASK_1" : _ASK_PASS, "pyromodASK_2" : _ASK_NAME, "pyromodASK_3" : _ASK_MERGE, "download" : _START_DOWNL, "button" : { _CANCEL : "close|me" }, "error" : _ERROR,
     "decrypt_error" : _PASS_ERROR, "cantCompress" : _CANT_COMP, "completed" : _DL_COMPLETED, "upload" : _START_UPLOAD, "encrypt_caption" : _ENCRYPT_CAPT,
     "rename_caption" : _RENAME_CAPT, "exit" : _EXIT, "compress_caption" : _COMP_CAPT, "askImage" : _ASK_PG, "pdfToImgError" : _ASK_PG_ERROR,
-    "_total" : _TOTAL_PG, "_canceledAT" : _CANCEL_AT, "_upload" : _UPLOADING_AL, "finished" : _COMPLETED_SUCC, "cancelCB" : _EXIT,
+    "_total" : _TOTAL_PG, "_canceledAT" : _CANCEL_AT, "_upload" : _UPLOADING_AL, "_process" : _PROCESSING_AL, "finished" : _COMPLETED_SUCC, "cancelCB" : _EXIT,
     "_cancelCB" : {_CANCEL : "close|P2I"}, "_canceledCB" : {_CANCELED_CB : "close|P2IDONE"}, "_completed" : {_COMPLETED : "close|P2ICOMP"},
     "sizeLoad" : _SIZE_LOAD, "mergeDl" : _MERGE_DL, "merge" : _START_MERGE, "watermark_txt" : _WATERMARK_TXT, "watermark_pdf" : _WATERMARK_PDF,
     "watermark_img" : _WATERMARK_IMG, "adding_wa" : _ADD_WATERMARK, "readAgain" : _READ_AGAIN, "zipTAR" : _ZIP_CONVERT, "aio" : _AIO_PROCESS,}
@@ -89,6 +89,7 @@ _DRAW = "🎨 DIBUJO PDF 🎨"
 _BAW = "⚫ NEGRO/BLANCO ⚪"
 _SAT = "🪐 SATURAR PDF 🪐"
 _INV = "🖌 INVERTIR PDF 🖌"
+_GRAY = "🩶 PDF EN ESCALA DE GRISES 🩶"
 _ADD_PG = "🟢 AGREGAR PÁGINAS 🟢"
 _DEL_PG = "🔴 ELIMINAR PÁGINAS 🔴"
 _ADD_PGNUM = "🔢 AGREGAR NÚMERO 🔢"
@@ -134,6 +135,12 @@ _START_UPLOAD = "`Comenzó a subir..`📤"
 _START_DOWNL = "`Descargando su archivo..` 📥"
 _PROCESSING = "⚙️ Procesando.."
 _W_I_P = "TRABAJO EN CURSO.. 🙇"
+_QUEUED = "⏳ `En cola..`\n\n`Posición : {}`\n`Espera   : ~{}`"
+_QUEUE_FULL = "COLA LLENA, INTÉNTALO MÁS TARDE.. 🙇"
+_BUSY = "🔥 `Servidor ocupado, en cola..`\n\n`Posición : {}`\n`Espera   : ~{}`\n\n__empieza en cuanto haya memoria y disco suficientes__"
+_TOO_BIG = "ESTE ARCHIVO NECESITA MÁS MEMORIA O DISCO DE LO QUE TIENE EL SERVIDOR.. 🙇"
+_DRAINING = "♻️ EL BOT SE ESTÁ REINICIANDO, TU TAREA CONTINÚA JUSTO DESPUÉS.. 🙇"
+_OVERLOADED = "🔥 EL SERVIDOR SIGUIÓ DEMASIADO OCUPADO PARA ESTE ARCHIVO, INTÉNTALO MÁS TARDE.. 🙇"
 _DL_IMG = "`Descargando su Imagen..⏳`"
 _TAKE_TIME = "```⚙️ Trabajo en progreso..\nPuede llevar algo de tiempo..```💛"
 _CONVERT = "`Convertido: {} a {}`"
@@ -199,7 +206,7 @@ _ASK_MERGE = "__COMBINAR archivos PDF » Total de archivos PDF en cola: {}\n\n/s
 _ASK_PASS = "_PDF {} »\nAhora, ingrese la CONTRASEÑA :__\n\n/salir __para cancelar__"
 _ASK_PG = "Ingrese la sintaxis de la página PDF que le gustaría usar,\n\nSintaxis:\n	Rango de página: `[inicio, fin]`,\n	Página específica: `separados por comas`.\n\nEjemplo: `1,3,5,12:19`"
 _ASK_PG_ERROR = "`Sintaxis no válida para el número de página`\n`NB: PDF solo tiene {} páginas` ⭐.\n\nPor favor, introduzca una sintaxis válida para el número de página,\ncomo `[inicio:fin]` o `[números_de_página]` ."
-_MORE_PGS = "Contiene demasiadas páginas, envíame un pdf de menos de 5 páginas 😐"
+_MORE_PGS = "Contiene demasiadas páginas, envíame un pdf de menos de {} páginas 😐"
 _YOUR_ERROR = "Tienes un gran problema..🙂"
 _OWN_RES = "Propietario restringido 😎🤏"
 _ENCRYPT_CAPT = "__Número de página__: {}\n__clave__ 🔐: ||{}||"
@@ -210,6 +217,7 @@ _CANCELED_CB = "🍄 CANCELADO 🍄"
 _TOTAL_PG = "`Páginas totales: {}..⏳`"
 _CANCEL_AT = "`Cancelado en {}/{} páginas..` 🙄"
 _UPLOADING_AL = "`Cargando: {}/{} páginas... 🐬`"
+_PROCESSING_AL = "`Procesando: {}/{} páginas.. ⚙️`"
 _SIZE_LOAD = "`Debido a la sobrecarga del bot, solo se admiten %sMb PDF."
 _MERGE_DL = "`Descargando {}`"
 _START_MERGE = "`comenzó a fusionar {} archivos PDF`"
@@ -231,6 +239,23 @@ _PRIVATE = "🔐 PRIVADO 🔐"
 _GEN_LINK = "**¡Aquí lo tienes! Esto es lo que estabas buscando..**"
 _ERROR_ = "Vaya, parece que algo salió mal. Vuelva a intentarlo más tarde.\n\n`ERROR:` {}"
 _AIO_PROCESS = "```{} trabajo en progreso..🔰\nespera, puede llevar algo de tiempo.. 💔```"
+_RECIPE_SAVE = "💾 GUARDAR COMO RECETA 💾"
+_RECIPE_ASK = "__Envía un nombre para esta receta..__ 💾\n\n/exit __para cancelar__"
+_RECIPE_SAVED = "`receta {} guardada..` 💾\n\n__toca ⚡ {} debajo de cualquier pdf para aplicarla, gestiona tus recetas con__ /recipes"
+_RECIPE_FULL = "`solo puedes guardar {} recetas, elimina una con` /recipes 💔"
+_RECIPE_NAME = "`usa un nombre más corto [máx {} bytes], que no empiece con /` 💔"
+_RECIPE_EMPTY = "`aún no hay recetas guardadas..` 🥲\n\n__configura las opciones de ⚒️ TODO EN UNO ⚒️ en un pdf y toca 💾 GUARDAR COMO RECETA 💾__"
+_RECIPE_LIST = "**TUS RECETAS** 💾\n\n{}\n\n__⭐ receta aplicada a cada pdf que envías, toca una receta para cambiarla, 🗑 la elimina__"
+_RECIPE_GONE = "receta no encontrada.. 💔"
+_RECIPE_NO_PDF = "#old_queue 💔 intenta enviando un archivo nuevo"
+_BATCH_START = "📚 MODO LOTE 📚\n\n__Envíame hasta {} archivos pdf, luego elige qué hacer con todos..__ 😎"
+_BATCH_ADDED = "`Se añadieron {} archivos pdf al lote..` 📚\n\n__Elige una operación o una receta, o envía más archivos pdf__"
+_BATCH_STATUS = "`procesando {} archivos pdf..` 📚\n\n`hecho: {}/{}`"
+_BATCH_DONE = "`{} de {} archivos pdf procesados..` 📚"
+_BATCH_SKIPPED = "\n\n`omitidos, la cola estaba llena:` ⏳\n{}"
+_BATCH_EXPIRED = "Este lote terminó, empieza uno nuevo con /batch 📚"
+_BATCH_ALBUM = "📤 COMO ÁLBUM 📤"
+_BATCH_ZIP = "📦 COMO ZIP 📦"
 _VIEW_ONLY = "El enlace solo tiene acceso de vista restringida.. 👀"
 _REFER_T = "🎁 ENLACE DE REFERENCIA 🎁"
 _REFER_D = "Recomiende a su amigo.."
@@ -281,7 +306,8 @@ STATUS_MSG = {
         "📊 ↓ SERVER ↓ 📊" : "nabilanavab", "📶 STORAGE 📶" : "status|server", "🥥 DATABASE 🥥" : "status|db",
         "🌝 ↓ GET LIST ↓ 🌝": "nabilanavab", "💎 ADMIN 💎" : "status|admin", "👤 USERS 👤" : "status|users", _BACK_HOME : "Home|A"
     },
-    "DB" : """📂 DATABASE :\n\n**◍ Database Users :** `{}` 📍\n**◍ Database Chats :** `{}` 📍""",
+    "DB" : """📂 DATABASE :\n\n**◍ Database Users :** `{}` 📍\n**◍ Database Chats :** `{}` 📍
+**◍ Profile Cache :** `{}` hits, `{}` misses 📍""",
     "SERVER" : "**◍ Total Space     :** `{}`\n**◍ Used Space     :** `{}({}%)`\n**◍ Free Space      :** `{}`\n**◍ CPU Usage      :** `{}`%"
                "**◍ RAM Usage     :** `{}`%\n**◍ Current Work  :** `{}`\n**◍ Message Id     :** `{}`",
     "USERS" : "Users in Database are.", "NO_DB" : "No dataBASE set Yet 💩", "ADMIN" : "**Total ADMIN:** __{}__\n",
@@ -306,7 +332,7 @@ PDF_MESSAGE = {
 BUTTONS = {
     "format" : { _HELP : "nabilanavab|format", "1 × 1" : "#1-format", "✌ 1 × 2 ✌" : "#2-format-H", "✌ 2 × 1 ✌" : "#2-format-V",
                  "🤟 1 × 3 🤟" : "#3-format-H", "🤟 3 × 1 🤟" : "#3-format-V", "2 × 2" : "#4-format", _BACK : "pdf" },
-    "filter" : { _HELP : "nabilanavab|format", _DRAW : "#draw", _BAW : "#baw", _SAT : "#sat", _INV : "#inv", _BACK : "pdf" },
+    "filter" : { _HELP : "nabilanavab|format", _DRAW : "#draw", _BAW : "#baw", _SAT : "#sat", _GRAY : "#gray", _INV : "#inv", _BACK : "pdf" },
     "toImage" : { _P2IMG : "nabilanavab", _P2I : "pdf|img|img", _P2D : "pdf|img|doc", _P2Z : "pdf|img|zip", _P2T : "pdf|img|tar", _BACK : "pdf" },
     "imgRange" : { _P2IMG_ : "nabilanavab", _ALL : "#p2img|{}A", _CUSTOM : "#p2img|{}C", _BACK : "pdf|img" },
     "rotate" : { _B_ROTATE : "nabilanavab", "90°" : "#rot90", "180°" : "#rot180", "270°" : "#rot270", "360°" : "#rot360", _BACK : "pdf" },
@@ -340,7 +366,16 @@ AIO = {
     "aio_button" : {_HELP :"nabilanavab|aioInput", _YES:"aioInput|enc", _NO :"aioInput|dec", _MOVE :"aioInput|dec" },
     "out_button" : { _META : "nabilanavab|aio|met", _PREVIEW : "nabilanavab|aio|pre", _COMPRESS: "nabilanavab|aio|com", _B_TEXT_T : "nabilanavab|aio|txt", _ROTATE : "nabilanavab|aio|rot", _FORMAT : "nabilanavab|aio|for",
         _ENCRYPT : "nabilanavab|aio|enc", _WATERMARK : "nabilanavab|aio|wat", _RENAME : "nabilanavab|aio|rnm", _BACK : "aio", _PROCEED : "processAIO" },
-    "out_values": ["aio|met|{F}", "aio|pre|{F}", "aio|com|{F}", "aio|txt|{F}", "aio|rot|{F}", "aio|for|{F}", "aio|enc|{F}", "aio|wat|{F}", "aio|rnm|{F}" ]}
+    "out_values": ["aio|met|{F}", "aio|pre|{F}", "aio|com|{F}", "aio|txt|{F}", "aio|rot|{F}", "aio|for|{F}", "aio|enc|{F}", "aio|wat|{F}", "aio|rnm|{F}" ],
+    "save" : { _RECIPE_SAVE : "recipe|save" }}
+RECIPE = {
+    "ask" : _RECIPE_ASK, "saved" : _RECIPE_SAVED, "full" : _RECIPE_FULL, "badName" : _RECIPE_NAME, "empty" : _RECIPE_EMPTY,
+    "list" : _RECIPE_LIST, "gone" : _RECIPE_GONE, "noPDF" : _RECIPE_NO_PDF, "close" : _CLOSE, "noDB" : STATUS_MSG['NO_DB'] }
+BATCH = {
+    "start" : _BATCH_START, "added" : _BATCH_ADDED, "status" : _BATCH_STATUS, "done" : _BATCH_DONE, "skipped" : _BATCH_SKIPPED, "expired" : _BATCH_EXPIRED,
+    "album" : _BATCH_ALBUM, "zip" : _BATCH_ZIP, "close" : _CLOSE, "ask" : _WAIT_TXT, "inWork" : _W_I_P,
+    "operations" : { _COMPRESS : "batch|op|compress", _ROTATE : "batch|op|rotate", _B_TEXT_T : "batch|op|text",
+        _WATERMARK : "batch|op|watermark", _ENCRYPT : "batch|op|encrypt" }}
 gDOCUMENT = { "admin" : _ADMIN_ONLY, "notDOC" : _NOT_DOC, "Gadmin" : _G_ADMIN, "adminO" : _NOT_YOUR }
 gDOCUMENT.update(DOCUMENT)
 noHelp = _WASTE
@@ -357,10 +392,11 @@ LINK = {
     "typeBTN" : { _PUBLIC : "link-pub", _PRIVATE : "link-pvt" }, "link" : _GEN_LINK, "error" : _ERROR_ }
 INDEX = {
     "rot360" : _YOUR_ERROR, "ocrError" : _OWN_RES, "notEncrypt": _NOT_ENCRYPT, "largeNo" : _MORE_PGS, "inWork" : _W_I_P, "process" : _PROCESSING,
+    "queued" : _QUEUED, "queueFull" : _QUEUE_FULL, "busy" : _BUSY, "tooBig" : _TOO_BIG, "draining" : _DRAINING, "overloaded" : _OVERLOADED,
     "pyromodASK_1" : _ASK_PASS, "pyromodASK_2" : _ASK_NAME, "pyromodASK_3" : _ASK_MERGE, "download" : _START_DOWNL, "button" : { _CANCEL : "close|me" }, "error" : _ERROR,
     "decrypt_error" : _PASS_ERROR, "cantCompress" : _CANT_COMP, "completed" : _DL_COMPLETED, "upload" : _START_UPLOAD, "encrypt_caption" : _ENCRYPT_CAPT,
     "rename_caption" : _RENAME_CAPT, "exit" : _EXIT, "compress_caption" : _COMP_CAPT, "askImage" : _ASK_PG, "pdfToImgError" : _ASK_PG_ERROR,
-    "_total" : _TOTAL_PG, "_canceledAT" : _CANCEL_AT, "_upload" : _UPLOADING_AL, "finished" : _COMPLETED_SUCC, "cancelCB" : _EXIT,
+    "_total" : _TOTAL_PG, "_canceledAT" : _CANCEL_AT, "_upload" : _UPLOADING_AL, "_process" : _PROCESSING_AL, "finished" : _COMPLETED_SUCC, "cancelCB" : _EXIT,
     "_cancelCB" : {_CANCEL : "close|P2I"}, "_canceledCB" : {_CANCELED_CB : "close|P2IDONE"}, "_completed" : {_COMPLETED : "close|P2ICOMP"},
     "sizeLoad" : _SIZE_LOAD, "mergeDl" : _MERGE_DL, "merge" : _START_MERGE, "watermark_txt" : _WATERMARK_TXT, "watermark_pdf" : _WATERMARK_PDF,
     "watermark_img" : _WATERMARK_IMG, "adding_wa" : _ADD_WATERMARK, "readAgain" : _READ_AGAIN, "zipTAR" : _ZIP_CONVERT, "aio" : _AIO_PROCESS,}
@@ -89,6 +89,7 @@ _DRAW = "🎨 DRAW PDF 🎨"
 _BAW = "⚫️ QORA/OQ ⚪️"
 _SAT = "🪐 SATURARE PDF 🪐"
 _INV = "🖌 PDF NI INVERT 🖌"
+_GRAY = "🩶 KULRANG PDF 🩶"
 _ADD_PG = "🟢 SAHIFALAR QO'SHISH 🟢"
 _DEL_PG = "🔴 SAHIFALARNI O'CHIRISh 🔴"
 _ADD_PGNUM = "🔢 RAQAM QO‘SHISH 🔢"
@@ -134,6 +135,12 @@ _START_UPLOAD = "`Yuklash boshlandi...`📤"
 _START_DOWNL = "`Faylingiz yuklab olinmoqda...` 📥"
 _PROCESSING = "⚙️ Qayta ishlanmoqda..."
 _W_I_P = "Ishlar davom etmoqda... 🙇"
+_QUEUED = "⏳ `Navbatda..`\n\n`O'rin : {}`\n`Kutish : ~{}`"
+_QUEUE_FULL = "Navbat to'la, keyinroq urinib ko'ring... 🙇"
+_BUSY = "🔥 `Server band, navbatda..`\n\n`O'rin : {}`\n`Kutish : ~{}`\n\n__yetarli xotira va disk bo'shashi bilan boshlanadi__"
+_TOO_BIG = "Bu fayl serverdagidan ko'proq xotira yoki disk talab qiladi.. 🙇"
+_DRAINING = "♻️ Bot qayta ishga tushmoqda, ishingiz darhol davom etadi.. 🙇"
+_OVERLOADED = "🔥 Server bu fayl uchun juda band bo'lib qoldi, keyinroq urinib ko'ring.. 🙇"
 _DL_IMG = "`Rasm yuklab olinmoqda...⏳`"
 _TAKE_TIME = "```⚙️ Ish davom etmoqda..\nBu biroz vaqt olishi mumkin..```💛"
 _CONVERT = "`Oʻzgartirildi: {} dan {}`ga"
@@ -199,7 +206,7 @@ _ASK_MERGE = "__Birlashtirish pdf » Navbatdagi jami PDF fayllar: {}\n\n/exit -
 _ASK_PASS = "_PDF {} »\nEndi, kalit so'z(parol)ni kiriting:__\n\n/exit - __chiqish__ uchun"
 _ASK_PG = "Iltimos, foydalanmoqchi boʻlgan PDF sahifasi sintaksisini kiriting,\n\nSintaksis:\n	Sahifa diapazoni: `[start, end]`,\n	Maxsus sahifa: `vergul bilan ajratilgan`.\n\nMisol: `1,3,5,12:19`"
 _ASK_PG_ERROR = "`Sahifa raqami uchun sintaksisi notoʻgʻri`\n`E'tibor: PDF faylda faqat {} ta sahifa mavjud` ⭐.\n\nSahifa raqami uchun toʻgʻri sintaksisini kiriting,\nmasalan, `[start:end]` yoki `[sahifa_raqamlari]` ."
-_MORE_PGS = "Unda juda ko'p sahifalar bor, menga 5 sahifadan kamroq pdf yuboring 😐"
+_MORE_PGS = "Unda juda ko'p sahifalar bor, menga {} sahifadan kamroq pdf yuboring 😐"
 _YOUR_ERROR = "Sizda katta muammo bor..🙂"
 _OWN_RES = "Admin tomonidan cheklangan 😎🤏"
 _ENCRYPT_CAPT = "__Sahifa raqami__: {}\n__kalit__ 🔐: ||{}||"
@@ -210,6 +217,7 @@ _CANCELED_CB = "🍄 Bekor qilish"
 _TOTAL_PG = "`Jami sahifalar: {}..⏳`"
 _CANCEL_AT = "`{}/{} sahifalarda bekor qilindi..` 🙄"
 _UPLOADING_AL = "`Yuklanmoqda: {}/{} sahifa.. 🐬`"
+_PROCESSING_AL = "`Ishlanmoqda: {}/{} sahifa.. ⚙️`"
 _SIZE_LOAD = "`Haddan tashqari ortiqcha yuklama tufayli bot faqat %sMb PDFlarni qo'llab-quvvatlaydi."
 _MERGE_DL = "`Yuklab olinmoqda {}`"
 _START_MERGE = "`{} pdf faylni birlashtira boshladi`"
@@ -231,6 +239,23 @@ _PRIVATE = "🔐 XUSUSIY"
 _GEN_LINK = "**Mana! Bu siz qidirayotgan narsa..**"
 _ERROR_ = "Nimadir xato ketdi shekilli. Keyinroq qayta urinib ko‘ring.\n\n`XATO:` {}"
 _AIO_PROCESS = "```{} ish davom etmoqda..🔰\nkuting, biroz vaqt ketishi mumkin.. 💔```"
+_RECIPE_SAVE = "💾 RETSEPT SIFATIDA SAQLASH 💾"
+_RECIPE_ASK = "__Ushbu retsept uchun nom yuboring..__ 💾\n\n/exit __bekor qilish uchun__"
+_RECIPE_SAVED = "`{} retsepti saqlandi..` 💾\n\n__uni qo'llash uchun istalgan pdf ostidagi ⚡ {} tugmasini bosing, retseptlaringizni__ /recipes __orqali boshqaring__"
+_RECIPE_FULL = "`faqat {} ta retsept saqlash mumkin,` /recipes `orqali bittasini o'chiring` 💔"
+_RECIPE_NAME = "`qisqaroq nom ishlating [maks {} bayt], / bilan boshlanmasin` 💔"
+_RECIPE_EMPTY = "`hali saqlangan retseptlar yo'q..` 🥲\n\n__pdf uchun ⚒️ HAMMASI BIRDA ⚒️ sozlamalarini tanlang va 💾 RETSEPT SIFATIDA SAQLASH 💾 ni bosing__"
+_RECIPE_LIST = "**RETSEPTLARINGIZ** 💾\n\n{}\n\n__⭐ har bir pdf uchun qo'llanadigan retsept, almashtirish uchun retseptni bosing, 🗑 uni o'chiradi__"
+_RECIPE_GONE = "retsept topilmadi.. 💔"
+_RECIPE_NO_PDF = "#old_queue 💔 yangi fayl yuborib ko'ring"
+_BATCH_START = "📚 TO'PLAM REJIMI 📚\n\n__Menga {} tagacha pdf fayl yuboring, so'ng ularning barchasi bilan nima qilishni tanlang..__ 😎"
+_BATCH_ADDED = "`To'plamga {} ta pdf fayl qo'shildi..` 📚\n\n__Amal yoki retseptni tanlang yoki yana pdf fayllar yuboring__"
+_BATCH_STATUS = "`{} ta pdf fayl qayta ishlanmoqda..` 📚\n\n`bajarildi: {}/{}`"
+_BATCH_DONE = "`{} / {} ta pdf fayl qayta ishlandi..` 📚"
+_BATCH_SKIPPED = "\n\n`o'tkazib yuborildi, navbat to'la edi:` ⏳\n{}"
+_BATCH_EXPIRED = "Bu to'plam tugadi, /batch bilan yangisini boshlang 📚"
+_BATCH_ALBUM = "📤 ALBOM SIFATIDA 📤"
+_BATCH_ZIP = "📦 ZIP SIFATIDA 📦"
 _VIEW_ONLY = "Havolada faqat koʻrish imkoniyati cheklangan.. 👀"
 _REFER_T = "🎁 MA'LUMOT HAVOLASI 🎁"
 _REFER_D = "Do'stingizga murojaat qiling.."
@@ -281,7 +306,8 @@ STATUS_MSG = {
         "📊 ↓ SERVER ↓ 📊" : "nabilanavab", "📶 STORAGE 📶" : "status|server", "🥥 DATABASE 🥥" : "status|db",
         "🌝 ↓ GET LIST ↓ 🌝": "nabilanavab", "💎 ADMIN 💎" : "status|admin", "👤 USERS 👤" : "status|users", _BACK_HOME : "Home|A"
     },
-    "DB" : """📂 DATABASE :\n\n**◍ Database Users :** `{}` 📍\n**◍ Database Chats :** `{}` 📍""",
+    "DB" : """📂 DATABASE :\n\n**◍ Database Users :** `{}` 📍\n**◍ Database Chats :** `{}` 📍
+**◍ Profile Cache :** `{}` hits, `{}` misses 📍""",
     "SERVER" : "**◍ Total Space     :** `{}`\n**◍ Used Space     :** `{}({}%)`\n**◍ Free Space      :** `{}`\n**◍ CPU Usage      :** `{}`%"
                "**◍ RAM Usage     :** `{}`%\n**◍ Current Work  :** `{}`\n**◍ Message Id     :** `{}`",
     "USERS" : "Users in Database are.", "NO_DB" : "No dataBASE set Yet 💩", "ADMIN" : "**Total ADMIN:** __{}__\n",
@@ -306,7 +332,7 @@ PDF_MESSAGE = {
 BUTTONS = {
     "format" : { _HELP : "nabilanavab|format", "1 × 1" : "#1-format", "✌ 1 × 2 ✌" : "#2-format-H", "✌ 2 × 1 ✌" : "#2-format-V",
                  "🤟 1 × 3 🤟" : "#3-format-H", "🤟 3 × 1 🤟" : "#3-format-V", "2 × 2" : "#4-format", _BACK : "pdf" },
-    "filter" : { _HELP : "nabilanavab|format", _DRAW : "#draw", _BAW : "#baw", _SAT : "#sat", _INV : "#inv", _BACK : "pdf" },
+    "filter" : { _HELP : "nabilanavab|format", _DRAW : "#draw", _BAW : "#baw", _SAT : "#sat", _GRAY : "#gray", _INV : "#inv", _BACK : "pdf" },
     "toImage" : { _P2IMG : "nabilanavab", _P2I : "pdf|img|img", _P2D : "pdf|img|doc", _P2Z : "pdf|img|zip", _P2T : "pdf|img|tar", _BACK : "pdf" },
     "imgRange" : { _P2IMG_ : "nabilanavab", _ALL : "#p2img|{}A", _CUSTOM : "#p2img|{}C", _BACK : "pdf|img" },
     "rotate" : { _B_ROTATE : "nabilanavab", "90°" : "#rot90", "180°" : "#rot180", "270°" : "#rot270", "360°" : "#rot360", _BACK : "pdf" },
@@ -340,7 +366,16 @@ AIO = {
     "aio_button" : {_HELP :"nabilanavab|aioInput", _YES:"aioInput|enc", _NO :"aioInput|dec", _MOVE :"aioInput|dec" },
     "out_button" : { _META : "nabilanavab|aio|met", _PREVIEW : "nabilanavab|aio|pre", _COMPRESS: "nabilanavab|aio|com", _B_TEXT_T : "nabilanavab|aio|txt", _ROTATE : "nabilanavab|aio|rot", _FORMAT : "nabilanavab|aio|for",
         _ENCRYPT : "nabilanavab|aio|enc", _WATERMARK : "nabilanavab|aio|wat", _RENAME : "nabilanavab|aio|rnm", _BACK : "aio", _PROCEED : "processAIO" },
-    "out_values": ["aio|met|{F}", "aio|pre|{F}", "aio|com|{F}", "aio|txt|{F}", "aio|rot|{F}", "aio|for|{F}", "aio|enc|{F}", "aio|wat|{F}", "aio|rnm|{F}" ]}
+    "out_values": ["aio|met|{F}", "aio|pre|{F}", "aio|com|{F}", "aio|txt|{F}", "aio|rot|{F}", "aio|for|{F}", "aio|enc|{F}", "aio|wat|{F}", "aio|rnm|{F}" ],
+    "save" : { _RECIPE_SAVE : "recipe|save" }}
+RECIPE = {
+    "ask" : _RECIPE_ASK, "saved" : _RECIPE_SAVED, "full" : _RECIPE_FULL, "badName" : _RECIPE_NAME, "empty" : _RECIPE_EMPTY,
+    "list" : _RECIPE_LIST, "gone" : _RECIPE_GONE, "noPDF" : _RECIPE_NO_PDF, "close" : _CLOSE, "noDB" : STATUS_MSG['NO_DB'] }
+BATCH = {
+    "start" : _BATCH_START, "added" : _BATCH_ADDED, "status" : _BATCH_STATUS, "done" : _BATCH_DONE, "skipped" : _BATCH_SKIPPED, "expired" : _BATCH_EXPIRED,
+    "album" : _BATCH_ALBUM, "zip" : _BATCH_ZIP, "close" : _CLOSE, "ask" : _WAIT_TXT, "inWork" : _W_I_P,
+    "operations" : { _COMPRESS : "batch|op|compress", _ROTATE : "batch|op|rotate", _B_TEXT_T : "batch|op|text",
+        _WATERMARK : "batch|op|watermark", _ENCRYPT : "batch|op|encrypt" }}
 gDOCUMENT = { "admin" : _ADMIN_ONLY, "notDOC" : _NOT_DOC, "Gadmin" : _G_ADMIN, "adminO" : _NOT_YOUR }
 gDOCUMENT.update(DOCUMENT)
 noHelp = _WASTE
@@ -357,10 +392,11 @@ LINK = {
     "typeBTN" : { _PUBLIC : "link-pub", _PRIVATE : "link-pvt" }, "link" : _GEN_LINK, "error" : _ERROR_ }
 INDEX = {
     "rot360" : _YOUR_ERROR, "ocrError" : _OWN_RES, "notEncrypt": _NOT_ENCRYPT, "largeNo" : _MORE_PGS, "inWork" : _W_I_P, "process" : _PROCESSING,
+    "queued" : _QUEUED, "queueFull" : _QUEUE_FULL, "busy" : _BUSY, "tooBig" : _TOO_BIG, "draining" : _DRAINING, "overloaded" : _OVERLOADED,
     "pyromodASK_1" : _ASK_PASS, "pyromodASK_2" : _ASK_NAME, "pyromodASK_3" : _ASK_MERGE, "download" : _START_DOWNL, "button" : { _CANCEL : "close|me" }, "error" : _ERROR,
     "decrypt_error" : _PASS_ERROR, "cantCompress" : _CANT_COMP, "completed" : _DL_COMPLETED, "upload" : _START_UPLOAD, "encrypt_caption" : _ENCRYPT_CAPT,
     "rename_caption" : _RENAME_CAPT, "exit" : _EXIT, "compress_caption" : _COMP_CAPT, "askImage" : _ASK_PG, "pdfToImgError" : _ASK_PG_ERROR,
-    "_total" : _TOTAL_PG, "_canceledAT" : _CANCEL_AT, "_upload" : _UPLOADING_AL, "finished" : _COMPLETED_SUCC, "cancelCB" : _EXIT,
+    "_total" : _TOTAL_PG, "_canceledAT" : _CANCEL_AT, "_upload" : _UPLOADING_AL, "_process" : _PROCESSING_AL, "finished" : _COMPLETED_SUCC, "cancelCB" : _EXIT,
     "_cancelCB" : {_CANCEL : "close|P2I"}, "_canceledCB" : {_CANCELED_CB : "close|P2IDONE"}, "_completed" : {_COMPLETED : "close|P2ICOMP"},
     "sizeLoad" : _SIZE_LOAD, "mergeDl" : _MERGE_DL, "merge" : _START_MERGE, "watermark_txt" : _WATERMARK_TXT, "watermark_pdf" : _WATERMARK_PDF,
     "watermark_img" : _WATERMARK_IMG, "adding_wa" : _ADD_WATERMARK, "readAgain" : _READ_AGAIN, "zipTAR" : _ZIP_CONVERT, "aio" : _AIO_PROCESS,}
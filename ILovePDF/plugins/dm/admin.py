@@ -46,6 +46,51 @@ async def stop(bot, message):
         logger.exception("🐞 %s: %s" % (file_name, error), exc_info=True)
 
 
+# Global job queue status, /jobs <lane> <number> sets the concurrency budget of a lane [only for admins]
+@ILovePDF.on_message(filters.command("jobs") & filters.user(dm.ADMINS) & filters.private & filters.incoming)
+async def jobs(bot, message):
+    try:
+        if (
+            len(message.command) == 3
+            and message.command[1] in scheduler.LANES
+            and message.command[2].isdigit()
+        ):
+            scheduler.setLimit(int(message.command[2]), lane=message.command[1])
+        text = "MESSAGE FOR ADMIN: `job queue` ⏳\n"
+        for lane, queue in scheduler.status().items():
+            text += (
+                f"\n**{lane.upper()}**\n"
+                f"`running : {queue['running']}/{queue['limit']}`\n"
+                f"`waiting : {queue['waiting']} ({queue['chats']} chats)`\n"
+                f"`average : {queue['average']}s/job`\n"
+            )
+        usage = admission.status()
+        text += (
+            f"\n**RESOURCES**\n"
+            f"`ram  : {usage['ram']}+{usage['reservedRam']}/{usage['ramLimit']} MB`\n"
+            f"`disk : {usage['disk']}+{usage['reservedDisk']}/{usage['diskLimit']} MB`\n"
+        )
+        process = external.status()
+        text += (
+            f"\n**EXTERNAL PROGRAMS**\n"
+            f"`running : {process['running']}/{process['limit']}`\n"
+            f"`waiting : {process['waiting']}`\n"
+        )
+        if settings.ROLE != "all":
+            shared = await jobqueue.status()
+            text += (
+                f"\n**SHARED QUEUE**\n"
+                f"`queued  : {shared.get('queued', 0)}`\n"
+                f"`running : {shared.get('running', 0)}`\n"
+            )
+        await message.reply(
+            text + "\n__/jobs <fast|normal|heavy> <number> changes the limit__",
+            quote=True
+        )
+    except Exception as error:
+        logger.exception("🐞 %s: %s" % (file_name, error), exc_info=True)
+
+
 @ILovePDF.on_callback_query(filters.regex("ping_me"))
 async def ping_me(bot, callbackQuery):
     try:
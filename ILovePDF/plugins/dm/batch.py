@@ -0,0 +1,279 @@
+# This module is part of https://github.com/nabilanavab/ilovepdf
+# Feel free to use and contribute to this project. Your contributions are welcome!
+# copyright ©️ 2021 nabilanavab
+
+file_name = "ILovePDF/plugins/dm/batch.py"
+
+# chat id → pdf files collected by /batch [like the /hd images, photo.py]
+BATCH = {}
+
+from plugins import *
+from plugins.utils import *
+from configs.config import settings
+from pyrogram.types import ForceReply
+from pyrogram.types import InlineKeyboardMarkup, InlineKeyboardButton, InputMediaDocument
+from .callBack.__aio__ import DEFAULT_WORK, runAIO
+
+# batch operation → aio options [watermark and encrypt ask for their text once]
+OPERATIONS = {
+    "compress": {"compress": True},
+    "rotate": {"rotate": "rot90"},
+    "text": {"text": "text"},
+    "watermark": {"watermark": None},
+    "encrypt": {"encrypt": None},
+}
+
+# telegram sends at most 10 documents in a media group
+ALBUM = 10
+
+# extensions of the extracted text, collected next to the pdf [__aio__.text_file]
+TEXT = (".txt", ".html", ".json")
+
+
+class Part(drain.Replay):
+    """callback query working on one file of a batch [own work directory]"""
+
+    def __init__(self, part: int, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.part = part
+        self.answered = None
+
+    async def answer(self, text: str = None, *args, **kwargs) -> None:
+        # the batch reports every file on its own message [and the files
+        # the queue refused in its summary]
+        self.answered = text
+
+
+async def keyboard(chat_id: int, CHUNK: dict) -> InlineKeyboardMarkup:
+    """operations, recipes and the output type of a batch"""
+    buttons = [
+        [InlineKeyboardButton(key, value)]
+        for key, value in CHUNK["operations"].items()
+    ]
+    buttons.extend(
+        [
+            [InlineKeyboardButton(f"⚡ {name}", f"batch|run|{name}")]
+            for name in await recipe.get(chat_id)
+        ]
+    )
+    buttons.append(
+        [
+            InlineKeyboardButton(
+                CHUNK["zip"] if BATCH[chat_id]["zip"] else CHUNK["album"], "batch|zip"
+            ),
+            InlineKeyboardButton(CHUNK["close"], "batch|close"),
+        ]
+    )
+    return InlineKeyboardMarkup(buttons)
+
+
+#  REPLY TO /BATCH
+@ILovePDF.on_message(filters.private & filters.command("batch") & filters.incoming)
+async def _batch(bot, message):
+    try:
+        lang_code = await util.getLang(message.chat.id)
+        CHUNK, _ = await util.translate(text="BATCH", lang_code=lang_code)
+        if message.chat.id in BATCH:
+            return await message.reply_text(
+                CHUNK["added"].format(len(BATCH[message.chat.id]["files"])),
+                reply_markup=await keyboard(message.chat.id, CHUNK),
+                quote=True,
+            )
+        BATCH[message.chat.id] = {"files": [], "zip": False}
+        await message.reply_text(
+            CHUNK["start"].format(settings.BATCH_SIZE), quote=True
+        )
+    except Exception as Error:
+        logger.exception("1️⃣: 🐞 %s: %s" % (file_name, Error), exc_info=True)
+
+
+async def collect(bot, message) -> None:
+    """adds a pdf sent in batch mode to the batch [plugins/dm/document.py]"""
+    try:
+        files = BATCH[message.chat.id]["files"]
+        if len(files) >= settings.BATCH_SIZE:
+            return
+        lang_code = await util.getLang(message.chat.id)
+        CHUNK, _ = await util.translate(text="BATCH", lang_code=lang_code)
+
+        # the reply of every file shows the progress of that file later
+        reply = await message.reply_text(
+            CHUNK["added"].format(len(files) + 1),
+            reply_markup=await keyboard(message.chat.id, CHUNK),
+            quote=True,
+        )
+        reply.reply_to_message = message
+        files.append(reply)
+    except Exception as Error:
+        logger.exception("2️⃣: 🐞 %s: %s" % (file_name, Error), exc_info=True)
+
+
+def _unique(name: str, used: set) -> str:
+    """file name not used by an other result of the batch"""
+    fileNm, fileExt = os.path.splitext(name)
+    number = 1
+    while name in used:
+        number += 1
+        name = f"{fileNm} ({number}){fileExt}"
+    used.add(name)
+    return name
+
+
+async def process(bot, callbackQuery, files: list, WORKS: dict, asZip: bool, CHUNK: dict) -> None:
+    """
+    runs the aio options on every file of a batch, the files wait in the global
+    job queue like any other job [settings.CHAT_QUEUE_SIZE at once], so the
+    workers process them in parallel
+
+    parameter:
+        files  : bot replies to the collected pdfs [reply_to_message: the pdf]
+        WORKS  : aio options applied to every file [__aio__.DEFAULT_WORK]
+        asZip  : results in a single zip instead of media groups
+    """
+    cDIR = await work.work(callbackQuery, "create", False)
+    if not cDIR:
+        return await callbackQuery.message.reply_text(CHUNK["inWork"], quote=True)
+    INDEX, _ = await util.translate(
+        text="INDEX", lang_code=await util.getLang(callbackQuery.message.chat.id)
+    )
+    work.BATCHES.add(cDIR)
+    try:
+        os.makedirs(f"{cDIR}/out")
+        status = await callbackQuery.message.reply_text(
+            CHUNK["status"].format(len(files), 0, len(files)), quote=True
+        )
+        done, used, skipped = [0], set(), []
+        # in the order the files were sent [the pdf and its text]
+        results = [[] for _ in files]
+        slots = asyncio.Semaphore(max(1, settings.CHAT_QUEUE_SIZE))
+
+        async def one(part: int, reply) -> None:
+            name = (
+                f"{WORKS['rename']}.pdf"
+                if WORKS["rename"]
+                else reply.reply_to_message.document.file_name
+            )
+            output = f"{cDIR}/out/{_unique(name, used)}"
+            query = Part(
+                part,
+                client=bot,
+                id=f"batch{reply.chat.id}:{reply.id}",
+                from_user=callbackQuery.from_user,
+                chat_instance=str(reply.chat.id),
+                message=reply,
+                data="batch",
+            )
+            async with slots:
+                await runAIO(bot, query, WORKS, collect=output)
+            results[part] = [
+                path
+                for path in (
+                    output, *(f"{os.path.splitext(output)[0]}{ext}" for ext in TEXT)
+                )
+                if os.path.exists(path)
+            ]
+            if query.answered in (
+                INDEX["queueFull"], INDEX["draining"], INDEX["overloaded"]
+            ):
+                skipped.append(reply.reply_to_message.document.file_name)
+            done[0] += 1
+            try:
+                await status.edit(
+                    CHUNK["status"].format(len(files), done[0], len(files))
+                )
+            except Exception:
+                pass
+
+        await asyncio.gather(*(one(part, reply) for part, reply in enumerate(files)))
+
+        processed = sum(1 for outputs in results if outputs)
+        results = [output for outputs in results for output in outputs]
+        if results and asZip:
+            path = await pool.submit(shutil.make_archive, f"{cDIR}/batch", "zip", f"{cDIR}/out")
+            await callbackQuery.message.reply_chat_action(enums.ChatAction.UPLOAD_DOCUMENT)
+            await callbackQuery.message.reply_document(
+                document=path,
+                file_name=f"batch-{processed}.zip",
+                progress=render._progress,
+                progress_args=(status, time.time()),
+                quote=True,
+            )
+        elif results:
+            await callbackQuery.message.reply_chat_action(enums.ChatAction.UPLOAD_DOCUMENT)
+            for i in range(0, len(results), ALBUM):
+                album = [InputMediaDocument(file) for file in results[i : i + ALBUM]]
+                if len(album) == 1:
+                    await callbackQuery.message.reply_document(document=results[i])
+                else:
+                    await bot.send_media_group(callbackQuery.message.chat.id, album)
+        await status.edit(
+            CHUNK["done"].format(processed, len(files))
+            + (CHUNK["skipped"].format("\n".join(skipped)) if skipped else "")
+        )
+
+    except Exception as Error:
+        logger.exception("3️⃣: 🐞 %s: %s" % (file_name, Error), exc_info=True)
+    finally:
+        work.BATCHES.discard(cDIR)
+        await work.work(callbackQuery, "delete", False)
+
+
+@ILovePDF.on_callback_query(filters.regex("^batch"))
+async def _batchCB(bot, callbackQuery):
+    try:
+        chat_id = callbackQuery.message.chat.id
+        lang_code = await util.getLang(chat_id)
+        CHUNK, _ = await util.translate(text="BATCH", lang_code=lang_code)
+        # batch|zip, batch|close, batch|op|operation, batch|run|recipe
+        data = callbackQuery.data.split("|", 2)
+
+        if chat_id not in BATCH:
+            return await callbackQuery.answer(CHUNK["expired"])
+
+        if data[1] == "zip":
+            BATCH[chat_id]["zip"] = not BATCH[chat_id]["zip"]
+            await callbackQuery.answer()
+            return await callbackQuery.message.edit_reply_markup(
+                await keyboard(chat_id, CHUNK)
+            )
+
+        elif data[1] == "close":
+            del BATCH[chat_id]
+            return await util.try_delete_message(callbackQuery.message)
+
+        WORKS = dict(DEFAULT_WORK)
+        if data[1] == "run":
+            # compiled once from the stored options [plugins/utils/recipe.py]
+            WORKS = recipe.compile((await recipe.get(callbackQuery.from_user.id)).get(data[2]))
+            if WORKS is None:
+                return await callbackQuery.answer(CHUNK["expired"])
+        else:
+            WORKS.update(OPERATIONS[data[2]])
+            for option, value in OPERATIONS[data[2]].items():
+                if value is not None:
+                    continue
+                await callbackQuery.answer()
+                input_str = await bot.ask(
+                    text=CHUNK["ask"],
+                    chat_id=callbackQuery.from_user.id,
+                    reply_to_message_id=callbackQuery.message.id,
+                    reply_markup=ForceReply(True, CHUNK["ask"]),
+                )
+                await util.try_delete_message(input_str.reply_to_message)
+                await util.try_delete_message(input_str)
+                if not input_str.text or input_str.text == "/exit":
+                    return
+                WORKS[option] = input_str.text[:50]
+
+        batch = BATCH.pop(chat_id, None)
+        if not batch or not batch["files"]:
+            return
+        await callbackQuery.answer()
+        await process(bot, callbackQuery, batch["files"], WORKS, batch["zip"], CHUNK)
+
+    except Exception as Error:
+        logger.exception("4️⃣: 🐞 %s: %s" % (file_name, Error), exc_info=True)
+
+
+# If you have any questions or suggestions, please feel free to reach out.
+# Together, we can make this project even better, Happy coding!  XD
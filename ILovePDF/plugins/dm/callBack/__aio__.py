@@ -10,10 +10,67 @@ from .file_process import *
 from configs.config import images
 
 
+# every aio option switched off
+DEFAULT_WORK = {
+    "metadata": False,
+    "preview": False,
+    "compress": False,
+    "text": False,
+    "rotate": False,
+    "format": False,
+    "encrypt": False,
+    "watermark": False,
+    "rename": False,
+}
+
+
+def text_file(collect: str, output_file: str) -> str:
+    """where a batch collects the text of a pdf collected at collect"""
+    return f"{os.path.splitext(collect)[0]}{os.path.splitext(output_file)[1]}"
+
+
+def parseAIO(message) -> (dict, str):
+    """
+    reads the aio options of the aio message [its buttons and the text between •]
+
+    return:
+        WORKS      : option → value, False if it is switched off
+        inPassword : password of the input pdf ["None" if it isn't encrypted]
+    """
+    inPassword, outName, watermark, outPassword = message.text.split("•")[1::2]
+    buttons = message.reply_markup.inline_keyboard
+    callback = [
+        element.callback_data
+        for button in buttons
+        for index, element in enumerate(button, start=1)
+        if index % 2 == 0
+    ]
+    all_data = [
+        "{F}" if element.endswith("{F}") else element.split("|")[-1]
+        for element in callback
+    ][:-1]
+
+    WORKS = {
+        "metadata": True if all_data[0] == "{T}" else False,
+        "preview": True if all_data[1] == "{T}" else False,
+        "text": all_data[3] if all_data[3] != "{F}" else False,
+        "rotate": all_data[4] if all_data[4] != "{F}" else False,
+        "format": all_data[5] if all_data[5] != "{F}" else False,
+        "watermark": watermark
+        if all_data[7] != "{F}" and watermark != "None"
+        else False,
+        "compress": True if all_data[2] == "{T}" else False,
+        "encrypt": outPassword
+        if all_data[6] != "{F}" and outPassword != "None"
+        else False,
+        "rename": outName if all_data[8] != "{F}" and outName != "None" else False,
+    }
+    return WORKS, inPassword
+
+
 @ILovePDF.on_callback_query(filters.regex("processAIO"))
 async def __index__(bot, callbackQuery):
     try:
-        data = callbackQuery.data[1:]
         lang_code = await util.getLang(callbackQuery.message.chat.id)
 
         if await render.header(bot, callbackQuery, lang_code=lang_code):
@@ -29,65 +86,76 @@ async def __index__(bot, callbackQuery):
                 "#old_queue 💔\n\n`try by sending new file`", reply_markup=_, quote=True
             )
 
-        inPassword, outName, watermark, outPassword = callbackQuery.message.text.split(
-            "•"
-        )[1::2]
-        buttons = callbackQuery.message.reply_markup.inline_keyboard
-        callback = [
-            element.callback_data
-            for button in buttons
-            for index, element in enumerate(button, start=1)
-            if index % 2 == 0
-        ]
-        all_data = [
-            "{F}" if element.endswith("{F}") else element.split("|")[-1]
-            for element in callback
-        ][:-1]
-
-        WORKS = {
-            "metadata": True if all_data[0] == "{T}" else False,
-            "preview": True if all_data[1] == "{T}" else False,
-            "text": all_data[3] if all_data[3] != "{F}" else False,
-            "rotate": all_data[4] if all_data[4] != "{F}" else False,
-            "format": all_data[5] if all_data[5] != "{F}" else False,
-            "watermark": watermark
-            if all_data[7] != "{F}" and watermark != "None"
-            else False,
-            "compress": True if all_data[2] == "{T}" else False,
-            "encrypt": outPassword
-            if all_data[6] != "{F}" and outPassword != "None"
-            else False,
-            "rename": outName if all_data[8] != "{F}" and outName != "None" else False,
-        }
-        DEFAULT_WORK = {
-            "metadata": False,
-            "preview": False,
-            "compress": False,
-            "text": False,
-            "rotate": False,
-            "format": False,
-            "encrypt": False,
-            "watermark": False,
-            "rename": False,
-        }
-
+        WORKS, inPassword = parseAIO(callbackQuery.message)
         if DEFAULT_WORK == WORKS:
             return await callbackQuery.answer("atleast add one work.. 💔")
 
-        # create a brand new directory to store all of your important user data
-        cDIR = await work.work(callbackQuery, "create", False)
+        await runAIO(bot, callbackQuery, WORKS, inPassword)
+
+    except Exception as Error:
+        logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
+        await work.work(callbackQuery, "delete", False)
+
+
+async def runAIO(
+    bot, callbackQuery, WORKS: dict, inPassword: str = "None", collect: str = None
+) -> None:
+    """
+    downloads the pdf, runs the aio options on it and uploads the result [the same
+    for the aio keyboard, the saved recipes and the batches]
+
+    parameter:
+        bot           : client uploading the result
+        callbackQuery : callback query replying to the pdf message
+        WORKS         : option → value, False if it is switched off [DEFAULT_WORK]
+        inPassword    : password of the input pdf ["None" if it isn't encrypted]
+        collect       : the result is moved here instead of uploading it, the batch
+                        uploads all of them at once [plugins/dm/batch.py], the
+                        extracted text next to it [text_file()]
+    """
+    try:
+        lang_code = await util.getLang(callbackQuery.message.chat.id)
+        CHUNK, _ = await util.translate(
+            text="INDEX", button="INDEX['button']", lang_code=lang_code
+        )
+
+        # waits for a free slot in the global job queue, then creates
+        # a brand new directory to store all of your important user data
+        need = admission.estimate(
+            "aio", callbackQuery.message.reply_to_message.document.file_size
+        )
+        if not admission.possible(need):
+            return await callbackQuery.answer(CHUNK["tooBig"])
+        queue = scheduler.Notify(callbackQuery.message, CHUNK["queued"], CHUNK["busy"])
+        # compression runs ghostscript over the whole file [heavy lane]
+        cDIR = await work.work(
+            callbackQuery, "queue", False, notify=queue,
+            lane="heavy" if WORKS["compress"] else "normal", need=need
+        )
+        await queue.close()
         if not cDIR:
-            return await callbackQuery.answer(CHUNK["inWork"])
-        await callbackQuery.answer(CHUNK["process"])
+            return await callbackQuery.answer(CHUNK[callbackQuery.refused])
+        if not queue.queued:
+            await callbackQuery.answer(CHUNK["process"])
+        if getattr(callbackQuery, "part", None) is not None:
+            # the cancel button of a file of a batch stops that file only
+            for row in _.inline_keyboard:
+                for button in row:
+                    if button.callback_data == "close|me":
+                        button.callback_data = f"close|me|{callbackQuery.part}"
+        # cancellation token and progress channel of the job
+        token = progress.get(await work.work(callbackQuery, "job", False))
 
         dlMSG = await callbackQuery.message.reply_text(
             CHUNK["download"], reply_markup=_, quote=True
         )
 
-        # download the mentioned PDF file with progress updates
-        input_file = await bot.download_media(
-            message=callbackQuery.message.reply_to_message.document.file_id,
-            file_name=f"{cDIR}/inPut.pdf",
+        # download the mentioned PDF file with progress updates [a hard link
+        # if an earlier job downloaded the same pdf, inputs.py]
+        input_file = await inputs.download(
+            bot,
+            callbackQuery.message.reply_to_message.document,
+            f"{cDIR}/inPut.pdf",
             progress=render.progress,
             progress_args=(
                 callbackQuery.message.reply_to_message.document.file_size,
@@ -97,6 +165,7 @@ async def __index__(bot, callbackQuery):
         )
 
         await dlMSG.edit(text=CHUNK["completed"], reply_markup=_)
+        progress.display(token, dlMSG, CHUNK["_process"], _)
 
         # The program checks the size of the file and the file
         # on the server to avoid errors when canceling the download
@@ -106,136 +175,167 @@ async def __index__(bot, callbackQuery):
         ):
             return await work.work(callbackQuery, "delete", False)
 
-        if inPassword != "None":
-            isSuccess, output_file = await decryptPDF.decryptPDF(
-                input_file=input_file, cDIR=cDIR, password=inPassword
+        # metadata, preview and text only read the input, so they run next to the
+        # transforms [an encrypted input is decrypted for them first]
+        password = inPassword if inPassword != "None" else None
+        if password is not None and (WORKS["metadata"] or WORKS["preview"] or WORKS["text"]):
+            isSuccess, output_file = await progress.submit(
+                token,
+                decryptPDF.decryptPDF,
+                input_file=input_file,
+                cDIR=cDIR,
+                password=inPassword,
             )
             if isSuccess:
                 os.remove(input_file)
                 os.rename(output_file, input_file)
+                password = None
             else:
+                await work.work(callbackQuery, "delete", False)
                 return await dlMSG.edit(
                     text=CHUNK["decrypt_error"].format(output_file), reply_markup=_
                 )
 
-        for job, work_info in WORKS.items():
-            await dlMSG.edit(text=CHUNK["aio"].format(job.upper()), reply_markup=_)
+        await dlMSG.edit(
+            text=CHUNK["aio"].format(
+                ", ".join(job.upper() for job, work_info in WORKS.items() if work_info)
+            ),
+            reply_markup=_,
+        )
 
-            work_in_this_loop = False
+        async def transform() -> (bool, str):
+            """decrypt, rotate, format, watermark and encrypt in one pass, then compress"""
+            output_file = input_file
+            if (
+                password is not None
+                or WORKS["rotate"] or WORKS["format"]
+                or WORKS["watermark"] or WORKS["encrypt"]
+            ):
+                isSuccess, output_file = await progress.submit(
+                    token,
+                    aioPDF.aioPDF,
+                    input_file=input_file,
+                    cDIR=cDIR,
+                    password=password,
+                    angle=WORKS["rotate"].lower() if WORKS["rotate"] else None,
+                    layout=WORKS["format"] or None,
+                    watermark=WORKS["watermark"] or None,
+                    # ghostscript can't read an encrypted pdf: encrypted after compressing
+                    encrypt=None if WORKS["compress"] else WORKS["encrypt"] or None,
+                    output_file=f"{cDIR}/stage.pdf" if WORKS["compress"] else None,
+                )
+                if not isSuccess:
+                    return False, output_file
 
-            if job == "metadata" and work_info:
-                isSuccess, output_file = await metadataPDF.metadataPDF(
-                    input_file=input_file, cDIR=cDIR, message=dlMSG
+            if WORKS["compress"]:
+                isSuccess, output_file = await progress.run(
+                    token, compressPDF.compressPDF, input_file=output_file, cDIR=cDIR
                 )
-                await callbackQuery.message.reply_text(output_file, quote=True)
+                if not isSuccess:
+                    return False, output_file
+                if WORKS["encrypt"]:
+                    os.replace(output_file, f"{cDIR}/stage.pdf")
+                    return await progress.submit(
+                        token,
+                        encryptPDF.encryptPDF,
+                        input_file=f"{cDIR}/stage.pdf",
+                        password=WORKS["encrypt"],
+                        cDIR=cDIR,
+                    )
+            return True, output_file
 
-            elif job == "preview" and work_info:
-                isSuccess, output_file = await previewPDF.previewPDF(
+        async def metadata() -> None:
+            isSuccess, output_file = await metadataPDF.metadataPDF(
+                input_file=input_file, cDIR=cDIR, message=dlMSG
+            )
+            await callbackQuery.message.reply_text(output_file, quote=True)
+
+        async def preview() -> None:
+            # own progress slot, the progress message follows the transforms
+            part = token.shard(1)
+            try:
+                await previewPDF.previewPDF(
                     input_file=input_file,
                     cDIR=cDIR,
                     editMessage=dlMSG,
                     cancel=_,
                     callbackQuery=callbackQuery,
+                    token=part,
                 )
-            elif job == "text" and work_info:
-                isSuccess, output_file = await textPDF.textPDF(
+            finally:
+                part.forget()
+
+        async def text() -> None:
+            part = token.shard(2)
+            try:
+                isSuccess, output_file = await progress.submit(
+                    part,
+                    textPDF.textPDF,
                     input_file=input_file,
                     cDIR=cDIR,
                     data=f"text{WORKS['text'][0].upper()}",
                 )
-                await callbackQuery.message.reply_document(
-                    file_name=output_file.split("/")[-1],
-                    quote=True,
-                    document=output_file,
-                    progress=render._progress,
-                    progress_args=(dlMSG, time.time()),
-                )
-
-            elif job == "rotate" and work_info:
-                isSuccess, output_file = await rotatePDF.rotatePDF(
-                    input_file=input_file, angle=all_data[4].lower(), cDIR=cDIR
-                )
-                work_in_this_loop = True
-
-            elif job == "format" and work_info:
-
-                if work_info == "format1":
-                    isSuccess, output_file = await formatPDF.formatPDF(
-                        input_file=input_file, cDIR=cDIR
-                    )
-                    work_in_this_loop = True
-
-                elif work_info == "format2v":
-                    isSuccess, output_file = await twoPagesToOne.twoPagesToOne(
-                        input_file=input_file, cDIR=cDIR
-                    )
-                    work_in_this_loop = True
-
-                elif work_info == "format2h":
-                    isSuccess, output_file = await twoPagesToOneH.twoPagesToOneH(
-                        input_file=input_file, cDIR=cDIR
-                    )
-                    work_in_this_loop = True
-
-                elif work_info == "format3v":
-                    isSuccess, output_file = await threePagesToOne.threePagesToOne(
-                        input_file=input_file, cDIR=cDIR
-                    )
-                    work_in_this_loop = True
-
-                elif work_info == "format3h":
-                    isSuccess, output_file = await threePagesToOneH.threePagesToOneH(
-                        input_file=input_file, cDIR=cDIR
-                    )
-                    work_in_this_loop = True
-
-                elif work_info == "format4":
-                    isSuccess, output_file = await combinePages.combinePages(
-                        input_file=input_file, cDIR=cDIR
-                    )
-                    work_in_this_loop = True
-
-            elif job == "encrypt" and work_info:
-                isSuccess, output_file = await encryptPDF.encryptPDF(
-                    input_file=input_file, password=outPassword, cDIR=cDIR
-                )
-                work_in_this_loop = True
-
-            elif job == "watermark" and work_info:
-                isSuccess, output_file = await watermark45.watermarkPDF(
-                    input_file=input_file, cDIR=cDIR, watermark=watermark
-                )
-                work_in_this_loop = True
+            finally:
+                part.forget()
+            if collect:
+                # a batch collects the text next to the pdf [plugins/dm/batch.py]
+                if isSuccess:
+                    os.replace(output_file, text_file(collect, output_file))
+                return
+            await callbackQuery.message.reply_document(
+                file_name=output_file.split("/")[-1],
+                quote=True,
+                document=output_file,
+            )
 
-            if work_in_this_loop:
-                os.remove(input_file)
-                os.rename(output_file, input_file)
+        independent = [
+            job() for job, work_info in (
+                (metadata, WORKS["metadata"]),
+                (preview, WORKS["preview"]),
+                (text, WORKS["text"]),
+            ) if work_info
+        ]
+        jobs = [asyncio.ensure_future(job) for job in (transform(), *independent)]
+        try:
+            isSuccess, output_file = await jobs[0]
+            if isSuccess:
+                await asyncio.gather(*jobs[1:])
+        finally:
+            # a failed job stops the others, they would only reply to a job
+            # that already failed [the pool work stops with them, progress.py]
+            for job in jobs:
+                job.cancel()
+        if not isSuccess:
+            await work.work(callbackQuery, "delete", False)
+            return await dlMSG.edit(
+                text=CHUNK["error"].format(output_file), reply_markup=_
+            )
 
-        if WORKS["compress"]:
-            output_file = output_file if work_in_this_loop else input_file
-            isSuccess, output_file = await compressPDF.compressPDF(
-                input_file=output_file, cDIR=cDIR
+        # metadata and preview alone have nothing to upload
+        if inPassword == "None" and not any(
+            WORKS[job]
+            for job in ("compress", "text", "rotate", "format", "encrypt", "watermark", "rename")
+        ):
+            await util.try_delete_message(dlMSG)
+            completed = await util.createBUTTON(btn=CHUNK["_completed"])
+            await callbackQuery.message.reply_text(
+                text=CHUNK["finished"], reply_markup=completed, quote=True
             )
-            work_in_this_loop = True
+            return await work.work(callbackQuery, "delete", False)
 
-        if inPassword == "None":
-            for _upload in all_data[2:]:
-                if _upload != "{F}":
-                    break
-            else:
-                await util.try_delete_message(dlMSG)
-                completed = await util.createBUTTON(btn=CHUNK["_completed"])
-                await callbackQuery.message.reply_text(
-                    text=CHUNK["finished"], reply_markup=completed, quote=True
-                )
-                return await work.work(callbackQuery, "delete", False)
+        if collect:
+            # the pdf only if it changed, a text extraction collects the text
+            if output_file != input_file or inPassword != "None" or WORKS["rename"]:
+                os.replace(output_file, collect)
+            await util.try_delete_message(dlMSG)
+            return await work.work(callbackQuery, "delete", False)
 
         # getting thumbnail
         FILE_NAME, FILE_CAPT, THUMBNAIL = await fncta.thumbName(
             callbackQuery.message,
             callbackQuery.message.reply_to_message.document.file_name
-            if all_data[8] == "{F}"
-            else f"{outName}.pdf",
+            if not WORKS["rename"]
+            else f"{WORKS['rename']}.pdf",
         )
         if images.PDF_THUMBNAIL != THUMBNAIL:
             location = await bot.download_media(
@@ -247,7 +347,7 @@ async def __index__(bot, callbackQuery):
         await callbackQuery.message.reply_document(
             file_name=FILE_NAME,
             quote=True,
-            document=output_file if work_in_this_loop else input_file,
+            document=output_file,
             thumb=THUMBNAIL,
             progress=render._progress,
             progress_args=(dlMSG, time.time()),
@@ -260,6 +360,18 @@ async def __index__(bot, callbackQuery):
         )
         await work.work(callbackQuery, "delete", False)
 
+    except progress.Cancelled:
+        # cancelled by the user, the progress message is already deleted
+        await work.work(callbackQuery, "delete", False)
+
+    except watchdog.Timeout as Error:
+        # hung operation, the watchdog already killed or abandoned it
+        await work.work(callbackQuery, "delete", False)
+        try:
+            await dlMSG.edit(text=CHUNK["error"].format(Error))
+        except Exception:
+            pass
+
     except Exception as Error:
         logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
         await work.work(callbackQuery, "delete", False)
@@ -10,6 +10,109 @@ from .file_process import *
 from configs.config import images, settings
 
 
+# latency class of the operations, each class runs in its own lane of the
+# job queue with its own concurrency budget [plugins/utils/scheduler.py]
+# everything else goes to the "normal" lane
+LANES = {
+    "fast": (
+        "rename", "metadata", "rot", "deletePg", "split", "partPDF",
+        "encrypt", "decrypt", "urlRemover", "header", "footer",
+    ),
+    "heavy": ("ocr", "compress", "baw", "sat", "inv", "p2img"),
+}
+
+
+def getLane(data: str) -> str:
+    """returns the lane of an operation [callback data without #]"""
+    for lane, operations in LANES.items():
+        if data.startswith(operations):
+            return lane
+    return "normal"
+
+
+# extension of the results that are no pdf
+EXTENSIONS = {
+    "textT": ".txt",
+    "textH": ".html",
+    "textJ": ".json",
+    "p2img|zip": ".zip",
+    "p2img|tar": ".tar",
+}
+
+
+def asks(data: str) -> bool:
+    """True if the operation asks the user before it runs [password, pages..]"""
+    return (
+        data in ("decrypt", "encrypt", "rename", "header", "footer", "merge", "partPDF")
+        or data.startswith(("split", "deletePg", "wa"))
+        or (data.startswith("p2img") and not data.endswith("A"))
+    )
+
+
+async def cacheKey(callbackQuery, data: str, params: dict) -> str:
+    """key of the result in the cache [None if the operation isn't cached]"""
+    if not cache.enabled(data):
+        return None
+    FILE_NAME, FILE_CAPT, THUMBNAIL = await fncta.thumbName(
+        callbackQuery.message,
+        callbackQuery.message.reply_to_message.document.file_name,
+    )
+    return cache.key(
+        callbackQuery.message.reply_to_message.document.file_unique_id,
+        data,
+        params,
+        FILE_NAME,
+        THUMBNAIL,
+    )
+
+
+async def sendCached(callbackQuery, data: str, key: str, lang_code: str) -> bool:
+    """
+    the same pdf went through the same operation before: sends the result
+    again by its file_id, no download, processing or upload [cache.py]
+
+    return:
+        True if the result was in the cache and got sent
+    """
+    cached = await cache.get(key)
+    if cached is None:
+        return False
+    try:
+        FILE_NAME, FILE_CAPT, THUMBNAIL = await fncta.thumbName(
+            callbackQuery.message,
+            callbackQuery.message.reply_to_message.document.file_name,
+        )
+        _caption = await caption.caption(
+            data=data,
+            lang_code=lang_code,
+            args=cached["result"] if data == "compress" else None,
+        )
+        if data.startswith(tuple(["text", "p2img"])):
+            FILE_NAME = FILE_NAME[:-4] + EXTENSIONS[
+                data[:-1] if data.startswith("p2img") else data
+            ]
+        _COFFEE, COFFEE = await util.translate(
+            button="feedbackMsg['button']", lang_code=lang_code
+        )
+        await callbackQuery.message.reply_chat_action(enums.ChatAction.UPLOAD_DOCUMENT)
+        await callbackQuery.message.reply_document(
+            file_name=FILE_NAME
+            if os.path.splitext(FILE_NAME)[1]
+            else f"{FILE_NAME}.pdf",
+            quote=True,
+            reply_markup=COFFEE,
+            document=cached["file_id"],
+            thumb=THUMBNAIL,
+            caption=f"{_caption}\n\n{FILE_CAPT}",
+        )
+        return True
+    except Exception as Error:
+        logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
+        # the file_id didn't work anymore, the job processes it again
+        await cache.drop(key)
+        return False
+
+
 index = filters.create(lambda _, __, query: query.data.startswith("#"))
 @ILovePDF.on_callback_query(index)
 async def __index__(bot, callbackQuery):
@@ -24,6 +127,21 @@ async def __index__(bot, callbackQuery):
             text="INDEX", button="INDEX['button']", lang_code=lang_code
         )
 
+        # pdfs seen before are known by the catalog: page count, encryption and
+        # metadata without a download, big ones are read from a few ranges of
+        # the file [plugins/utils/catalog.py, ranged.py]
+        document = getattr(callbackQuery.message.reply_to_message, "document", None)
+        if document and "•" not in callbackQuery.message.text:
+            entry = await catalog.get(document.file_unique_id)
+            if entry is None and document.file_size >= settings.INSPECT_SIZE * 1024 * 1024:
+                entry = await catalog.inspect(bot, callbackQuery.message.reply_to_message)
+            if entry is not None:
+                checked, _pages = await render.checkPdf(
+                    None, callbackQuery, lang_code, entry=entry
+                )
+                if data == "metadata" or (checked == "encrypted" and data != "decrypt"):
+                    return await callbackQuery.answer()
+
         if data == "metadata" and "•" in callbackQuery.message.text:
             return await callbackQuery.answer(CHUNK["readAgain"])
         elif (not callbackQuery.message.reply_to_message) or not getattr(callbackQuery.message.reply_to_message, "document", None):
@@ -38,16 +156,17 @@ async def __index__(bot, callbackQuery):
             # Therefore, returning a useless callback answer
             return await callbackQuery.answer(CHUNK["rot360"])
 
-        elif data in ["ocr"] and "•" in callbackQuery.message.text:
-            number_of_pages = callbackQuery.message.text.split("•")[1]
-            if int(number_of_pages) >= 5:
-                return await callbackQuery.answer(CHUNK["largeNo"])
-
         elif data == "ocr":
             if ocrPDF.nabilanavab:  # Never Work OCR if nabilanavab==True
                 return await callbackQuery.answer(
                     CHUNK["ocrError"]
                 )  # Deploy From Docker Files (else OCR never works)
+            if "•" in callbackQuery.message.text:
+                number_of_pages = callbackQuery.message.text.split("•")[1]
+                if int(number_of_pages) > settings.OCR_PAGES:
+                    return await callbackQuery.answer(
+                        CHUNK["largeNo"].format(settings.OCR_PAGES)
+                    )
 
         elif (
             data == "decrypt"
@@ -56,11 +175,38 @@ async def __index__(bot, callbackQuery):
         ):
             return await callbackQuery.answer(CHUNK["notEncrypt"])
 
-        # create a brand new directory to store all of your important user data
-        cDIR = await work.work(callbackQuery, "create", False)
+        # a result sent before goes out right away, without waiting in the job
+        # queue [the answers of the questions are part of the key: runJob]
+        if not asks(data):
+            key = await cacheKey(callbackQuery, data, {})
+            if key and await sendCached(callbackQuery, data, key, lang_code):
+                return await callbackQuery.answer()
+
+        # memory and disk the job needs, never admitted if the server is too small
+        need = admission.estimate(
+            data,
+            callbackQuery.message.reply_to_message.document.file_size,
+            int(callbackQuery.message.text.split("•")[1])
+            if "•" in callbackQuery.message.text
+            else 0,
+        )
+        if not admission.possible(need):
+            return await callbackQuery.answer(CHUNK["tooBig"])
+
+        # waits for a free slot in the global job queue, then creates
+        # a brand new directory to store all of your important user data
+        queue = scheduler.Notify(callbackQuery.message, CHUNK["queued"], CHUNK["busy"])
+        cDIR = await work.work(
+            callbackQuery, "queue", False, notify=queue, lane=getLane(data), need=need
+        )
+        await queue.close()
         if not cDIR:
-            return await callbackQuery.answer(CHUNK["inWork"])
-        await callbackQuery.answer(CHUNK["process"])
+            return await callbackQuery.answer(CHUNK[callbackQuery.refused])
+        if not queue.queued:
+            await callbackQuery.answer(CHUNK["process"])
+
+        # answers of the user, everything the job needs besides the pdf
+        params = {}
 
         # Asks password for encryption, decryption
         if data in ["decrypt", "encrypt"]:
@@ -73,6 +219,7 @@ async def __index__(bot, callbackQuery):
             if not notExit:
                 await work.work(callbackQuery, "delete", False)
                 return await password.reply(CHUNK["exit"], quote=True)
+            params["password"] = password.text
         elif data == "rename":
             notExit, newName = await renamePDF.askName(
                 bot, callbackQuery, question=CHUNK["pyromodASK_2"]
@@ -81,6 +228,7 @@ async def __index__(bot, callbackQuery):
             if not notExit:
                 await work.work(callbackQuery, "delete", False)
                 return await newName.reply(CHUNK["exit"], quote=True)
+            params["newName"] = newName if isinstance(newName, str) else newName.text
         elif data in ["header", "footer"]:
             notExit, hfData = await pdfHeader.askText(
                 bot, callbackQuery, question=CHUNK["pyromodASK_2"]
@@ -89,6 +237,7 @@ async def __index__(bot, callbackQuery):
             if not notExit:
                 await work.work(callbackQuery, "delete", False)
                 return await hfData.reply(CHUNK["exit"], quote=True)
+            params["text"] = hfData.text
         elif data == "merge":
             notExit, mergeId = await mergePDF.askPDF(
                 bot,
@@ -100,6 +249,7 @@ async def __index__(bot, callbackQuery):
             if not notExit:
                 await work.work(callbackQuery, "delete", False)
                 return await mergeId.reply(CHUNK["exit"], quote=True)
+            params["mergeId"] = mergeId
         # ends with a means all pages.. so no questions
         elif (data.startswith("p2img") and not data.endswith("A")) or data.startswith(
             tuple(["split", "deletePg"])
@@ -122,6 +272,7 @@ async def __index__(bot, callbackQuery):
                     ),
                     quote=True,
                 )
+            params["imageList"] = imageList
         elif data.startswith("wa"):
             if data.startswith("wa|txt"):
                 question = CHUNK["watermark_txt"]
@@ -136,6 +287,7 @@ async def __index__(bot, callbackQuery):
             if not notExit:
                 await work.work(callbackQuery, "delete", False)
                 return await watermark.reply(CHUNK["exit"], quote=True)
+            params["watermark"] = watermark
         elif data == "partPDF":
             notExit, splitData = await partPDF.askPartPdf(
                 bot, callbackQuery, question=CHUNK["askImage"],
@@ -154,15 +306,64 @@ async def __index__(bot, callbackQuery):
                     ),
                     quote=True,
                 )
+            params["part"] = splitData.text
+
+        # the questions are not asked again if the job is resumed after a
+        # restart [merge keeps the sizes of the files in memory]
+        if not data.startswith(jobqueue.LOCAL):
+            drain.track(callbackQuery, params)
+
+        if jobqueue.remote(data, params):
+            # front role: a worker process downloads, processes and uploads it
+            await jobqueue.push(
+                callbackQuery, cDIR, data, params, lane=getLane(data),
+                notify=scheduler.Notify(callbackQuery.message, CHUNK["queued"]),
+            )
+            return await work.work(callbackQuery, "delete", False)
+
+        await runJob(bot, callbackQuery, data, params, cDIR)
+
+    except Exception as Error:
+        logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
+        await work.work(callbackQuery, "delete", False)
+
+
+async def runJob(bot, callbackQuery, data: str, params: dict, cDIR: str) -> None:
+    """
+    downloads the pdf, processes it and uploads the result [the same for
+    jobs of this process and jobs claimed by a worker, plugins/utils/jobqueue.py]
+
+    parameter:
+        bot           : client uploading the result
+        callbackQuery : callback query of the job [rebuilt by the workers]
+        data          : operation [callback data without #]
+        params        : answers of the user [password, newName, imageList..]
+        cDIR          : work directory holding a slot in the job queue
+    """
+    try:
+        lang_code = await util.getLang(callbackQuery.message.chat.id)
+        CHUNK, _ = await util.translate(
+            text="INDEX", button="INDEX['button']", lang_code=lang_code
+        )
+        # cancellation token and progress channel of the job
+        token = progress.get(await work.work(callbackQuery, "job", False))
+
+        # key of the result cache [plugins/utils/cache.py], the jobs asking the
+        # user something are looked up once answered [the others: __index__]
+        key = await cacheKey(callbackQuery, data, params)
+        if key and params and await sendCached(callbackQuery, data, key, lang_code):
+            return await work.work(callbackQuery, "delete", False)
 
         dlMSG = await callbackQuery.message.reply_text(
             CHUNK["download"], reply_markup=_, quote=True
         )
 
-        # download the mentioned PDF file with progress updates
-        input_file = await bot.download_media(
-            message=callbackQuery.message.reply_to_message.document.file_id,
-            file_name=f"{cDIR}/inPut.pdf",
+        # download the mentioned PDF file with progress updates [a hard link
+        # if an earlier job downloaded the same pdf, inputs.py]
+        input_file = await inputs.download(
+            bot,
+            callbackQuery.message.reply_to_message.document,
+            f"{cDIR}/inPut.pdf",
             progress=render.progress,
             progress_args=(
                 callbackQuery.message.reply_to_message.document.file_size,
@@ -172,6 +373,7 @@ async def __index__(bot, callbackQuery):
         )
 
         await dlMSG.edit(text=CHUNK["completed"], reply_markup=_)
+        progress.display(token, dlMSG, CHUNK["_process"], _)
 
         # The program checks the size of the file and the file
         # on the server to avoid errors when canceling the download
@@ -186,13 +388,22 @@ async def __index__(bot, callbackQuery):
         # If not, the program prompts the user to add metadata to the file.
         if "•" not in callbackQuery.message.text:
             checked, number_of_pages = await render.checkPdf(
-                input_file, callbackQuery, lang_code
+                input_file,
+                callbackQuery,
+                lang_code,
+                file_unique_id=callbackQuery.message.reply_to_message.document.file_unique_id,
             )
             if data == "decrypt" and checked != "encrypted":
                 await work.work(callbackQuery, "delete", False)
                 return await dlMSG.edit(CHUNK["notEncrypt"])
         else:
             number_of_pages = int(callbackQuery.message.text.split("•")[1])
+            # pages known from a few ranges of the file get the full
+            # fingerprint now that it is downloaded [catalog.inspect]
+            await catalog.refresh(
+                input_file,
+                callbackQuery.message.reply_to_message.document.file_unique_id,
+            )
 
         if data == "metadata":
             # After the metadata has been added, remove the progress message safely
@@ -205,93 +416,130 @@ async def __index__(bot, callbackQuery):
             isSuccess, output_file = await renamePDF.renamePDF(input_file=input_file)
 
         elif data == "partPDF":
-            isSuccess, output_file = await partPDF.partPDF(
-                input_file=input_file, cDIR=cDIR, part=splitData.text
+            isSuccess, output_file = await progress.submit(
+                token,
+                partPDF.partPDF,
+                input_file=input_file,
+                cDIR=cDIR,
+                part=params["part"],
             )
 
         elif data == "header":
-            isSuccess, output_file = await pdfHeader.pdfHeader(
-                input_file=input_file, cDIR=cDIR, text=hfData.text
+            isSuccess, output_file = await progress.submit(
+                token,
+                pdfHeader.pdfHeader,
+                input_file=input_file,
+                cDIR=cDIR,
+                text=params["text"],
             )
 
         elif data == "footer":
-            isSuccess, output_file = await pdfFooter.pdfFooter(
-                input_file=input_file, cDIR=cDIR, text=hfData.text
+            isSuccess, output_file = await progress.submit(
+                token,
+                pdfFooter.pdfFooter,
+                input_file=input_file,
+                cDIR=cDIR,
+                text=params["text"],
             )
 
         elif data == "ocr":
-            isSuccess, output_file = await ocrPDF.ocrPDF(
-                input_file=input_file,  cDIR=cDIR
+            isSuccess, output_file = await progress.run(
+                token, ocrPDF.ocrPDF, input_file=input_file, cDIR=cDIR
             )
 
         elif data == "baw":
-            isSuccess, output_file = await blackAndWhitePdf.blackAndWhitePdf(
-                cDIR=cDIR, input_file=input_file
+            # spreads its pages over the pool itself [rasterPDF.py]
+            isSuccess, output_file = await progress.run(
+                token,
+                blackAndWhitePdf.blackAndWhitePdf,
+                cDIR=cDIR,
+                input_file=input_file,
             )
 
         elif data == "urlRemover":
-            isSuccess, output_file = await urlRemover.urlRemover(
-                cDIR=cDIR, input_file=input_file
+            isSuccess, output_file = await progress.submit(
+                token, urlRemover.urlRemover, cDIR=cDIR, input_file=input_file
             )
 
         elif data == "sat":
-            isSuccess, output_file = await saturatePDF.saturatePDF(
-                cDIR=cDIR, input_file=input_file
+            isSuccess, output_file = await progress.run(
+                token, saturatePDF.saturatePDF, cDIR=cDIR, input_file=input_file
+            )
+
+        elif data == "gray":
+            # vector grayscale, rendered pages only if it can't [grayPDF.py]
+            isSuccess, output_file = await progress.run(
+                token, grayPDF.grayPDF, cDIR=cDIR, input_file=input_file
             )
 
         elif data == "1-format":
-            isSuccess, output_file = await formatPDF.formatPDF(
-                cDIR=cDIR, input_file=input_file
+            isSuccess, output_file = await progress.submit(
+                token, formatPDF.formatPDF, cDIR=cDIR, input_file=input_file
             )
 
         elif data == "2-format-V":
-            isSuccess, output_file = await twoPagesToOne.twoPagesToOne(
-                cDIR=cDIR, input_file=input_file
+            isSuccess, output_file = await progress.submit(
+                token, twoPagesToOne.twoPagesToOne, cDIR=cDIR, input_file=input_file
             )
 
         elif data == "2-format-H":
-            isSuccess, output_file = await twoPagesToOneH.twoPagesToOneH(
-                cDIR=cDIR, input_file=input_file
+            isSuccess, output_file = await progress.submit(
+                token, twoPagesToOneH.twoPagesToOneH, cDIR=cDIR, input_file=input_file
             )
 
         elif data == "3-format-V":
-            isSuccess, output_file = await threePagesToOne.threePagesToOne(
-                cDIR=cDIR, input_file=input_file
+            isSuccess, output_file = await progress.submit(
+                token, threePagesToOne.threePagesToOne, cDIR=cDIR, input_file=input_file
             )
 
         elif data == "3-format-H":
-            isSuccess, output_file = await threePagesToOneH.threePagesToOneH(
-                cDIR=cDIR, input_file=input_file
+            isSuccess, output_file = await progress.submit(
+                token,
+                threePagesToOneH.threePagesToOneH,
+                cDIR=cDIR,
+                input_file=input_file,
             )
 
         elif data == "4-format":
-            isSuccess, output_file = await combinePages.combinePages(
-                cDIR=cDIR, input_file=input_file
+            isSuccess, output_file = await progress.submit(
+                token, combinePages.combinePages, cDIR=cDIR, input_file=input_file
             )
 
         elif data == "draw":
-            isSuccess, output_file = await drawPDF.drawPDF(
-                cDIR=cDIR, input_file=input_file
+            isSuccess, output_file = await progress.submit(
+                token, drawPDF.drawPDF, cDIR=cDIR, input_file=input_file
             )
 
         elif data == "zoom":
-            isSuccess, output_file = await zoomPDF.zoomPDF(
-                cDIR=cDIR, input_file=input_file
+            isSuccess, output_file = await progress.submit(
+                token, zoomPDF.zoomPDF, cDIR=cDIR, input_file=input_file
             )
 
         elif data == "encrypt":
-            isSuccess, output_file = await encryptPDF.encryptPDF(
-                cDIR=cDIR, input_file=input_file, password=password.text
+            isSuccess, output_file = await progress.submit(
+                token,
+                encryptPDF.encryptPDF,
+                cDIR=cDIR,
+                input_file=input_file,
+                password=params["password"],
             )
 
         elif data == "decrypt":
-            isSuccess, output_file = await decryptPDF.decryptPDF(
-                cDIR=cDIR, input_file=input_file, password=password.text
+            isSuccess, output_file = await progress.submit(
+                token,
+                decryptPDF.decryptPDF,
+                cDIR=cDIR,
+                input_file=input_file,
+                password=params["password"],
             )
 
         elif data == "compress":
-            isSuccess, output_file = await compressPDF.compressPDF(
-                cDIR=cDIR, input_file=input_file, returnRatio=True
+            isSuccess, output_file = await progress.run(
+                token,
+                compressPDF.compressPDF,
+                cDIR=cDIR,
+                input_file=input_file,
+                returnRatio=True,
             )
 
         elif data == "preview":
@@ -301,16 +549,25 @@ async def __index__(bot, callbackQuery):
                 cancel=_,
                 editMessage=dlMSG,
                 callbackQuery=callbackQuery,
+                token=token,
             )
 
         elif data == "split":
-            isSuccess, output_file = await splitPDF.splitPDF(
-                cDIR=cDIR, input_file=input_file, imageList=imageList
+            isSuccess, output_file = await progress.submit(
+                token,
+                splitPDF.splitPDF,
+                cDIR=cDIR,
+                input_file=input_file,
+                imageList=params["imageList"],
             )
 
         elif data == "deletePg":
-            isSuccess, output_file = await deletePDFPg.deletePDFPg(
-                cDIR=cDIR, input_file=input_file, imageList=imageList
+            isSuccess, output_file = await progress.submit(
+                token,
+                deletePDFPg.deletePDFPg,
+                cDIR=cDIR,
+                input_file=input_file,
+                imageList=params["imageList"],
             )
 
         elif data == "merge":
@@ -318,10 +575,11 @@ async def __index__(bot, callbackQuery):
                 cDIR=cDIR,
                 input_file=input_file,
                 text=CHUNK,
-                mergeId=mergeId,
+                mergeId=params["mergeId"],
                 bot=bot,
                 dlMSG=dlMSG,
                 callbackQuery=callbackQuery,
+                token=token,
             )
 
         elif data == "textM":
@@ -331,21 +589,22 @@ async def __index__(bot, callbackQuery):
                 text=CHUNK,
                 callbackQuery=callbackQuery,
                 dlMSG=dlMSG,
+                token=token,
             )
 
         elif data == "inv":
-            isSuccess, output_file = await invertPDF.invertPDF(
-                cDIR=cDIR, input_file=input_file
+            isSuccess, output_file = await progress.run(
+                token, invertPDF.invertPDF, cDIR=cDIR, input_file=input_file
             )
 
         elif data.startswith("rot"):
-            isSuccess, output_file = await rotatePDF.rotatePDF(
-                cDIR=cDIR, input_file=input_file, angle=data
+            isSuccess, output_file = await progress.submit(
+                token, rotatePDF.rotatePDF, cDIR=cDIR, input_file=input_file, angle=data
             )
 
         elif data.startswith("text") and data != "textM":
-            isSuccess, output_file = await textPDF.textPDF(
-                cDIR=cDIR, input_file=input_file, data=data
+            isSuccess, output_file = await progress.submit(
+                token, textPDF.textPDF, cDIR=cDIR, input_file=input_file, data=data
             )
 
         elif data.startswith(tuple(["p2img|I", "p2img|D"])):
@@ -355,7 +614,8 @@ async def __index__(bot, callbackQuery):
                 text=CHUNK,
                 callbackQuery=callbackQuery,
                 dlMSG=dlMSG,
-                imageList=imageList if not data.endswith("A") else "all",
+                imageList=params.get("imageList") if not data.endswith("A") else "all",
+                token=token,
             )
 
         elif data.startswith(tuple(["p2img|zip", "p2img|tar"])):
@@ -365,7 +625,8 @@ async def __index__(bot, callbackQuery):
                 text=CHUNK,
                 callbackQuery=callbackQuery,
                 dlMSG=dlMSG,
-                imageList=imageList if not data.endswith("A") else "all",
+                imageList=params.get("imageList") if not data.endswith("A") else "all",
+                token=token,
             )
 
         elif data.startswith("wa"):
@@ -373,13 +634,14 @@ async def __index__(bot, callbackQuery):
                 cDIR=cDIR,
                 input_file=input_file,
                 callbackQuery=callbackQuery,
-                watermark=watermark,
+                watermark=params["watermark"],
                 text=CHUNK["adding_wa"],
+                token=token,
             )
 
         elif data.startswith("spP"):
-            isSuccess, output_file = await stampPDF.stampPDF(
-                cDIR=cDIR, input_file=input_file, data=data
+            isSuccess, output_file = await progress.submit(
+                token, stampPDF.stampPDF, cDIR=cDIR, input_file=input_file, data=data
             )
 
         if isSuccess == "finished":
@@ -402,7 +664,7 @@ async def __index__(bot, callbackQuery):
             callbackQuery.message,
             callbackQuery.message.reply_to_message.document.file_name
             if data != "rename"
-            else (newName if isinstance(newName, str) else newName.text),
+            else params["newName"],
         )
         if images.PDF_THUMBNAIL != THUMBNAIL:
             location = await bot.download_media(
@@ -412,11 +674,11 @@ async def __index__(bot, callbackQuery):
 
         # caption for "encrypt", "rename"
         if data == "encrypt":
-            arg = [number_of_pages, password.text]
+            arg = [number_of_pages, params["password"]]
         elif data == "rename":
             arg = [
                 callbackQuery.message.reply_to_message.document.file_name,
-                newName if isinstance(newName, str) else newName.text,
+                params["newName"],
             ]
         elif data == "compress":
             arg = isSuccess
@@ -432,14 +694,7 @@ async def __index__(bot, callbackQuery):
         if data.startswith(tuple(["text", "p2img"])):
             if data.startswith("p2img"):
                 data = data[:-1]
-            ext = {
-                "textT": ".txt",
-                "textH": ".html",
-                "textJ": ".json",
-                "p2img|zip": ".zip",
-                "p2img|tar": ".tar",
-            }
-            FILE_NAME = FILE_NAME[:-4] + ext[data]
+            FILE_NAME = FILE_NAME[:-4] + EXTENSIONS[data]
 
         await callbackQuery.message.reply_chat_action(enums.ChatAction.UPLOAD_DOCUMENT)
 
@@ -465,7 +720,7 @@ async def __index__(bot, callbackQuery):
             await dlMSG.edit("👇")
             await callbackQuery.message.reply_text("👆", quote=True)
         else:
-            await callbackQuery.message.reply_document(
+            sent = await callbackQuery.message.reply_document(
                 file_name=FILE_NAME
                 if os.path.splitext(FILE_NAME)[1]
                 else f"{FILE_NAME}.pdf",
@@ -478,8 +733,22 @@ async def __index__(bot, callbackQuery):
                 progress_args=(dlMSG, time.time()),
             )
             await util.try_delete_message(dlMSG)
+            if key and sent and sent.document:
+                await cache.save(key, sent.document.file_id, isSuccess)
         await work.work(callbackQuery, "delete", False)
 
+    except progress.Cancelled:
+        # cancelled by the user, the progress message is already updated
+        await work.work(callbackQuery, "delete", False)
+
+    except watchdog.Timeout as Error:
+        # hung operation, the watchdog already killed or abandoned it
+        await work.work(callbackQuery, "delete", False)
+        try:
+            await dlMSG.edit(text=CHUNK["error"].format(Error))
+        except Exception:
+            pass
+
     except Exception as Error:
         logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
         await work.work(callbackQuery, "delete", False)
@@ -0,0 +1,143 @@
+# This module is part of https://github.com/nabilanavab/ilovepdf
+# Feel free to use and contribute to this project. Your contributions are welcome!
+# copyright ©️ 2021 nabilanavab
+
+file_name = "ILovePDF/plugins/dm/callBack/__recipe__.py"
+
+from plugins import *
+from plugins.utils import *
+from configs.db import dataBASE
+from .__aio__ import parseAIO, runAIO
+from pyrogram.types import ForceReply
+from pyrogram.types import InlineKeyboardMarkup, InlineKeyboardButton
+
+
+async def recipeList(user_id: int, CHUNK: dict) -> (str, InlineKeyboardMarkup):
+    """
+    text and keyboard of /recipes: ⭐ applies a recipe to every pdf, 🗑 deletes it
+
+    return:
+        text, keyboard [None if the user has no recipes]
+    """
+    recipes = await recipe.get(user_id)
+    if not recipes:
+        return CHUNK["empty"], None
+    default = await recipe.default(user_id)
+
+    lines, rows = [], []
+    for name, works in recipes.items():
+        star = "⭐" if name == default else "☆"
+        lines.append(
+            f"{star} `{name}` : __{', '.join(job.upper() for job in works)}__"
+        )
+        rows.append(
+            [
+                InlineKeyboardButton(f"{star} {name}", f"recipe|def|{name}"),
+                InlineKeyboardButton("🗑", f"recipe|del|{name}"),
+            ]
+        )
+    rows.append([InlineKeyboardButton(CHUNK["close"], "close|mee")])
+    return CHUNK["list"].format("\n".join(lines)), InlineKeyboardMarkup(rows)
+
+
+@ILovePDF.on_callback_query(filters.regex("^recipe"))
+async def __index__(bot, callbackQuery):
+    try:
+        lang_code = await util.getLang(callbackQuery.message.chat.id)
+        # recipe|save, recipe|run|name, recipe|def|name, recipe|del|name
+        data = callbackQuery.data.split("|", 2)
+        action, name = data[1], data[2] if len(data) == 3 else None
+
+        if await render.header(
+            bot, callbackQuery, lang_code=lang_code, doc=action in ("save", "run")
+        ):
+            return
+
+        CHUNK, _ = await util.translate(text="RECIPE", lang_code=lang_code)
+        if not dataBASE.MONGODB_URI:
+            return await callbackQuery.answer(CHUNK["noDB"])
+        user_id = callbackQuery.from_user.id
+
+        if action == "save":
+            # options of the aio keyboard, the password of the input is per file
+            works = recipe.fromWorks(parseAIO(callbackQuery.message)[0])
+            if not works:
+                return await callbackQuery.answer("atleast add one work.. 💔")
+            await callbackQuery.answer()
+
+            input_str = await bot.ask(
+                text=CHUNK["ask"],
+                chat_id=user_id,
+                reply_to_message_id=callbackQuery.message.id,
+                reply_markup=ForceReply(True, CHUNK["ask"]),
+            )
+            await util.try_delete_message(input_str.reply_to_message)
+            await util.try_delete_message(input_str)
+            name = (input_str.text or "").strip()
+            if name == "/exit":
+                return
+            if not recipe.validName(name):
+                return await callbackQuery.message.reply_text(
+                    CHUNK["badName"].format(recipe.NAME), quote=True
+                )
+            if not await recipe.save(user_id, name, works):
+                return await callbackQuery.message.reply_text(
+                    CHUNK["full"].format(recipe.MAX), quote=True
+                )
+            return await callbackQuery.message.reply_text(
+                CHUNK["saved"].format(name, name), quote=True
+            )
+
+        elif action == "run":
+            if not getattr(callbackQuery.message.reply_to_message, "document", None):
+                return await callbackQuery.answer(CHUNK["noPDF"])
+            # compiled once from the stored options, the message text isn't read
+            WORKS = recipe.compile((await recipe.get(user_id)).get(name))
+            if WORKS is None:
+                return await callbackQuery.answer(CHUNK["gone"])
+            return await runAIO(bot, callbackQuery, WORKS)
+
+        elif action == "def":
+            default = await recipe.default(user_id)
+            await recipe.setDefault(user_id, None if default == name else name)
+
+        elif action == "del":
+            await recipe.delete(user_id, name)
+
+        await callbackQuery.answer()
+        text, markup = await recipeList(user_id, CHUNK)
+        await callbackQuery.message.edit(text=text, reply_markup=markup)
+
+    except Exception as Error:
+        logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
+
+
+async def apply(bot, message, pdfMsg) -> None:
+    """
+    applies the default recipe of the user to a new pdf [plugins/dm/document.py]
+
+    parameter:
+        message : the pdf sent by the user
+        pdfMsg  : reply of the bot with the pdf keyboard
+    """
+    try:
+        name = await recipe.default(message.from_user.id)
+        if not name:
+            return
+        pdfMsg.reply_to_message = message
+        callbackQuery = drain.Replay(
+            client=bot,
+            id=f"recipe{message.chat.id}:{message.id}",
+            from_user=message.from_user,
+            chat_instance=str(message.chat.id),
+            message=pdfMsg,
+            data=f"recipe|run|{name}",
+        )
+        await __index__(bot, callbackQuery)
+
+    except Exception as Error:
+        logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
+
+
+# If you have any questions or suggestions, please feel free to reach out.
+# Together, we can make this project even better, Happy coding!  XD
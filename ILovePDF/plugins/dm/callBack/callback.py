@@ -7,7 +7,7 @@ file_name = "ILovePDF/plugins/dm/callBack/callback.py"
 from plugins import *
 from lang import langList
 from plugins.utils import *
-from configs.db import myID
+from configs.db import myID, dataBASE
 from datetime import datetime
 from pyrogram.types import ForceReply
 from pyrogram.types import InlineKeyboardMarkup, InlineKeyboardButton
@@ -245,6 +245,11 @@ async def _aio(bot, callbackQuery):
                     aio_list_btn.append(btn)
                     break
                 aio_list_btn.append(btn)
+            if dataBASE.MONGODB_URI:
+                # one button row, so it isn't read as an aio option [parseAIO]
+                aio_list_btn.append(
+                    [InlineKeyboardButton(key, value) for key, value in tTXT["save"].items()]
+                )
             return await callbackQuery.message.edit(
                 text=tTXT["passMSG"].format(
                     callbackQuery.message.reply_to_message.document.file_name,  # password 300 char limit
@@ -364,6 +369,10 @@ async def _aio(bot, callbackQuery):
                 aio_list_btn.append(btn)
                 break
             aio_list_btn.append(btn)
+        if dataBASE.MONGODB_URI:
+            aio_list_btn.append(
+                [InlineKeyboardButton(key, value) for key, value in tTXT["save"].items()]
+            )
 
         if (
             data1 not in ["enc", "rnm", "wat"]
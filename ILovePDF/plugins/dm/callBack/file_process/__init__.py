@@ -56,6 +56,10 @@ __all__ = [
     "pdfHeader",
     "partPDF",
     "urlRemover",
+    "aioPDF",
+    "rasterPDF",
+    "grayPDF",
+    "renderPages",
 ]
 
 
@@ -0,0 +1,94 @@
+# This module is part of https://github.com/nabilanavab/ilovepdf
+# Feel free to use and contribute to this project. Your contributions are welcome!
+# copyright ©️ 2021 nabilanavab
+
+file_name = "ILovePDF/plugins/dm/callBack/file_process/aioPDF.py"
+
+import fitz
+from logger import logger
+from plugins.utils import progress
+from . import (
+    rotatePDF,
+    formatPDF,
+    encryptPDF,
+    watermark45,
+    combinePages,
+    twoPagesToOne,
+    twoPagesToOneH,
+    threePagesToOne,
+    threePagesToOneH,
+)
+
+# aio format option → module placing the pages on new a4 pages
+LAYOUTS = {
+    "format1": formatPDF,
+    "format2v": twoPagesToOne,
+    "format2h": twoPagesToOneH,
+    "format3v": threePagesToOne,
+    "format3h": threePagesToOneH,
+    "format4": combinePages,
+}
+
+
+async def aioPDF(
+    input_file: str,
+    cDIR: str,
+    password: str = None,
+    angle: str = None,
+    layout: str = None,
+    watermark: str = None,
+    encrypt: str = None,
+    output_file: str = None,
+    token: progress.Token = progress.Token(),
+) -> (bool, str):
+    """
+    All In One transforms on a single in-memory document: the pdf is parsed once,
+    decrypted, rotated, formatted and watermarked in place and serialised once,
+    encrypted while it is saved
+
+    parameter:
+        input_file  : Here is the path of the file that the user entered
+        cDIR        : This is the location of the directory that belongs to the specific user.
+        password    : Password of an encrypted input [None if it isn't]
+        angle       : Rotation of the pages [rot90, rot180, rot270]
+        layout      : Page layout, a key of LAYOUTS
+        watermark   : Text written across every page
+        encrypt     : Password of the output [None: not encrypted]
+        output_file : Where the result is saved [cDIR/outPut.pdf by default]
+        token       : Reports finished pages, stops the job when the user cancels it
+
+    return:
+        bool        : Return True when the request is successful
+        output_path : This is the path where the output file can be found.
+    """
+    try:
+        output_path = output_file or f"{cDIR}/outPut.pdf"
+        with fitz.open(input_file) as iNPUT:
+            if password is not None and not iNPUT.authenticate(f"{password}"):
+                return False, "wrong password"
+
+            if angle:
+                rotatePDF.rotate(iNPUT, angle, token)
+
+            # formats build a new document from the pages of the input
+            oUTPUT = LAYOUTS[layout].layout(iNPUT, token) if layout in LAYOUTS else iNPUT
+            try:
+                if watermark:
+                    watermark45.add_watermark(oUTPUT, watermark, token)
+                oUTPUT.save(
+                    output_path,
+                    garbage=3,
+                    deflate=True,
+                    **(encryptPDF.encryption(encrypt) if encrypt else {}),
+                )
+            finally:
+                if oUTPUT is not iNPUT:
+                    oUTPUT.close()
+        return True, output_path
+
+    except Exception as Error:
+        logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
+        return False, Error
+
+# If you have any questions or suggestions, please feel free to reach out.
+# Together, we can make this project even better, Happy coding!  XD
@@ -5,14 +5,16 @@
 file_name = "ILovePDF/plugins/dm/callBack/file_process/compressPDF.py"
 
 import os
-import subprocess
 from PIL import Image
 from logger import logger
 from plugins.utils import *
 # from PyPDF2 import PdfReader, PdfWriter
 
 async def compressPDF(
-    input_file: str, cDIR: str, returnRatio: bool = False
+    input_file: str,
+    cDIR: str,
+    returnRatio: bool = False,
+    token: progress.Token = progress.Token(),
 ) -> (bool, str):
     """
     Compressing a PDF file can significantly reduce its file size, making it
@@ -22,6 +24,7 @@ async def compressPDF(
     parameter:
         input_file : Here is the path of the file that the user entered
         cDIR       : This is the location of the directory that belongs to the specific user.
+        token      : Reports finished pages, stops the job when the user cancels it
 
     return:
         bool        : Return True when the request is successful
@@ -61,14 +64,26 @@ async def compressPDF(
             "-dCompatibilityLevel=1.4",
             "-dPDFSETTINGS=/ebook",
             "-dNOPAUSE",
-            "-dQUIET",
             "-dBATCH",
             "-sOutputFile={}".format(output_path),
             input_file,
         ]
 
-        # Call Ghostscript to compress the PDF
-        subprocess.call([gs_command] + gs_options)
+        # Ghostscript prints "Processing pages 1 through N." and "Page N" for every page
+        total = [0]
+
+        def onLine(line: str) -> None:
+            if line.startswith("Processing pages"):
+                total[0] = int(line.split()[-1].rstrip("."))
+            elif line.startswith("Page "):
+                token.step(int(line.split()[1]) - 1, total[0])
+
+        # Call Ghostscript to compress the PDF [killed if cancelled or too slow]
+        isSuccess, stderr = await external.run(
+            [gs_command] + gs_options, token=token, onLine=onLine
+        )
+        if not isSuccess:
+            return False, stderr
 
         # FILE SIZE COMPARISON (RATIO)
         initialSize = os.path.getsize(input_file)
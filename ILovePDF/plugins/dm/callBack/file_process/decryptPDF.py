@@ -6,8 +6,11 @@ file_name = "ILovePDF/plugins/dm/callBack/file_process/decryptPDF.py"
 
 import fitz
 from logger import logger
+from plugins.utils import progress
 
-async def decryptPDF(input_file: str, password: str, cDIR: str) -> (bool, str):
+async def decryptPDF(
+    input_file: str, password: str, cDIR: str, token: progress.Token = progress.Token()
+) -> (bool, str):
     try:
         """
         Decryption of a PDF file involves removing the encryption that has been applied to the
@@ -17,6 +20,7 @@ async def decryptPDF(input_file: str, password: str, cDIR: str) -> (bool, str):
             input_file : Here is the path of the file that the user entered
             password   : Password entered by the user for pdf encryption
             cDIR       : This is the location of the directory that belongs to the specific user.
+            token      : Stops the job when the user cancels it [a single save, no pages]
 
         return:
             bool        : Return True when the request is successful
@@ -25,7 +29,9 @@ async def decryptPDF(input_file: str, password: str, cDIR: str) -> (bool, str):
         output_path = f"{cDIR}/outPut.pdf"
         with fitz.open(input_file) as iNPUT:
             iNPUT.authenticate(f"{password}")
+            token.step(0, iNPUT.page_count)
             iNPUT.save(output_path)
+            token.step(iNPUT.page_count, iNPUT.page_count)
         return True, output_path
 
     except Exception as Error:
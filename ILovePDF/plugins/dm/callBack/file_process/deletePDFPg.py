@@ -6,8 +6,11 @@ file_name = "ILovePDF/plugins/dm/callBack/file_process/deletePDFPg.py"
 
 import fitz
 from logger import logger
+from plugins.utils import progress
 
-async def deletePDFPg(input_file: str, cDIR: str, imageList: list) -> (bool, str):
+async def deletePDFPg(
+    input_file: str, cDIR: str, imageList: list, token: progress.Token = progress.Token()
+) -> (bool, str):
     """
      Delete specified pages from a PDF file and save the modified PDF to a new file.
 
@@ -15,6 +18,7 @@ async def deletePDFPg(input_file: str, cDIR: str, imageList: list) -> (bool, str
         input_file    : Here is the path of the file that the user entered
         cDIR          : This is the location of the directory that belongs to the specific user.
         imageList     : List of page numbers that the user want to delete
+        token         : Stops the job when the user cancels it [a single save, no pages]
 
     return:
         bool        : Return True when the request is successful
@@ -25,8 +29,10 @@ async def deletePDFPg(input_file: str, cDIR: str, imageList: list) -> (bool, str
 
         dltList = [x - 1 for x in imageList]
         with fitz.open(input_file) as iNPUT:
+            token.step(0, iNPUT.page_count)
             del iNPUT[dltList]
             iNPUT.save(output_path)
+            token.step(iNPUT.page_count, iNPUT.page_count)
 
         return True, output_path
 
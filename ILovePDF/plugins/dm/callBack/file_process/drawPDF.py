@@ -6,9 +6,12 @@ file_name = "ILovePDF/plugins/dm/callBack/file_process/drawPDF.py"
 
 import fitz
 from logger import logger
+from plugins.utils import progress
 
 
-async def drawPDF(input_file: str, cDIR: str) -> (bool, str):
+async def drawPDF(
+    input_file: str, cDIR: str, token: progress.Token = progress.Token()
+) -> (bool, str):
     """
     This helps you to fetch 3D graphics from a PDF file. If the PDF document contains 3D models or graphics,
     and can extract and return those 3D elements for further processing or viewing. This can be useful for tasks
@@ -17,6 +20,7 @@ async def drawPDF(input_file: str, cDIR: str) -> (bool, str):
     parameter:
         input_file : Here is the path of the file that the user entered
         cDIR       : This is the location of the directory that belongs to the specific user.
+        token      : Reports finished pages, stops the job when the user cancels it
 
     return:
         bool        : Return True when the request is successful
@@ -27,6 +31,7 @@ async def drawPDF(input_file: str, cDIR: str) -> (bool, str):
         with fitz.open(input_file) as iNPUT:
             with fitz.open() as oUTPUT:  # empty output PDF
                 for page in iNPUT:
+                    token.step(page.number, iNPUT.page_count)
                     paths = page.get_drawings()
                     outpage = oUTPUT.new_page(
                         width=page.rect.width, height=page.rect.height
@@ -7,6 +7,7 @@ auth = "nabil"
 
 import fitz
 from logger import logger
+from plugins.utils import progress
 from pyromod import listen
 from pyrogram import filters
 from pyrogram.types import ForceReply
@@ -27,7 +28,24 @@ async def askPassword(bot, callbackQuery, question, process: str):
         return False, Error
 
 
-async def encryptPDF(input_file: str, password: str, cDIR: str) -> (bool, str):
+def encryption(password: str) -> dict:
+    """save() options encrypting a pdf [also used by the aio pipeline]"""
+    return dict(
+        encryption=fitz.PDF_ENCRYPT_AES_256,  # strongest algorithm
+        owner_pw=auth,
+        user_pw=f"{password}",
+        permissions=int(
+            fitz.PDF_PERM_ACCESSIBILITY
+            | fitz.PDF_PERM_PRINT
+            | fitz.PDF_PERM_COPY
+            | fitz.PDF_PERM_ANNOTATE
+        ),
+    )
+
+
+async def encryptPDF(
+    input_file: str, password: str, cDIR: str, token: progress.Token = progress.Token()
+) -> (bool, str):
     try:
         """
         PDF encryption is a security feature that allows you to protect your PDF documents by
@@ -38,6 +56,7 @@ async def encryptPDF(input_file: str, password: str, cDIR: str) -> (bool, str):
             input_file : Here is the path of the file that the user entered
             password   : Password entered by the user for pdf encryption
             cDIR       : This is the location of the directory that belongs to the specific user.
+            token      : Stops the job when the user cancels it [a single save, no pages]
 
         return:
             bool        : Return True when the request is successful
@@ -46,18 +65,9 @@ async def encryptPDF(input_file: str, password: str, cDIR: str) -> (bool, str):
         output_path = f"{cDIR}/outPut.pdf"
         with fitz.open(input_file) as iNPUT:
             number_of_pages = iNPUT.page_count
-            iNPUT.save(
-                output_path,
-                encryption=fitz.PDF_ENCRYPT_AES_256,  # strongest algorithm
-                owner_pw=auth,
-                user_pw=f"{password}",
-                permissions=int(
-                    fitz.PDF_PERM_ACCESSIBILITY
-                    | fitz.PDF_PERM_PRINT
-                    | fitz.PDF_PERM_COPY
-                    | fitz.PDF_PERM_ANNOTATE
-                ),
-            )
+            token.step(0, number_of_pages)
+            iNPUT.save(output_path, **encryption(password))
+            token.step(number_of_pages, number_of_pages)
         return True, output_path
 
     except Exception as Error:
@@ -6,8 +6,27 @@ file_name = "ILovePDF/plugins/dm/callBack/file_process/formatPDF.py"
 
 import fitz
 from logger import logger
+from plugins.utils import progress
 
-async def formatPDF(input_file: str, cDIR: str) -> (bool, str):
+def layout(iNPUT, token: progress.Token = progress.Token()):
+    """
+    places the pages of iNPUT on a new document [also used by the aio pipeline]
+
+    return:
+        oUTPUT : the new document, closed by the caller
+    """
+    oUTPUT = fitz.open()
+    width, height = fitz.paper_size("a4")
+    for page in iNPUT:
+        token.step(page.number, iNPUT.page_count)
+        pg = oUTPUT.new_page(-1, width=width, height=height)
+        pg.show_pdf_page(pg.rect, iNPUT, page.number)
+    return oUTPUT
+
+
+async def formatPDF(
+    input_file: str, cDIR: str, token: progress.Token = progress.Token()
+) -> (bool, str):
     """
     A4 formatting is a technique for displaying and printing PDF documents, which involves
     aligning all pages of the document within the standard A4 paper size
@@ -15,6 +34,7 @@ async def formatPDF(input_file: str, cDIR: str) -> (bool, str):
     parameter:
         input_file : Here is the path of the file that the user entered
         cDIR       : This is the location of the directory that belongs to the specific user.
+        token      : Reports finished pages, stops the job when the user cancels it
 
     return:
         bool        : Return True when the request is successful
@@ -23,11 +43,7 @@ async def formatPDF(input_file: str, cDIR: str) -> (bool, str):
     try:
         output_path = f"{cDIR}/outPut.pdf"
         with fitz.open(input_file) as iNPUT:
-            with fitz.open() as oUTPUT:
-                width, height = fitz.paper_size("a4")
-                for page in iNPUT:
-                    pg = oUTPUT.new_page(-1, width=width, height=height)
-                    pg.show_pdf_page(pg.rect, iNPUT, page.number)
+            with layout(iNPUT, token) as oUTPUT:
                 oUTPUT.save(output_path, garbage=3, deflate=True)
         return True, output_path
 
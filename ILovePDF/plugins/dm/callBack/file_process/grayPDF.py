@@ -0,0 +1,231 @@
+# This module is part of https://github.com/nabilanavab/ilovepdf
+# Feel free to use and contribute to this project. Your contributions are welcome!
+# copyright ©️ 2021 nabilanavab
+
+file_name = "ILovePDF/plugins/dm/callBack/file_process/grayPDF.py"
+
+import io
+import re
+import fitz
+from PIL import Image
+from logger import logger
+from plugins.utils import pool, progress
+from .rasterPDF import rasterPDF
+
+# content stream tokens besides (strings) [see _tokens()]: hex strings,
+# dictionaries, arrays, names, numbers, comments and operators
+_TOKEN = re.compile(
+    rb"<<|>>|<[0-9A-Fa-f\s]*>"                      # dict, <hex string>
+    rb"|\[|\]|\{|\}"
+    rb"|/[^\s/\[\]()<>{}%]*"                        # /Name
+    rb"|%[^\r\n]*"                                  # comment
+    rb"|[^\s/\[\]()<>{}%]+",                        # number or operator
+    re.S,
+)
+
+_NUMBER = re.compile(rb"^[+-]?(\d+\.?\d*|\.\d+)$")
+
+# white-space characters of the pdf syntax
+_SPACE = re.compile(rb"[\0\t\n\f\r ]*")
+
+# colour space names every reader knows without a resource
+_DEVICE = (b"/DeviceGray", b"/DeviceRGB", b"/DeviceCMYK", b"/G", b"/RGB", b"/CMYK")
+
+
+class Unsupported(Exception):
+    """content the vector conversion can't keep exact, the raster path takes over"""
+
+
+def _num(value: float) -> bytes:
+    return (b"%.4f" % max(0.0, min(1.0, value))).rstrip(b"0").rstrip(b".") or b"0"
+
+
+def _gray(operands: list) -> bytes:
+    """gray level of rgb or cmyk operands [itu-r bt.601 luma]"""
+    values = [float(operand) for operand in operands]
+    if len(values) == 3:
+        r, g, b = values
+        return _num(0.299 * r + 0.587 * g + 0.114 * b)
+    c, m, y, k = values
+    return _num(1 - min(1.0, 0.299 * c + 0.587 * m + 0.114 * y + k))
+
+
+def _string(content: bytes, start: int) -> int:
+    """end of the (string) starting at start, its parentheses may nest at any depth"""
+    depth, position = 0, start
+    while position < len(content):
+        char = content[position : position + 1]
+        if char == b"\\":
+            position += 1
+        elif char == b"(":
+            depth += 1
+        elif char == b")":
+            depth -= 1
+            if depth == 0:
+                return position + 1
+        position += 1
+    raise Unsupported("unbalanced string")
+
+
+def _tokens(content: bytes):
+    """
+    yields the tokens of a content stream, raises Unsupported as soon as
+    something between them isn't white-space [a token it can't read]
+    """
+    position = _SPACE.match(content).end()
+    while position < len(content):
+        if content[position : position + 1] == b"(":
+            end = _string(content, position)
+        else:
+            match = _TOKEN.match(content, position)
+            if match is None:
+                raise Unsupported("unreadable content")
+            end = match.end()
+        yield content[position:end]
+        position = _SPACE.match(content, end).end()
+
+
+def _stream(content: bytes) -> bytes:
+    """
+    rewrites the colour operators of a content stream to DeviceGray, every
+    other operator [paths, text, images..] is copied as it is
+
+    raises Unsupported for colours it can't convert exactly [indexed and
+    separation colour spaces] and for inline images [binary data]
+    """
+    if re.search(rb"(^|\s)BI\s", content):
+        raise Unsupported("inline image")
+
+    output, operands = [], []
+    # colour space of fill/stroke came from a resource [unknown components]
+    named = {"fill": False, "stroke": False}
+    for token in _tokens(content):
+        if token.startswith(b"%"):
+            continue
+        if (
+            _NUMBER.match(token)
+            or token[:1] in b"/([]<>{}"
+            or token in (b"true", b"false", b"null")
+        ):
+            operands.append(token)
+            continue
+
+        side = "stroke" if token.isupper() or token in (b"SC", b"SCN") else "fill"
+        numeric = operands and all(_NUMBER.match(operand) for operand in operands)
+        if token in (b"rg", b"RG", b"k", b"K") and numeric:
+            operands = [_gray(operands)]
+            token = b"g" if token in (b"rg", b"k") else b"G"
+        elif token in (b"cs", b"CS"):
+            name = operands[-1] if operands else b""
+            if name != b"/Pattern":
+                named[side] = name not in _DEVICE
+                operands = [b"/DeviceGray"]
+        elif token in (b"sc", b"scn", b"SC", b"SCN") and numeric:
+            if len(operands) in (3, 4):
+                operands = [_gray(operands)]
+            elif named[side]:
+                # one component of an indexed or separation space
+                raise Unsupported("indexed or separation colour")
+        output.append(b" ".join(operands + [token]))
+        operands = []
+    if operands:
+        output.append(b" ".join(operands))
+    return b"\n".join(output)
+
+
+def _image(doc, xref: int) -> None:
+    """stores an rgb/cmyk image as gray [jpegs stay jpegs], the soft mask is kept"""
+    if doc.xref_get_key(xref, "ImageMask")[1] == "true":
+        return
+    colorspace = doc.xref_get_key(xref, "ColorSpace")[1]
+    if colorspace in ("/DeviceGray", "null"):
+        return
+
+    pix = fitz.Pixmap(doc, xref)
+    if pix.alpha:
+        pix = fitz.Pixmap(pix, 0)
+    if pix.n == 1:
+        return
+    gray = fitz.Pixmap(fitz.csGRAY, pix)
+
+    if "DCTDecode" in doc.xref_get_key(xref, "Filter")[1]:
+        stream = io.BytesIO()
+        Image.frombytes("L", (gray.width, gray.height), gray.samples).save(
+            stream, format="JPEG", quality=85
+        )
+        doc.update_stream(xref, stream.getvalue(), compress=False)
+        doc.xref_set_key(xref, "Filter", "/DCTDecode")
+    else:
+        doc.update_stream(xref, gray.samples, compress=True)
+    doc.xref_set_key(xref, "ColorSpace", "/DeviceGray")
+    doc.xref_set_key(xref, "BitsPerComponent", "8")
+    doc.xref_set_key(xref, "DecodeParms", "null")
+    doc.xref_set_key(xref, "Decode", "null")
+
+
+def _convert(input_file: str, output_path: str, token: progress.Token) -> None:
+    """runs inside the pool: rewrites the colours of every content stream and image"""
+    with fitz.open(input_file) as doc:
+        contents = set()
+        for page in doc:
+            contents.update(page.get_contents())
+
+        total = doc.xref_length()
+        for xref in range(1, total):
+            token.step(xref, total)
+            # smooth shadings interpolate colours through functions
+            if doc.xref_get_key(xref, "ShadingType")[0] != "null":
+                if doc.xref_get_key(xref, "ColorSpace")[1] != "/DeviceGray":
+                    raise Unsupported("colour shading")
+            if doc.xref_get_key(xref, "PatternType")[1] == "2":
+                if doc.xref_get_key(xref, "Shading/ColorSpace")[1] != "/DeviceGray":
+                    raise Unsupported("colour shading")
+            if not doc.xref_is_stream(xref):
+                continue
+            subtype = doc.xref_get_key(xref, "Subtype")[1]
+            if subtype == "/Image":
+                _image(doc, xref)
+            elif (
+                xref in contents
+                or subtype == "/Form"
+                or doc.xref_get_key(xref, "PatternType")[1] == "1"
+            ):
+                doc.update_stream(xref, _stream(doc.xref_stream(xref)))
+        doc.save(output_path, garbage=3, deflate=True)
+
+
+async def grayPDF(
+    input_file: str, cDIR: str, token: progress.Token = progress.Token()
+) -> (bool, str):
+    """
+    grayscale pdf that stays a vector pdf: the colour operators of the content
+    streams and the colour images are rewritten to DeviceGray, so text stays
+    searchable and sharp. pdfs using colours it can't convert exactly fall
+    back to rendering the pages [rasterPDF.py]
+
+    parameter:
+        input_file : Here is the path of the file that the user entered
+        cDIR       : This is the location of the directory that belongs to the specific user.
+        token      : Reports finished pages, stops the job when the user cancels it
+
+    return:
+        bool        : Return True when the request is successful
+        output_path : This is the path where the output file can be found.
+    """
+    try:
+        output_path = f"{cDIR}/outPut.pdf"
+        try:
+            await pool.submit(_convert, input_file, output_path, token)
+            return True, output_path
+        except Unsupported as Error:
+            logger.debug("🚫 %s: %s, raster fallback" % (file_name, Error))
+        return await rasterPDF(
+            input_file=input_file, cDIR=cDIR, mode="gray", token=token
+        )
+
+    except Exception as Error:
+        logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
+        return False, Error
+
+# If you have any questions or suggestions, please feel free to reach out.
+# Together, we can make this project even better, Happy coding!  XD
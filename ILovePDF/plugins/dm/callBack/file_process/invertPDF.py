@@ -4,34 +4,30 @@
 
 file_name = "ILovePDF/plugins/dm/callBack/file_process/invertPDF.py"
 
-import fitz
 from logger import logger
-from PIL import Image, ImageOps
+from plugins.utils import progress
+from .rasterPDF import rasterPDF
 
 
-async def invertPDF(input_file: str, cDIR: str) -> (bool, str):
+async def invertPDF(
+    input_file: str, cDIR: str, token: progress.Token = progress.Token()
+) -> (bool, str):
     """
     Using this method, you can easily convert a PDF to invert color
 
     parameter:
         input_file : Here is the path of the file that the user entered
         cDIR       : This is the location of the directory that belongs to the specific user.
+        token      : Reports finished pages, stops the job when the user cancels it
 
     return:
         bool        : Return True when the request is successful
         output_path : This is the path where the output file can be found.
     """
     try:
-        output_path = f"{cDIR}/outPut.pdf"
-        with fitz.open(input_file) as iNPUT, fitz.open() as oUTPUT:  # empty output PDF
-            for pg in range(iNPUT.page_count):
-                iNPUT[pg].get_pixmap().save(f"{cDIR}/temp.png")
-                with Image.open(f"{cDIR}/temp.png") as image:
-                    ImageOps.invert(image).save(f"{cDIR}/temp.png")
-                    oUTPUT.insert_file(infile=f"{cDIR}/temp.png")
-            oUTPUT.save(output_path, garbage=3, deflate=True)
-
-        return True, output_path
+        return await rasterPDF(
+            input_file=input_file, cDIR=cDIR, mode="invert", token=token
+        )
 
     except Exception as Error:
         logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
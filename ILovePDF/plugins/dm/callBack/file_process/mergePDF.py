@@ -18,6 +18,23 @@ else:
 MERGEsize = {}
 
 
+def _merge(
+    pdfList: list, output_path: str, token: progress.Token = progress.Token()
+) -> None:
+    """joins all pdfs in pdfList to output_path [runs in a worker process]"""
+    total = 0
+    for pdf in pdfList:
+        with fitz.open(pdf) as mfile:
+            total += mfile.page_count
+
+    with fitz.open() as result:
+        for pdf in pdfList:
+            token.step(result.page_count, total)
+            with fitz.open(pdf) as mfile:
+                result.insert_pdf(mfile)
+        result.save(output_path)
+
+
 async def askPDF(bot, callbackQuery, question: str, size: str) -> (bool, list):
     """
     return a list of pdf files ID saved on telegram
@@ -60,7 +77,14 @@ async def askPDF(bot, callbackQuery, question: str, size: str) -> (bool, list):
 
 
 async def mergePDF(
-    input_file: str, cDIR: str, mergeId: list, bot, callbackQuery, dlMSG, text
+    input_file: str,
+    cDIR: str,
+    mergeId: list,
+    bot,
+    callbackQuery,
+    dlMSG,
+    text,
+    token: progress.Token = progress.Token(),
 ) -> (bool, str):
     """
     This function helps to merge multiple PDF files into a single PDF file. It takes a list of
@@ -72,6 +96,7 @@ async def mergePDF(
         input_file    : Here is the path of the file that the user entered
         cDIR          : This is the location of the directory that belongs to the specific user.
         mergeId       : List of pdf files to merge
+        token         : Reports finished pages, stops the job when the user cancels it
 
     return:
         bool        : Return True when the request is successful
@@ -84,6 +109,8 @@ async def mergePDF(
         file_number = 0
         # 1st or imput pdf is already downloaded
         for iD in mergeId[1:]:
+            if token.cancelled:
+                raise progress.Cancelled(token.key)
             await dlMSG.edit(f"`Downloading {file_number + 2}`", reply_markup=cancel)
             downloadLoc = await bot.download_media(
                 message=iD,
@@ -106,11 +133,8 @@ async def mergePDF(
         pdfList = [os.path.join(directory, file) for file in os.listdir(directory)]
         pdfList.sort(key=os.path.getctime)
 
-        with fitz.open() as result:
-            for pdf in pdfList:
-                with fitz.open(pdf) as mfile:
-                    result.insert_pdf(mfile)
-            result.save(output_path)
+        progress.display(token, dlMSG, text["_process"], cancel)
+        await progress.submit(token, _merge, pdfList=pdfList, output_path=output_path)
 
         return True, output_path
 
@@ -10,8 +10,19 @@ from plugins.utils import *
 from pyrogram.errors import FloodWait
 
 
+def _pageTexts(input_file: str) -> list:
+    """returns the text of every page in the pdf [runs in a worker process]"""
+    with fitz.open(input_file) as doc:
+        return [page.get_text() for page in doc]
+
+
 async def messagePDF(
-    input_file: str, cDIR: str, callbackQuery, dlMSG, text: str
+    input_file: str,
+    cDIR: str,
+    callbackQuery,
+    dlMSG,
+    text: str,
+    token: progress.Token = progress.Token(),
 ) -> (bool, str):
     """
     The function takes the file path of a PDF file as input and returns the extracted text from the PDF file as output..
@@ -22,6 +33,7 @@ async def messagePDF(
         dlMSG         : Edit Message progress bar
         text          : Edit Message Content [progress]
         callbackQuery : CallbackQuery
+        token         : Reports finished pages, stops the job when the user cancels it
 
     return:
         "finished"    : Return finished when the request is successful
@@ -32,45 +44,45 @@ async def messagePDF(
         canceled = await util.createBUTTON(btn=text["_canceledCB"])
         completed = await util.createBUTTON(btn=text["_completed"])
 
-        with fitz.open(input_file) as doc:
-            if doc.page_count >= 3:
-                await dlMSG.pin(disable_notification=True, both_sides=True)
-            for page in doc:
-                pageNo = int(str(page).split(" ")[1]) + 1
-                pdfText = page.get_text()
-                if 1 <= len(pdfText) <= 1000:
+        pages = await pool.submit(_pageTexts, input_file)
+        if len(pages) >= 3:
+            await dlMSG.pin(disable_notification=True, both_sides=True)
+        for pageNo, pdfText in enumerate(pages, start=1):
+            token.step(pageNo - 1, len(pages))
+            if 1 <= len(pdfText) <= 1000:
+                try:
+                    await callbackQuery.message.reply(
+                        f"```🅿🅰🅶🅴 : {pageNo}\n\n{pdfText}```\n@ilovepdf_bot",
+                        quote=pageNo == 1,
+                    )
+                except FloodWait as e:
+                    await asyncio.sleep(e.value + 1)
+                    await callbackQuery.message.reply(f"{pdfText}", quote=False)
+            elif 1000 <= len(pdfText):
+                slice = [
+                    pdfText[i : i + 1000] for i in range(0, len(pdfText), 1000)
+                ]
+                for i, j in enumerate(slice, start=1):
                     try:
                         await callbackQuery.message.reply(
-                            f"```🅿🅰🅶🅴 : {pageNo}\n\n{pdfText}```\n@ilovepdf_bot",
+                            f"```🅿🅰🅶🅴 : {pageNo}-{i}\n\n{j}```\n\n@ilovepdf_bot",
                             quote=pageNo == 1,
                         )
                     except FloodWait as e:
                         await asyncio.sleep(e.value + 1)
                         await callbackQuery.message.reply(f"{pdfText}", quote=False)
-                elif 1000 <= len(pdfText):
-                    slice = [
-                        pdfText[i : i + 1000] for i in range(0, len(pdfText), 1000)
-                    ]
-                    for i, j in enumerate(slice, start=1):
-                        try:
-                            await callbackQuery.message.reply(
-                                f"```🅿🅰🅶🅴 : {pageNo}-{i}\n\n{j}```\n\n@ilovepdf_bot",
-                                quote=pageNo == 1,
-                            )
-                        except FloodWait as e:
-                            await asyncio.sleep(e.value + 1)
-                            await callbackQuery.message.reply(f"{pdfText}", quote=False)
-                if await work.work(callbackQuery, "check", False):
-                    try:
-                        await dlMSG.edit(
-                            text["_upload"].format(pageNo, doc.page_count),
-                            reply_markup=cancel,
-                        )
-                    except Exception:
-                        pass
-            await dlMSG.edit(text=text["finished"], reply_markup=completed)
+            try:
+                await dlMSG.edit(
+                    text["_upload"].format(pageNo, len(pages)),
+                    reply_markup=cancel,
+                )
+            except Exception:
+                pass
+        await dlMSG.edit(text=text["finished"], reply_markup=completed)
         return "finished", "finished"
 
+    except progress.Cancelled:
+        return "finished", "finished"
     except Exception as Error:
         logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
         return False, Error
@@ -4,7 +4,12 @@
 
 file_name = "ILovePDF/plugins/dm/callBack/file_process/ocrPDF.py"
 
+import fitz
+import math
+import asyncio
 from logger import logger
+from configs.config import settings
+from plugins.utils import pool, progress
 
 try:
     nabilanavab = False  # Change to False else never work
@@ -12,15 +17,156 @@ try:
 except Exception:
     nabilanavab = True
 
+# token of the shard running in this process, used by the progress bar
+_token: progress.Token = progress.Token()
+
+# maximum number of pages OCRed by a single worker at once
+SHARD_PAGES = 10
+
+
+class ProgressBar:
+    """
+    progress bar handed to ocrmypdf [get_progressbar_class], reports the
+    pages of the OCR stage to the token of the job and stops ocrmypdf when
+    the user cancels it
+    """
+
+    def __init__(self, *, total=None, desc=None, unit=None, disable=False, **kwargs):
+        self.total = int(total or 0)
+        self.count = 0
+        self.pages = unit == "page" and desc == "OCR"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def update(self, n=1, *, completed=None):
+        self.count = completed if completed is not None else self.count + n
+        if self.pages:
+            _token.step(int(self.count), self.total)
+        elif _token.cancelled:
+            raise progress.Cancelled(_token.key)
+
+
+if not nabilanavab:
+
+    @ocrmypdf.hookimpl
+    def get_progressbar_class():
+        return ProgressBar
+
+
+def _split(input_file: str, cDIR: str, workers: int) -> list:
+    """
+    splits the pdf into page shards for the ocr pool
+
+    return:
+        list of (shard path, number of pages) [the input itself if it is small]
+    """
+    with fitz.open(input_file) as iNPUT:
+        pages = iNPUT.page_count
+        size = max(1, min(SHARD_PAGES, math.ceil(pages / workers)))
+        if pages <= size:
+            return [(input_file, pages)]
+
+        shards = []
+        for part, first in enumerate(range(0, pages, size)):
+            last = min(first + size, pages) - 1
+            with fitz.open() as oUTPUT:
+                oUTPUT.insert_pdf(iNPUT, from_page=first, to_page=last)
+                oUTPUT.save(f"{cDIR}/shard{part}.pdf")
+            shards.append((f"{cDIR}/shard{part}.pdf", last - first + 1))
+        return shards
+
+
+def _ocr(input_file: str, output_file: str, token: progress.Token) -> None:
+    """runs inside the ocr pool: OCRs a single shard"""
+    global _token
 
-async def ocrPDF(input_file: str, cDIR: str) -> (bool, str):
     try:
-        output_path = f"{cDIR}/outPut.pdf"
+        _token = token
         ocrmypdf.ocr(
-            input_file=open(input_file, "rb"),
-            output_file=open(output_path, "wb"),
+            input_file=input_file,
+            output_file=output_file,
             deskew=True,
+            progress_bar=True,
+            plugins=[__name__],
+            # shards are stitched by fitz, so skip the PDF/A conversion
+            output_type="pdf",
+            jobs=1,
+        )
+    finally:
+        _token = progress.Token()
+
+
+def _stitch(shards: list, output_path: str) -> None:
+    """joins the OCRed shards in order"""
+    with fitz.open() as oUTPUT:
+        for shard in shards:
+            with fitz.open(shard) as iNPUT:
+                oUTPUT.insert_pdf(iNPUT)
+        oUTPUT.save(output_path, garbage=3, deflate=True)
+
+
+async def ocrPDF(
+    input_file: str, cDIR: str, token: progress.Token = progress.Token()
+) -> (bool, str):
+    """
+    OCRs the pdf page shard by page shard across the ocr pool, so the wall
+    clock time depends on the number of workers more than on the pages
+
+    parameter:
+        input_file : Here is the path of the file that the user entered
+        cDIR       : This is the location of the directory that belongs to the specific user.
+        token      : Reports finished pages, stops the job when the user cancels it
+
+    return:
+        bool        : Return True when the request is successful
+        output_path : This is the path where the output file can be found.
+    """
+    try:
+        output_path = f"{cDIR}/outPut.pdf"
+        shards = await pool.submit(_split, input_file, cDIR, settings.OCR_WORKERS)
+        total = sum(pages for _, pages in shards)
+        outputs = (
+            [output_path]
+            if len(shards) == 1
+            else [f"{cDIR}/ocr{part}.pdf" for part in range(len(shards))]
         )
+        parts = [token.shard(part) for part in range(len(shards))]
+        # at most a shard per worker in the pool at once: the budget of a
+        # shard [watchdog] and the other ocr jobs don't wait behind the rest
+        pending = iter(range(len(shards)))
+        jobs = {}
+
+        def start() -> None:
+            part = next(pending, None)
+            if part is not None:
+                jobs[part] = asyncio.ensure_future(
+                    pool.submitTo("ocr", _ocr, shards[part][0], outputs[part], parts[part])
+                )
+
+        try:
+            for _ in range(max(1, settings.OCR_WORKERS)):
+                start()
+            while jobs:
+                await asyncio.wait(jobs.values(), timeout=1)
+                for part, job in list(jobs.items()):
+                    if job.done():
+                        job.result()
+                        del jobs[part]
+                        start()
+                token.step(sum(part.state()[0] for part in parts), total)
+        finally:
+            # shards not started yet are dropped, running ones stop on cancel
+            for job in jobs.values():
+                job.cancel()
+            for part in parts:
+                part.forget()
+
+        if len(shards) != 1:
+            await pool.submit(_stitch, outputs, output_path)
         return True, output_path
 
     except Exception as Error:
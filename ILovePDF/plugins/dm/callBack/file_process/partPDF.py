@@ -6,6 +6,7 @@ file_name = "ILovePDF/plugins/dm/callBack/file_process/partPDF.py"
 
 import os
 from logger import logger
+from plugins.utils import progress
 from pyrogram import filters
 from pyrogram.types import ForceReply
 from PyPDF2 import PdfWriter, PdfReader
@@ -37,7 +38,9 @@ async def askPartPdf(bot, callbackQuery, question, limit: int = None):
         return False, Error
 
 
-async def partPDF(input_file: str, cDIR: str, part: list) -> (bool, list):
+async def partPDF(
+    input_file: str, cDIR: str, part: list, token: progress.Token = progress.Token()
+) -> (bool, list):
     """
      With this feature, you can specify the desired number of pages per part, and the
      PDF splitting tool will automatically divide the document accordingly. For example,
@@ -49,6 +52,7 @@ async def partPDF(input_file: str, cDIR: str, part: list) -> (bool, list):
         input_file    : Here is the path of the file that the user entered
         cDIR          : This is the location of the directory that belongs to the specific user.
         split         : page numbers that the user requests
+        token         : Reports finished pages, stops the job when the user cancels it
 
     return:
         bool        : Return True when the request is successful
@@ -77,6 +81,7 @@ async def partPDF(input_file: str, cDIR: str, part: list) -> (bool, list):
 
                 # Add the pages to the current part
                 for page_num in range(start_page, end_page):
+                    token.step(page_num, num_pages)
                     part_pdf.add_page(input_pdf_obj.pages[page_num])
 
                 # Save the current part to a file
@@ -97,6 +102,7 @@ async def partPDF(input_file: str, cDIR: str, part: list) -> (bool, list):
                 end_page = start_page + part
 
                 for page_num in range(start_page, end_page):
+                    token.step(page_num, num_pages)
                     part_pdf.add_page(input_pdf_obj.pages[page_num])
 
                 part_filename = f"{cDIR}/{i+1}.pdf"
@@ -108,6 +114,7 @@ async def partPDF(input_file: str, cDIR: str, part: list) -> (bool, list):
             if remainder:
                 part_pdf = PdfWriter()
                 for page_num in range(start_page, num_pages):
+                    token.step(page_num, num_pages)
                     part_pdf.add_page(input_pdf_obj.pages[page_num])
 
                 part_filename = f"{cDIR}/{pages_per_part+1}.pdf"
@@ -6,19 +6,23 @@ file_name = "ILovePDF/plugins/dm/callBack/file_process/pdfFooter.py"
 
 import fitz
 from logger import logger
+from plugins.utils import progress
 from pyromod import listen
 from pyrogram import filters
 from bs4 import BeautifulSoup
 from pyrogram.types import ForceReply
 
 
-async def pdfFooter(input_file: str, cDIR: str, text: str) -> (bool, str):
+async def pdfFooter(
+    input_file: str, cDIR: str, text: str, token: progress.Token = progress.Token()
+) -> (bool, str):
     """
     Adds Header to pdf files
 
     parameter:
         input_file : Here is the path of the file that the user entered
         text : header text
+        token : Reports finished pages, stops the job when the user cancels it
 
     return:
         bool        : Return True when the request is successful
@@ -30,6 +34,7 @@ async def pdfFooter(input_file: str, cDIR: str, text: str) -> (bool, str):
         footer_html = f"<div style='text-align: center; font-size: 12px;'>{text}</div>"
         with fitz.open(input_file) as doc:
             for page_number in range(doc.page_count):
+                token.step(page_number, doc.page_count)
                 page = doc.load_page(page_number)
                 footer = BeautifulSoup(footer_html, "html.parser")
                 footer_annot = fitz.Rect(0, page.rect.height - 50, page.rect.width, page.rect.height)
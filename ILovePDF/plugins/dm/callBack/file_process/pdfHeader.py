@@ -6,6 +6,7 @@ file_name = "ILovePDF/plugins/dm/callBack/file_process/pdfHeader.py"
 
 from fpdf import FPDF
 from logger import logger
+from plugins.utils import progress
 from pyromod import listen
 from pyrogram import filters
 from pyrogram.types import ForceReply
@@ -35,13 +36,16 @@ class header(FPDF):
 
 
 
-async def pdfHeader(input_file: str, cDIR: str, text: str) -> (bool, str):
+async def pdfHeader(
+    input_file: str, cDIR: str, text: str, token: progress.Token = progress.Token()
+) -> (bool, str):
     """
     Adds Header to pdf files
 
     parameter:
         input_file : Here is the path of the file that the user entered
         text : header text
+        token : Stops the job when the user cancels it
 
     return:
         bool        : Return True when the request is successful
@@ -50,7 +54,9 @@ async def pdfHeader(input_file: str, cDIR: str, text: str) -> (bool, str):
     try:
         output_path = f"{cDIR}/outPut.pdf"
 
+        token.step(0, 1)
         pdf = header()
+        token.step(1, 1)
         return True, output_path
 
     except Exception as Error:
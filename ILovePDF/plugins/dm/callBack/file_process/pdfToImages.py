@@ -5,8 +5,7 @@
 file_name = "ILovePDF/plugins/dm/callBack/file_process/pdfToImages.py"
 
 import fitz, os
-from PIL import Image
-import shutil, asyncio
+import glob, shutil, asyncio
 from logger import logger
 from pyromod import listen
 from plugins.utils import *
@@ -14,9 +13,25 @@ from pdf import pyTgLovePDF
 from pyrogram import filters, enums
 from pyrogram.types import ForceReply
 from telebot.types import InputMediaPhoto, InputMediaDocument
+from .renderPages import renderAll, PHOTO_SIDE
 
 media = {}
 
+# groups of 10 rendered pages that may wait for the upload
+RENDER_AHEAD = 1
+
+
+def _pageCount(input_file: str) -> int:
+    """returns number of pages in the pdf [runs in a worker process]"""
+    with fitz.open(input_file) as doc:
+        return doc.page_count
+
+
+def _clean(cDIR: str) -> None:
+    """removes the rendered groups that were not uploaded"""
+    for directory in glob.glob(f"{cDIR}/pgs*"):
+        shutil.rmtree(directory, ignore_errors=True)
+
 
 async def askimageList(bot, callbackQuery, question, limit: int = 1000) -> (bool, list):
     """
@@ -52,7 +67,13 @@ async def askimageList(bot, callbackQuery, question, limit: int = 1000) -> (bool
 
 
 async def pdfToImages(
-    input_file: str, cDIR: str, callbackQuery, dlMSG, imageList: list, text: str
+    input_file: str,
+    cDIR: str,
+    callbackQuery,
+    dlMSG,
+    imageList: list,
+    text: str,
+    token: progress.Token = progress.Token(),
 ) -> (bool, str):
     """
      function that allows you to fetch pages from a PDF file. Essentially, this means that you can extract specific pages
@@ -68,6 +89,7 @@ async def pdfToImages(
         dlMSG         : Edit Message progress bar
         text          : Edit Message Content [progress]
         callbackQuery : CallbackQuery
+        token         : Reports finished pages, stops the job when the user cancels it
 
     return:
         "finished"    : Return finished when the request is successful
@@ -79,68 +101,71 @@ async def pdfToImages(
         completed = await util.createBUTTON(btn=text["_completed"])
 
         imageType = "Img" if callbackQuery.data.startswith("#p2img|I") else "Doc"
-        with fitz.open(input_file) as doc:
-            number_of_pages = doc.page_count
-            if callbackQuery.data.endswith("A"):
-                imageList = list(range(1, number_of_pages + 1))
-            mat = fitz.Matrix(2, 2)
-            if len(imageList) >= 11:
-                await dlMSG.pin(disable_notification=True, both_sides=True)
-            await dlMSG.edit(
-                text=text["_total"].format(len(imageList)), reply_markup=cancel
-            )
+        number_of_pages = await pool.submit(_pageCount, input_file)
+        if callbackQuery.data.endswith("A"):
+            imageList = list(range(1, number_of_pages + 1))
+        imageList = [i for i in imageList if int(i) <= int(number_of_pages)]
+        if len(imageList) >= 11:
+            await dlMSG.pin(disable_notification=True, both_sides=True)
+        await dlMSG.edit(
+            text=text["_total"].format(len(imageList)), reply_markup=cancel
+        )
 
+        progress.display(token, dlMSG, text["_process"], cancel)
+        # rendered groups waiting for the upload [back-pressure: the renderer
+        # stops once RENDER_AHEAD groups are ready, the next one renders
+        # while the previous one uploads]
+        rendered = asyncio.Queue(maxsize=RENDER_AHEAD)
+
+        async def produce() -> None:
             convertedPages = 0
-            for i in range(0, len(imageList), 10):
-                pgList = imageList[i : i + 10]
-                os.mkdir(f"{cDIR}/pgs")
-
-                for pageNo in pgList:
-                    if int(pageNo) <= int(number_of_pages):
-                        page = doc.load_page(int(pageNo) - 1)
-                        pix = page.get_pixmap(matrix=mat)
-                    else:
-                        continue
-                    convertedPages += 1
-                    if convertedPages % 5 == 0:
-                        if not await work.work(callbackQuery, "check", False):
-                            return await dlMSG.edit(
-                                text=text["_canceledAT"].format(
-                                    convertedPages, len(imageList)
-                                ),
-                                reply_markup=canceled,
-                            )
-                    with open(f"{cDIR}/pgs/{pageNo}.jpg", "wb"):
-                        pix.save(f"{cDIR}/pgs/{pageNo}.jpg")
-
-                directory = f"{cDIR}/pgs"
-                imag = [os.path.join(directory, file) for file in os.listdir(directory)]
-                imag.sort(key=os.path.getctime)
+            try:
+                for i in range(0, len(imageList), 10):
+                    # each jpeg less than 1MB, telegram's limit [renderPages.py]
+                    imag = await progress.run(
+                        token,
+                        renderAll,
+                        input_file=input_file,
+                        directory=f"{cDIR}/pgs{i}",
+                        pgList=imageList[i : i + 10],
+                        maxSide=PHOTO_SIDE if imageType == "Img" else None,
+                        maxSize=1000000,
+                        chunk=2,
+                        done=convertedPages,
+                        total=len(imageList),
+                    )
+                    convertedPages += len(imag)
+                    await rendered.put((f"{cDIR}/pgs{i}", imag))
+                await rendered.put(None)
+            except (Exception, progress.Cancelled) as Error:
+                # raised again by the upload loop
+                await rendered.put(Error)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            uploadedPages = 0
+            while True:
+                group = await rendered.get()
+                if group is None:
+                    break
+                if not isinstance(group, tuple):
+                    raise group
+                directory, imag = group
+                uploadedPages += len(imag)
 
                 media[callbackQuery.message.chat.id] = []
                 for file in imag:
-                    qualityRate = 95
-                    for i in range(200):
-                        if os.path.getsize(file) >= 1000000:
-                            picture = Image.open(file)
-                            picture.save(
-                                file, "JPEG", optimize=True, quality=qualityRate
-                            )
-                            qualityRate -= 5
-                            await asyncio.sleep(0.5)
-                        else:
-                            if imageType == "Img":
-                                media[callbackQuery.message.chat.id].append(
-                                    InputMediaPhoto(open(file, "rb"))
-                                )
-                            elif imageType == "Doc":
-                                media[callbackQuery.message.chat.id].append(
-                                    InputMediaDocument(open(file, "rb"))
-                                )
-                            break
+                    if imageType == "Img":
+                        media[callbackQuery.message.chat.id].append(
+                            InputMediaPhoto(open(file, "rb"))
+                        )
+                    elif imageType == "Doc":
+                        media[callbackQuery.message.chat.id].append(
+                            InputMediaDocument(open(file, "rb"))
+                        )
                 try:
                     await dlMSG.edit(
-                        text=text["_upload"].format(convertedPages, len(imageList)),
+                        text=text["_upload"].format(uploadedPages, len(imageList)),
                         reply_markup=cancel,
                     )
                 except Exception:
@@ -172,11 +197,22 @@ async def pdfToImages(
                         callbackQuery.message.chat.id,
                         media[callbackQuery.message.chat.id],
                     )
-                shutil.rmtree(f"{cDIR}/pgs")
-            await dlMSG.edit(text=text["finished"], reply_markup=completed)
-            return "finished", "finished"
+                shutil.rmtree(directory)
+                if token.cancelled:
+                    raise progress.Cancelled(token.key)
+        finally:
+            producer.cancel()
+        await dlMSG.edit(text=text["finished"], reply_markup=completed)
+        return "finished", "finished"
+    except progress.Cancelled:
+        _clean(cDIR)
+        await dlMSG.edit(
+            text=text["_canceledAT"].format(token.state()[0], len(imageList)),
+            reply_markup=canceled,
+        )
+        return "finished", "finished"
     except Exception as Error:
-        shutil.rmtree(f"{cDIR}/pgs")
+        _clean(cDIR)
         logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
         return False, Error
 
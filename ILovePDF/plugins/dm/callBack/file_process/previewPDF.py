@@ -7,17 +7,49 @@ file_name = "ILovePDF/plugins/dm/callBack/file_process/previewPDF.py"
 media = {}
 
 import fitz, os
-from PIL import Image
 from logger import logger
-from asyncio import sleep
 from pyrogram import enums
 from pdf import pyTgLovePDF
 from plugins.utils import *
 from telebot.types import InputMediaPhoto
+from .renderPages import renderAll, PHOTO_SIDE
+
+
+def _previewList(input_file: str) -> (list, str):
+    """
+    returns the page numbers included in the preview and the metadata
+    of the pdf [runs in a worker process]
+    """
+    with fitz.open(input_file) as iNPUT:
+
+        if iNPUT.page_count <= 10:
+            preview = list(range(1, iNPUT.page_count + 1))
+        else:
+            preview = (
+                [1, 2, 3]
+                + list(range(iNPUT.page_count // 2 - 1, iNPUT.page_count // 2 + 2))
+                + list(range(iNPUT.page_count - 2, iNPUT.page_count + 1))
+            )
+
+        pdfMetaData = (
+            "".join(
+                f"`{i} : {iNPUT.metadata[i]}`\n"
+                for i in iNPUT.metadata
+                if iNPUT.metadata[i] != ""
+            )
+            if iNPUT.metadata
+            else ""
+        )
+    return preview, pdfMetaData
 
 
 async def previewPDF(
-    input_file: str, cDIR: str, editMessage, cancel, callbackQuery
+    input_file: str,
+    cDIR: str,
+    editMessage,
+    cancel,
+    callbackQuery,
+    token: progress.Token = progress.Token(),
 ) -> (bool, str):
     try:
         """
@@ -32,87 +64,58 @@ async def previewPDF(
             cDIR          : This is the location of the directory that belongs to the specific user.
             editMessage   : edit Message progress bar
             callbackQuery : callbackQuery message
+            token         : Reports finished pages, stops the job when the user cancels it
 
         return:
             "finished"    : Return finished when the request is successful
             "finished"    : Return finished when the request is successful
         """
-        with fitz.open(input_file) as iNPUT:
+        preview, pdfMetaData = await pool.submit(_previewList, input_file)
 
-            if iNPUT.page_count <= 10:
-                preview = list(range(1, iNPUT.page_count + 1))
-            else:
-                preview = (
-                    [1, 2, 3]
-                    + list(range(iNPUT.page_count // 2 - 1, iNPUT.page_count // 2 + 2))
-                    + list(range(iNPUT.page_count - 2, iNPUT.page_count + 1))
-                )
+        await editMessage.edit(
+            text=f"`𝚏𝚎𝚝𝚌𝚑𝚒𝚗𝚐 𝚙𝚊𝚐𝚎𝚜: {preview}` 🙇", reply_markup=cancel
+        )
+        directory = f"{cDIR}/pgs"
+        # FILES WITH 1MB+ SIZE SHOWS AN ERROR FROM TELEGRAM [renderPages.fitJPEG]
+        imag = await progress.run(
+            token,
+            renderAll,
+            input_file=input_file,
+            directory=directory,
+            pgList=preview,
+            maxSide=PHOTO_SIDE,
+            maxSize=1000000,
+        )
+        media[callbackQuery.message.chat.id] = []
 
-            pdfMetaData = (
-                "".join(
-                    f"`{i} : {iNPUT.metadata[i]}`\n"
-                    for i in iNPUT.metadata
-                    if iNPUT.metadata[i] != ""
+        for file in imag:
+            # ADDING TO GROUP MEDIA
+            if len(media[callbackQuery.message.chat.id]) == 1:
+                media[callbackQuery.message.chat.id].append(
+                    InputMediaPhoto(
+                        media=open(file, "rb"),
+                        caption=f"`𝚙𝚊𝚐𝚎𝚜: {preview}`\n\n{pdfMetaData}",
+                        parse_mode="Markdown",
+                    )
+                )
+            else:
+                media[callbackQuery.message.chat.id].append(
+                    InputMediaPhoto(media=open(file, "rb"))
                 )
-                if iNPUT.metadata
-                else ""
-            )
 
-            await editMessage.edit(
-                text=f"`𝚏𝚎𝚝𝚌𝚑𝚒𝚗𝚐 𝚙𝚊𝚐𝚎𝚜: {preview}` 🙇", reply_markup=cancel
+        await editMessage.edit(
+            text=f"`𝚞𝚙𝚕𝚘𝚊𝚍𝚒𝚗𝚐 𝚊𝚕𝚋𝚞𝚖: {preview}` 🙇", reply_markup=cancel
+        )
+        if not token.cancelled:
+            await callbackQuery.message.reply_chat_action(
+                enums.ChatAction.UPLOAD_PHOTO
             )
-            mat = fitz.Matrix(2, 2)
-            os.mkdir(f"{cDIR}/pgs")
-            for pageNo in preview:
-                pix = iNPUT.load_page(int(pageNo) - 1).get_pixmap(matrix=mat)
-                # SAVING PREVIEW IMAGE
-                with open(f"{cDIR}/pgs/{pageNo}.jpg", "wb"):
-                    pix.save(f"{cDIR}/pgs/{pageNo}.jpg")
-
-            directory = f"{cDIR}/pgs"
-            imag = [os.path.join(directory, file) for file in os.listdir(directory)]
-            imag.sort(key=os.path.getctime)
-            media[callbackQuery.message.chat.id] = []
-
-            for file in imag:
-                await sleep(0.5)
-                qualityRate = 95
-                for i in range(200):
-                    # FILES WITH 10MB+ SIZE SHOWS AN ERROR FROM TELEGRAM
-                    # SO COMPRESS UNTIL IT COMES LESS THAN 10MB.. :(
-                    if os.path.getsize(file) >= 1000000:
-                        picture = Image.open(file)
-                        picture.save(file, "JPEG", optimize=True, quality=qualityRate)
-                        qualityRate -= 5
-                    # ADDING TO GROUP MEDIA IF POSSIBLE
-                    else:
-                        if len(media[callbackQuery.message.chat.id]) == 1:
-                            media[callbackQuery.message.chat.id].append(
-                                InputMediaPhoto(
-                                    media=open(file, "rb"),
-                                    caption=f"`𝚙𝚊𝚐𝚎𝚜: {preview}`\n\n{pdfMetaData}",
-                                    parse_mode="Markdown",
-                                )
-                            )
-                        else:
-                            media[callbackQuery.message.chat.id].append(
-                                InputMediaPhoto(media=open(file, "rb"))
-                            )
-                        break
-
-            await editMessage.edit(
-                text=f"`𝚞𝚙𝚕𝚘𝚊𝚍𝚒𝚗𝚐 𝚊𝚕𝚋𝚞𝚖: {preview}` 🙇", reply_markup=cancel
+            await pyTgLovePDF.send_media_group(
+                callbackQuery.message.chat.id,
+                media[callbackQuery.message.chat.id],
+                reply_to_message_id=callbackQuery.message.id,
             )
-            if await work.work(callbackQuery, "check", False):
-                await callbackQuery.message.reply_chat_action(
-                    enums.ChatAction.UPLOAD_PHOTO
-                )
-                await pyTgLovePDF.send_media_group(
-                    callbackQuery.message.chat.id,
-                    media[callbackQuery.message.chat.id],
-                    reply_to_message_id=callbackQuery.message.id,
-                )
-            del media[callbackQuery.message.chat.id]
+        del media[callbackQuery.message.chat.id]
         return "finished", "finished"
 
     except Exception as Error:
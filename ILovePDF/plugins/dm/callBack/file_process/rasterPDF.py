@@ -0,0 +1,206 @@
+# This module is part of https://github.com/nabilanavab/ilovepdf
+# Feel free to use and contribute to this project. Your contributions are welcome!
+# copyright ©️ 2021 nabilanavab
+
+file_name = "ILovePDF/plugins/dm/callBack/file_process/rasterPDF.py"
+
+import io
+import fitz
+import math
+import asyncio
+import numpy as np
+from PIL import Image
+from logger import logger
+from configs.config import settings
+from plugins.utils import pool, progress
+
+# maximum number of pages rasterised by a single worker at once
+CHUNK_PAGES = 10
+
+# colour transforms of the engine
+MODES = ("gray", "bw", "invert")
+
+# dithering of the black and white pages ["floyd": error diffusion, "ordered":
+# 8x8 bayer matrix, "none": plain threshold]
+DITHERS = ("floyd", "ordered", "none")
+
+# 8x8 bayer matrix, thresholds spread evenly over 0..255 around 128
+_BAYER = np.array(
+    [
+        [0, 32, 8, 40, 2, 34, 10, 42],
+        [48, 16, 56, 24, 50, 18, 58, 26],
+        [12, 44, 4, 36, 14, 46, 6, 38],
+        [60, 28, 52, 20, 62, 30, 54, 22],
+        [3, 35, 11, 43, 1, 33, 9, 41],
+        [51, 19, 59, 27, 49, 17, 57, 25],
+        [15, 47, 7, 39, 13, 45, 5, 37],
+        [63, 31, 55, 23, 61, 29, 53, 21],
+    ],
+    dtype=np.int16,
+) * 4 + 2 - 128
+
+
+def _bw(samples: np.ndarray, threshold: int, dither: str) -> bytes:
+    """1 bit png of a gray page [encoded once, in memory]"""
+    height, width = samples.shape
+    if dither == "floyd":
+        image = Image.frombuffer("L", (width, height), samples.tobytes(), "raw", "L", 0, 1)
+        image = image.point(lambda value: value + 128 - threshold).convert("1")
+    else:
+        limit = np.full(samples.shape, threshold, dtype=np.int16)
+        if dither == "ordered":
+            limit += np.tile(_BAYER, (math.ceil(height / 8), math.ceil(width / 8)))[
+                :height, :width
+            ]
+        bits = np.packbits(samples >= limit, axis=1)
+        image = Image.frombytes("1", (width, height), bits.tobytes())
+    stream = io.BytesIO()
+    image.save(stream, format="PNG", optimize=False)
+    return stream.getvalue()
+
+
+def transform(page, mode: str, dpi: int, threshold: int, dither: str) -> dict:
+    """
+    renders a page and applies the colour transform to its samples
+
+    return:
+        keyword arguments of page.insert_image [pixmap or png stream]
+    """
+    gray = mode != "invert"
+    pix = page.get_pixmap(
+        dpi=dpi, colorspace=fitz.csGRAY if gray else fitz.csRGB, alpha=False
+    )
+    if mode == "gray":
+        return {"pixmap": pix}
+
+    samples = np.frombuffer(pix.samples, dtype=np.uint8).reshape(
+        pix.height, pix.width, pix.n
+    )
+    if mode == "bw":
+        return {"stream": _bw(samples[:, :, 0], threshold, dither)}
+    return {
+        "pixmap": fitz.Pixmap(
+            fitz.csRGB, pix.width, pix.height, (255 - samples).tobytes(), False
+        )
+    }
+
+
+def _chunk(
+    input_file: str, output_file: str, first: int, last: int, mode: str,
+    dpi: int, threshold: int, dither: str, token: progress.Token,
+) -> None:
+    """runs inside the pool: transforms the pages first..last into their own pdf"""
+    with fitz.open(input_file) as iNPUT, fitz.open() as oUTPUT:
+        for done, pg in enumerate(range(first, last + 1)):
+            token.step(done, last - first + 1)
+            rect = iNPUT[pg].rect
+            page = oUTPUT.new_page(pno=-1, width=rect.width, height=rect.height)
+            page.insert_image(
+                page.rect, **transform(iNPUT[pg], mode, dpi, threshold, dither)
+            )
+        token.step(last - first + 1, last - first + 1)
+        oUTPUT.save(output_file, garbage=3, deflate=True)
+
+
+def _pageCount(input_file: str) -> int:
+    with fitz.open(input_file) as iNPUT:
+        return iNPUT.page_count
+
+
+def _join(chunks: list, output_path: str) -> None:
+    """joins the transformed chunks in order"""
+    with fitz.open() as oUTPUT:
+        for chunk in chunks:
+            with fitz.open(chunk) as iNPUT:
+                oUTPUT.insert_pdf(iNPUT)
+        oUTPUT.save(output_path, garbage=3, deflate=True)
+
+
+async def rasterPDF(
+    input_file: str,
+    cDIR: str,
+    mode: str,
+    dpi: int = None,
+    threshold: int = None,
+    dither: str = None,
+    token: progress.Token = progress.Token(),
+) -> (bool, str):
+    """
+    raster colour transforms [gray, black and white, invert]: every page is
+    rendered to a pixmap and transformed in memory, chunks of pages run in
+    parallel across the worker pool
+
+    parameter:
+        input_file : Here is the path of the file that the user entered
+        cDIR       : This is the location of the directory that belongs to the specific user.
+        mode       : Colour transform, one of MODES
+        dpi        : Resolution of the pages [settings.RASTER_DPI]
+        threshold  : Gray level from which a pixel is white [bw, settings.RASTER_THRESHOLD]
+        dither     : Dithering of the bw pages, one of DITHERS [settings.RASTER_DITHER]
+        token      : Reports finished pages, stops the job when the user cancels it
+
+    return:
+        bool        : Return True when the request is successful
+        output_path : This is the path where the output file can be found.
+    """
+    try:
+        output_path = f"{cDIR}/outPut.pdf"
+        dpi = dpi or settings.RASTER_DPI
+        threshold = settings.RASTER_THRESHOLD if threshold is None else threshold
+        dither = dither if dither in DITHERS else settings.RASTER_DITHER
+
+        pages = await pool.submit(_pageCount, input_file)
+        size = max(1, min(CHUNK_PAGES, math.ceil(pages / settings.WORKERS)))
+        ranges = [
+            (first, min(first + size, pages) - 1) for first in range(0, pages, size)
+        ]
+        outputs = (
+            [output_path]
+            if len(ranges) == 1
+            else [f"{cDIR}/raster{part}.pdf" for part in range(len(ranges))]
+        )
+        parts = [token.shard(part) for part in range(len(ranges))]
+        # at most a chunk per worker in the shared pool at once [renderPages],
+        # so the jobs of the fast lane don't wait behind every chunk of a big pdf
+        pending = iter(range(len(ranges)))
+        jobs = {}
+
+        def start() -> None:
+            part = next(pending, None)
+            if part is not None:
+                first, last = ranges[part]
+                jobs[part] = asyncio.ensure_future(
+                    pool.submit(
+                        _chunk, input_file, outputs[part], first, last,
+                        mode, dpi, threshold, dither, parts[part],
+                    )
+                )
+
+        try:
+            for _ in range(max(1, settings.WORKERS)):
+                start()
+            while jobs:
+                await asyncio.wait(jobs.values(), timeout=1)
+                for part, job in list(jobs.items()):
+                    if job.done():
+                        job.result()
+                        del jobs[part]
+                        start()
+                token.step(sum(part.state()[0] for part in parts), pages)
+        finally:
+            # chunks not started yet are dropped, running ones stop on cancel
+            for job in jobs.values():
+                job.cancel()
+            for part in parts:
+                part.forget()
+
+        if len(ranges) != 1:
+            await pool.submit(_join, outputs, output_path)
+        return True, output_path
+
+    except Exception as Error:
+        logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
+        return False, Error
+
+# If you have any questions or suggestions, please feel free to reach out.
+# Together, we can make this project even better, Happy coding!  XD
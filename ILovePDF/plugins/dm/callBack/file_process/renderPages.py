@@ -0,0 +1,233 @@
+# This module is part of https://github.com/nabilanavab/ilovepdf
+# Feel free to use and contribute to this project. Your contributions are welcome!
+# copyright ©️ 2021 nabilanavab
+
+file_name = "ILovePDF/plugins/dm/callBack/file_process/renderPages.py"
+
+import io
+import os
+import fitz
+import math
+import asyncio
+from PIL import Image
+from configs.config import settings
+from plugins.utils import pool, progress
+
+# pages rendered by a single worker at once
+CHUNK_PAGES = 4
+
+# lowest jpeg quality of fitJPEG, pages get smaller instead
+MIN_QUALITY = 40
+
+# longest side of a telegram photo, bigger photos are scaled down by telegram
+PHOTO_SIDE = 2560
+
+# jpeg bytes per pixel of a rendered page [text and drawings at quality 95],
+# sizes the pixmap of a byte budget
+BYTES_PER_PIXEL = 0.35
+
+
+def _encode(image: Image.Image, quality: int) -> bytes:
+    stream = io.BytesIO()
+    image.save(stream, "JPEG", optimize=True, quality=quality)
+    return stream.getvalue()
+
+
+def fitJPEG(image: Image.Image, budget: int) -> bytes:
+    """
+    jpeg of image smaller than budget bytes at the best quality that fits,
+    every try is encoded in memory: the size of the first encode predicts the
+    quality, a binary search refines it, and when even MIN_QUALITY is too big
+    the image is scaled down [the size follows the number of pixels]
+
+    parameter:
+        image  : PIL image of the page [RGB]
+        budget : Size the jpeg must stay below [bytes]
+    """
+    data = _encode(image, 95)
+    while len(data) >= budget:
+        low, high = MIN_QUALITY, 94
+        # the size drops about linearly with the quality below 95
+        quality = max(low, min(high, 95 * budget // len(data)))
+        best = None
+        while low <= high:
+            data = _encode(image, quality)
+            if len(data) < budget:
+                best, low = data, quality + 1
+            else:
+                high = quality - 1
+            quality = (low + high) // 2
+        if best is not None:
+            return best
+        if min(image.size) <= 64:
+            break
+        # data: the MIN_QUALITY encode
+        scale = max(0.1, min(0.9, 0.95 * (budget / len(data)) ** 0.5))
+        image = image.resize(
+            (max(1, int(image.width * scale)), max(1, int(image.height * scale))),
+            Image.LANCZOS,
+        )
+        data = _encode(image, 95)
+    return data
+
+
+def _jpeg(pix, maxSize: int) -> bytes:
+    """jpeg of a rendered page, smaller than maxSize [fitJPEG] if given"""
+    if not maxSize:
+        return pix.tobytes(output="jpeg")
+    return fitJPEG(
+        Image.frombytes("RGB", (pix.width, pix.height), pix.samples), maxSize
+    )
+
+
+def _zoom(rect, dpi: int, maxSide: int, maxSize: int) -> float:
+    """
+    zoom factor rendering the page straight at the size of the target: the
+    dpi, unless the longest side or the pixels the byte budget can hold are
+    exceeded [large format drawings]
+    """
+    zoom = dpi / 72
+    if maxSide:
+        zoom = min(zoom, maxSide / max(rect.width, rect.height, 1))
+    if maxSize:
+        zoom = min(
+            zoom, math.sqrt(maxSize / BYTES_PER_PIXEL / max(rect.width * rect.height, 1))
+        )
+    return zoom
+
+
+def _render(
+    input_file: str,
+    directory: str,
+    pgList: list,
+    dpi: int,
+    maxSide: int,
+    maxSize: int,
+    token: progress.Token,
+) -> list:
+    """
+    runs inside the pool: renders the pages of pgList [numbers starting at 1]
+    as jpeg images with a document opened by this worker
+
+    return:
+        paths of the images in directory, or (name, jpeg bytes) of every
+        page when directory is None, in the order of pgList
+    """
+    images = []
+    with fitz.open(input_file) as doc:
+        for pageNo in pgList:
+            token.step(len(images), len(pgList))
+            page = doc.load_page(int(pageNo) - 1)
+            zoom = _zoom(page.rect, dpi, maxSide, maxSize)
+            image = _jpeg(page.get_pixmap(matrix=fitz.Matrix(zoom, zoom)), maxSize)
+            if directory is None:
+                images.append((f"{pageNo}.jpg", image))
+                continue
+            with open(f"{directory}/{pageNo}.jpg", "wb") as file:
+                file.write(image)
+            images.append(f"{directory}/{pageNo}.jpg")
+        token.step(len(images), len(pgList))
+    return images
+
+
+async def renderPages(
+    input_file: str,
+    directory: str,
+    pgList: list,
+    token: progress.Token = progress.Token(),
+    dpi: int = None,
+    maxSide: int = None,
+    maxSize: int = None,
+    chunk: int = CHUNK_PAGES,
+    done: int = 0,
+    total: int = None,
+):
+    """
+    renders the pages across the worker pool, a chunk of pages per worker,
+    and yields the images chunk by chunk in the order of pgList. at most
+    settings.WORKERS chunks are rendered ahead of the consumer, so a big pdf
+    never floods the pool the other jobs share
+
+    parameter:
+        input_file : Here is the path of the file that the user entered
+        directory  : Where the images are saved [created if it doesn't exist,
+                     None: the images stay in memory, see _render()]
+        pgList     : Page numbers to render, starting from 1
+        token      : Reports finished pages, stops the job when the user cancels it
+        dpi        : Resolution of the pages [settings.IMAGE_DPI]
+        maxSide    : Longest side of the images [pixels, None: any, eg: PHOTO_SIDE]
+        maxSize    : Byte budget of the jpegs [None: any], the pixmap is sized
+                     for it and fitJPEG compresses what is still bigger
+        chunk      : Pages rendered by a single worker at once
+        done/total : Pages converted before this call and in the whole job [progress]
+
+    yield:
+        list of images [see _render()], the next pages of pgList
+    """
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+    chunks = [pgList[i : i + chunk] for i in range(0, len(pgList), chunk)]
+    parts = [token.shard(part) for part in range(len(chunks))]
+    window = max(1, settings.WORKERS)
+    total = total or len(pgList)
+    dpi = dpi or settings.IMAGE_DPI
+    jobs = {}
+
+    def start(part: int) -> None:
+        if part < len(chunks):
+            jobs[part] = asyncio.ensure_future(
+                pool.submit(
+                    _render,
+                    input_file,
+                    directory,
+                    chunks[part],
+                    dpi,
+                    maxSide,
+                    maxSize,
+                    parts[part],
+                )
+            )
+
+    try:
+        for part in range(window):
+            start(part)
+        for part in range(len(chunks)):
+            while not jobs[part].done():
+                await asyncio.wait([jobs[part]], timeout=1)
+                token.step(
+                    done + sum(parts[running].state()[0] for running in jobs),
+                    total,
+                )
+            images = jobs.pop(part).result()
+            parts[part].forget()
+            done += len(images)
+            start(part + window)
+            yield images
+    finally:
+        # chunks not started yet are dropped, running ones stop on cancel
+        for job in jobs.values():
+            job.cancel()
+        for part in parts:
+            part.forget()
+
+
+async def renderAll(
+    input_file: str,
+    directory: str,
+    pgList: list,
+    token: progress.Token = progress.Token(),
+    **kwargs,
+) -> list:
+    """
+    renders every page of pgList [see renderPages()], for progress.run()
+
+    return:
+        images [see _render()], in the order of pgList
+    """
+    images = []
+    async for chunk in renderPages(input_file, directory, pgList, token, **kwargs):
+        images.extend(chunk)
+    return images
+
+# If you have any questions or suggestions, please feel free to reach out.
+# Together, we can make this project even better, Happy coding!  XD
@@ -6,9 +6,24 @@ file_name = "ILovePDF/plugins/dm/callBack/file_process/rotatePDF.py"
 
 import fitz
 from logger import logger
+from plugins.utils import progress
 
 
-async def rotatePDF(input_file: str, angle: str, cDIR: str) -> (bool, str):
+# callback data → angle of the pages
+ANGLES = {"rot90": 90, "rot180": 180, "rot270": -90}
+
+
+def rotate(iNPUT, angle: str, token: progress.Token = progress.Token()) -> None:
+    """rotates the pages of iNPUT in place [also used by the aio pipeline]"""
+    if angle in ANGLES:
+        for page in iNPUT:
+            token.step(page.number, iNPUT.page_count)
+            page.set_rotation(ANGLES[angle])
+
+
+async def rotatePDF(
+    input_file: str, angle: str, cDIR: str, token: progress.Token = progress.Token()
+) -> (bool, str):
     """
     If a PDF file is rotated incorrectly, rotating it can help to correct the orientation of the pages so that they are displayed properly.
     Rotating a PDF file can also allow you to change the viewing angle of the document, which can be helpful when examining images or graphics.
@@ -16,6 +31,7 @@ async def rotatePDF(input_file: str, angle: str, cDIR: str) -> (bool, str):
     parameter:
         input_file : Here is the path of the file that the user entered
         cDIR       : This is the location of the directory that belongs to the specific user
+        token      : Reports finished pages, stops the job when the user cancels it
 
     return:
         bool        : Return True when the request is successful
@@ -24,15 +40,7 @@ async def rotatePDF(input_file: str, angle: str, cDIR: str) -> (bool, str):
     try:
         output_path = f"{cDIR}/outPut.pdf"
         with fitz.open(input_file) as iNPUT:
-            if angle == "rot90":
-                for page in iNPUT:
-                    page.set_rotation(90)
-            elif angle == "rot180":
-                for page in iNPUT:
-                    page.set_rotation(180)
-            elif angle == "rot270":
-                for page in iNPUT:
-                    page.set_rotation(-90)
+            rotate(iNPUT, angle, token)
             iNPUT.save(output_path)
         return True, output_path
 
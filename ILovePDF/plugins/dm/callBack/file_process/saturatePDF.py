@@ -4,12 +4,14 @@
 
 file_name = "ILovePDF/plugins/dm/callBack/file_process/saturatePDF.py"
 
-import fitz
-from PIL import Image
 from logger import logger
+from plugins.utils import progress
+from .rasterPDF import rasterPDF
 
 
-async def saturatePDF(input_file: str, cDIR: str) -> (bool, str):
+async def saturatePDF(
+    input_file: str, cDIR: str, token: progress.Token = progress.Token()
+) -> (bool, str):
     try:
         """
         Saturating" a PDF refers to the process of optimizing the colors and brightness levels
@@ -19,23 +21,16 @@ async def saturatePDF(input_file: str, cDIR: str) -> (bool, str):
         parameter:
             input_file : Here is the path of the file that the user entered
             cDIR       : This is the location of the directory that belongs to the specific user.
+            token      : Reports finished pages, stops the job when the user cancels it
 
         return:
             bool        : Return True when the request is successful
             output_path : This is the path where the output file can be found.
         """
-        output_path = f"{cDIR}/outPut.pdf"
-        with fitz.open(input_file) as iNPUT:
-            with fitz.open() as oUTPUT:  # empty output PDF
-                for pg in range(iNPUT.page_count):
-                    iNPUT[pg].get_pixmap().save(f"{cDIR}/temp.png")
-                    with Image.open(f"{cDIR}/temp.png") as image:
-                        image.convert("L").save(f"{cDIR}/temp.png")
-                        rect = iNPUT[pg].rect
-                        oUTPUT.new_page(pno=-1, width=rect.width, height=rect.height)
-                        oUTPUT[pg].insert_image(rect=rect, filename=f"{cDIR}/temp.png")
-                oUTPUT.save(output_path, garbage=3, deflate=True)
-        return True, output_path
+        # pages rendered straight to gray pixmaps, no png round trip
+        return await rasterPDF(
+            input_file=input_file, cDIR=cDIR, mode="gray", token=token
+        )
 
     except Exception as Error:
         logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
@@ -5,10 +5,13 @@
 file_name = "ILovePDF/plugins/dm/callBack/file_process/splitPDF.py"
 
 from logger import logger
+from plugins.utils import progress
 from PyPDF2 import PdfWriter, PdfReader
 
 
-async def splitPDF(input_file: str, cDIR: str, imageList: list) -> (bool, str):
+async def splitPDF(
+    input_file: str, cDIR: str, imageList: list, token: progress.Token = progress.Token()
+) -> (bool, str):
     """
      The function to split a PDF file into smaller PDF files based on the number of pages or a specific
      range of pages is a useful tool for managing large PDF files
@@ -17,6 +20,7 @@ async def splitPDF(input_file: str, cDIR: str, imageList: list) -> (bool, str):
         input_file    : Here is the path of the file that the user entered
         cDIR          : This is the location of the directory that belongs to the specific user.
         imageList     : List of page numbers that the user requires
+        token         : Reports finished pages, stops the job when the user cancels it
 
     return:
         bool        : Return True when the request is successful
@@ -27,7 +31,8 @@ async def splitPDF(input_file: str, cDIR: str, imageList: list) -> (bool, str):
         splitInputPdf = PdfReader(input_file)
         splitOutput = PdfWriter()
 
-        for i in imageList:
+        for done, i in enumerate(imageList):
+            token.step(done, len(imageList))
             if i <= len(splitInputPdf.pages):
                 splitOutput.add_page(splitInputPdf.pages[i - 1])
 
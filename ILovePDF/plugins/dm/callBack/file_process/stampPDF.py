@@ -6,6 +6,7 @@ file_name = "ILovePDF/plugins/dm/callBack/file_process/stampPDF.py"
 
 import fitz
 from logger import logger
+from plugins.utils import progress
 from ..callback import annotSet
 
 colorSet = {
@@ -20,7 +21,9 @@ colorSet = {
 }
 
 
-async def stampPDF(input_file: str, cDIR: str, data: str) -> (bool, str):
+async def stampPDF(
+    input_file: str, cDIR: str, data: str, token: progress.Token = progress.Token()
+) -> (bool, str):
     """
     The pdf stamp is a digital tool that enables users to apply a customizable stamp to a PDF document.
     The stamp can be used to indicate the document's status, such as "approved," "confidential," or "draft,".
@@ -28,6 +31,7 @@ async def stampPDF(input_file: str, cDIR: str, data: str) -> (bool, str):
     parameter:
         input_file : Here is the path of the file that the user entered
         cDIR       : This is the location of the directory that belongs to the specific user.
+        token      : Stops the job when the user cancels it [a single save, no pages]
 
     return:
         bool        : Return True when the request is successful
@@ -43,12 +47,14 @@ async def stampPDF(input_file: str, cDIR: str, data: str) -> (bool, str):
         r = fitz.Rect(72, 72, 440, 200)
 
         with fitz.open(input_file) as doc:
+            token.step(0, doc.page_count)
             page = doc.load_page(0)
             annot = page.add_stamp_annot(r, stamp=int(f"{annot}"))
             annot.set_colors(stroke=color)
             annot.set_opacity(0.5)
             annot.update()
             doc.save(output_path)
+            token.step(doc.page_count, doc.page_count)
 
         return True, output_path
 
@@ -6,9 +6,12 @@ file_name = "ILovePDF/plugins/dm/callBack/file_process/textPDF.py"
 
 import fitz
 from logger import logger
+from plugins.utils import progress
 
 
-async def textPDF(input_file: str, cDIR: str, data: str) -> (bool, str):
+async def textPDF(
+    input_file: str, cDIR: str, data: str, token: progress.Token = progress.Token()
+) -> (bool, str):
     """
     - It allows you to access the text contained within a PDF file and use it for different purposes.
     For instance, you can search and index the extracted text to make it more easily accessible.
@@ -18,6 +21,7 @@ async def textPDF(input_file: str, cDIR: str, data: str) -> (bool, str):
     parameter:
         input_file : Here is the path of the file that the user entered
         cDIR       : This is the location of the directory that belongs to the specific user.
+        token      : Reports finished pages, stops the job when the user cancels it
 
     return:
         bool/finished        : Return True when the request is successful
@@ -39,6 +43,7 @@ async def textPDF(input_file: str, cDIR: str, data: str) -> (bool, str):
         with fitz.open(input_file) as iNPUT:
             with open(output_path, "wb") as oUTPUT:
                 for page in iNPUT:
+                    token.step(page.number, iNPUT.page_count)
                     text = page.get_text(data).encode("utf8")
                     oUTPUT.write(text)
                     oUTPUT.write(bytes((12,)))
@@ -6,9 +6,33 @@ file_name = "ILovePDF/plugins/dm/callBack/file_process/threePagesToOneH.py"
 
 import fitz
 from logger import logger
+from plugins.utils import progress
 
 
-async def threePagesToOneH(input_file: str, cDIR: str) -> (bool, str):
+def layout(iNPUT, token: progress.Token = progress.Token()):
+    """
+    places the pages of iNPUT on a new document [also used by the aio pipeline]
+
+    return:
+        oUTPUT : the new document, closed by the caller
+    """
+    oUTPUT = fitz.open()
+    height, width = fitz.paper_size("a4")
+    r1 = fitz.Rect(0, 0, width / 3, height)
+    r2 = fitz.Rect(width / 3, 0, (2 * width) / 3, height)
+    r3 = fitz.Rect((2 * width) / 3, 0, width, height)
+    r_tab = [r1, r2, r3]
+    for page in iNPUT:
+        token.step(page.number, iNPUT.page_count)
+        if page.number % 3 == 0:
+            pg = oUTPUT.new_page(-1, width=width, height=height)
+        pg.show_pdf_page(r_tab[page.number % 3], iNPUT, page.number)
+    return oUTPUT
+
+
+async def threePagesToOneH(
+    input_file: str, cDIR: str, token: progress.Token = progress.Token()
+) -> (bool, str):
     """
     This function takes a PDF file with three pages per sheet and converts it to a single page per sheet format.
     The output file will contain all pages from the input file in sequential order, but with each pair of pages
@@ -17,6 +41,7 @@ async def threePagesToOneH(input_file: str, cDIR: str) -> (bool, str):
     parameter:
         input_file : Here is the path of the file that the user entered
         cDIR       : This is the location of the directory that belongs to the specific user.
+        token      : Reports finished pages, stops the job when the user cancels it
 
     return:
         bool        : Return True when the request is successful
@@ -25,16 +50,7 @@ async def threePagesToOneH(input_file: str, cDIR: str) -> (bool, str):
     try:
         output_path = f"{cDIR}/outPut.pdf"
         with fitz.open(input_file) as iNPUT:
-            with fitz.open() as oUTPUT:
-                height, width = fitz.paper_size("a4")
-                r1 = fitz.Rect(0, 0, width / 3, height)
-                r2 = fitz.Rect(width / 3, 0, (2 * width) / 3, height)
-                r3 = fitz.Rect((2 * width) / 3, 0, width, height)
-                r_tab = [r1, r2, r3]
-                for page in iNPUT:
-                    if page.number % 3 == 0:
-                        pg = oUTPUT.new_page(-1, width=width, height=height)
-                    pg.show_pdf_page(r_tab[page.number % 3], iNPUT, page.number)
+            with layout(iNPUT, token) as oUTPUT:
                 oUTPUT.save(output_path, garbage=3, deflate=True)
         return True, output_path
 
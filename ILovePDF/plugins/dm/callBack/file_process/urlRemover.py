@@ -6,8 +6,11 @@ file_name = "ILovePDF/plugins/dm/callBack/file_process/urlRemover.py"
 
 import fitz
 from logger import logger
+from plugins.utils import progress
 
-async def urlRemover(input_file: str, cDIR: str) -> (bool, str):
+async def urlRemover(
+    input_file: str, cDIR: str, token: progress.Token = progress.Token()
+) -> (bool, str):
     """
     A URL remover tool is designed to identify and remove URLs (Uniform Resource Locators)
     from PDF documents, images, or text, converting them into plain words.
@@ -15,6 +18,7 @@ async def urlRemover(input_file: str, cDIR: str) -> (bool, str):
     parameter:
         input_file : Here is the path of the file that the user entered
         cDIR       : This is the location of the directory that belongs to the specific user.
+        token      : Reports finished pages, stops the job when the user cancels it
 
     return:
         bool        : Return True when the request is successful
@@ -25,6 +29,7 @@ async def urlRemover(input_file: str, cDIR: str) -> (bool, str):
         with fitz.open(input_file) as iNPUT:
             with fitz.open() as oUTPUT:
                 for page in iNPUT:
+                    token.step(page.number, iNPUT.page_count)
                     pg = oUTPUT.new_page(
                         pno=-1,
                         width=page.rect.width,
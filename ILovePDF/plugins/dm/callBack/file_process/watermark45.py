@@ -6,32 +6,40 @@ file_name = "ILovePDF/plugins/dm/callBack/file_process/watermark45.py"
 
 import fitz
 from logger import logger 
+from plugins.utils import progress
 
 
-async def add_text_watermark(input_file, output_file, watermark_text):
-    try:
-        with fitz.open(input_file) as pdf:
-            for page in pdf:
+def add_watermark(pdf, watermark_text, token: progress.Token = progress.Token()):
+    """writes the watermark on the pages of pdf in place [also used by the aio pipeline]"""
+    for page in pdf:
+        token.step(page.number, pdf.page_count)
+
+        font = fitz.Font(fontname="tiit")
+        text_width = font.text_length(
+            watermark_text, fontsize=int(page.bound().height // 20)
+        )
 
-                font = fitz.Font(fontname="tiit")
-                text_width = font.text_length(
-                    watermark_text, fontsize=int(page.bound().height // 20)
-                )
+        tw = fitz.TextWriter(page.rect, opacity=0.5, color=[0, 0, 0])
 
-                tw = fitz.TextWriter(page.rect, opacity=0.5, color=[0, 0, 0])
+        txt_bottom, txt_left = int((page.bound().width - text_width) / 2), int(
+            (page.bound().height - page.bound().height / 20) / 2
+        )
 
-                txt_bottom, txt_left = int((page.bound().width - text_width) / 2), int(
-                    (page.bound().height - page.bound().height / 20) / 2
-                )
+        tw.append(
+            (txt_bottom, txt_left),
+            watermark_text,
+            fontsize=int(page.bound().height // 20),
+            font=font,
+        )
+        tw.write_text(page)
 
-                tw.append(
-                    (txt_bottom, txt_left),
-                    watermark_text,
-                    fontsize=int(page.bound().height // 20),
-                    font=font,
-                )
-                tw.write_text(page)
 
+async def add_text_watermark(
+    input_file, output_file, watermark_text, token: progress.Token = progress.Token()
+):
+    try:
+        with fitz.open(input_file) as pdf:
+            add_watermark(pdf, watermark_text, token)
             pdf.save(output_file)
         return True, output_file
     except Exception as Error:
@@ -39,12 +47,17 @@ async def add_text_watermark(input_file, output_file, watermark_text):
         return False, Error
 
 
-async def watermarkPDF(input_file: str, cDIR: str, watermark) -> (bool, str):
+async def watermarkPDF(
+    input_file: str, cDIR: str, watermark, token: progress.Token = progress.Token()
+) -> (bool, str):
     try:
         output_path = f"{cDIR}/outPut.pdf"
 
         success, output_file = await add_text_watermark(
-            input_file=input_file, output_file=output_path, watermark_text=watermark
+            input_file=input_file,
+            output_file=output_path,
+            watermark_text=watermark,
+            token=token,
         )
         if not success:
             return False, output_file
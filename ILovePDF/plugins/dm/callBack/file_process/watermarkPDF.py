@@ -14,6 +14,7 @@ import io
 import base64
 import random
 import hashlib
+from plugins.utils import progress
 
 
 async def askWatermark(bot, callbackQuery, question: str, data: str) -> (bool, list):
@@ -345,7 +346,8 @@ async def get_position(pg_width, pg_height, text_width, position):
 
 
 async def add_text_watermark(
-    input_file, output_file, watermark_text, opacity, position, color
+    input_file, output_file, watermark_text, opacity, position, color,
+    token: progress.Token = progress.Token()
 ):
     """
     إضافة علامة مائية نصية متقدمة بحماية قصوى ضد الحذف
@@ -362,6 +364,7 @@ async def add_text_watermark(
         # فتح ملف PDF
         with fitz.open(input_file) as pdf:
             for page_num, page in enumerate(pdf):
+                token.step(page_num, pdf.page_count)
                 
                 if position == 'M':
                     # Tiled Watermark (Strong Protection)
@@ -443,7 +446,10 @@ async def add_text_watermark(
         return False, Error
 
 
-async def add_image_watermark(input_file, output_file, watermark, opacity, position):
+async def add_image_watermark(
+    input_file, output_file, watermark, opacity, position,
+    token: progress.Token = progress.Token()
+):
     """
     إضافة علامة مائية للصور مع إزالة الخلفية والحماية المتقدمة
     """
@@ -480,6 +486,7 @@ async def add_image_watermark(input_file, output_file, watermark, opacity, posit
 
         with fitz.open(input_file) as file_handle:
             for page_num, page in enumerate(file_handle):
+                token.step(page_num, file_handle.page_count)
                 r = page.rect
                 
                 if position == 'M':
@@ -533,7 +540,8 @@ async def add_image_watermark(input_file, output_file, watermark, opacity, posit
 
 
 async def watermarkPDF(
-    input_file: str, cDIR: str, callbackQuery, watermark, text
+    input_file: str, cDIR: str, callbackQuery, watermark, text,
+    token: progress.Token = progress.Token()
 ) -> (bool, str):
     """
     دالة العلامة المائية المتقدمة مع حماية قصوى ضد الحذف
@@ -567,7 +575,9 @@ async def watermarkPDF(
 
         # Handle text watermark
         if _type == "txt":
-            success, output_file = await add_text_watermark(
+            success, output_file = await progress.submit(
+                token,
+                add_text_watermark,
                 input_file=input_file,
                 output_file=output_path,
                 watermark_text=watermark,
@@ -580,7 +590,9 @@ async def watermarkPDF(
                 
         # Handle image watermark
         elif _type == "img":
-            success, output_file = await add_image_watermark(
+            success, output_file = await progress.submit(
+                token,
+                add_image_watermark,
                 input_file=input_file,
                 output_file=output_path,
                 watermark=watermark,
@@ -4,13 +4,72 @@
 
 file_name = "ILovePDF/plugins/dm/callBack/file_process/zipTarPDF.py"
 
-import fitz
+import fitz, os, io, time
+import asyncio, tarfile, zipfile
 from logger import logger
 from plugins.utils import *
+from configs.config import settings
+from .renderPages import renderPages
+
+
+def _pageCount(input_file: str) -> int:
+    """returns number of pages in the pdf [runs in a worker process]"""
+    with fitz.open(input_file) as doc:
+        return doc.page_count
+
+
+def _open(path: str, fileType: str):
+    """empty zip or tar archive [zip entries deflated at settings.ARCHIVE_LEVEL]"""
+    if fileType == "zip":
+        level = settings.ARCHIVE_LEVEL
+        return zipfile.ZipFile(
+            path,
+            "w",
+            zipfile.ZIP_DEFLATED if level else zipfile.ZIP_STORED,
+            compresslevel=level or None,
+        )
+    return tarfile.open(path, "w")
+
+
+def _write(archive, images: list) -> None:
+    """appends the (name, jpeg bytes) of the rendered pages to the archive"""
+    for name, image in images:
+        if isinstance(archive, zipfile.ZipFile):
+            archive.writestr(name, image)
+            continue
+        info = tarfile.TarInfo(name)
+        info.size, info.mtime = len(image), time.time()
+        archive.addfile(info, io.BytesIO(image))
+
+
+async def _archive(
+    input_file: str,
+    path: str,
+    fileType: str,
+    pgList: list,
+    token: progress.Token = progress.Token(),
+) -> None:
+    """
+    writes the pages into the archive while they render: the workers return
+    the jpegs in memory [renderPages.py] and a thread appends them in page
+    order, so no page is staged on disk
+    """
+    archive = await asyncio.to_thread(_open, path, fileType)
+    try:
+        async for images in renderPages(input_file, None, pgList, token):
+            await asyncio.to_thread(_write, archive, images)
+    finally:
+        await asyncio.to_thread(archive.close)
 
 
 async def zipTarPDF(
-    input_file: str, cDIR: str, callbackQuery, dlMSG, imageList: list, text: str
+    input_file: str,
+    cDIR: str,
+    callbackQuery,
+    dlMSG,
+    imageList: list,
+    text: str,
+    token: progress.Token = progress.Token(),
 ) -> (bool, str):
     """ """
     try:
@@ -20,53 +79,35 @@ async def zipTarPDF(
 
         fileType = "zip" if callbackQuery.data.startswith("#p2img|zip") else "tar"
 
-        with fitz.open(input_file) as doc:
-            directory = f"{cDIR}/pgs"
-            os.mkdir(directory)
-            number_of_pages = doc.page_count
-            if callbackQuery.data.endswith("A") and number_of_pages <= 50:
-                imageList = list(range(1, number_of_pages + 1))
-            elif callbackQuery.data.endswith("A"):
-                imageList = list(range(1, 50))
-
-            await dlMSG.edit(
-                text=text["_total"].format(len(imageList)), reply_markup=cancel
-            )
-            mat = fitz.Matrix(2, 2)
-            convertedPages = 0
-
-            for i in imageList:
-                page = doc.load_page(i - 1)
-                pix = page.get_pixmap(matrix=mat)
-                convertedPages += 1
-                if convertedPages % 5 == 0:
-                    await dlMSG.edit(
-                        text="`processing {}/{}` 😎".format(
-                            convertedPages, len(imageList)
-                        ),
-                        reply_markup=cancel,
-                    )
-                    if not await work.work(callbackQuery, "check", False):
-                        return True, await dlMSG.edit(
-                            text=text["_canceledAT"].format(
-                                convertedPages, len(imageList)
-                            ),
-                            reply_markup=canceled,
-                        )
-                with open(f"{cDIR}/pgs/{i}.jpg", "wb"):
-                    pix.save(f"{cDIR}/pgs/{i}.jpg")
-
-            output_path = f"{cDIR}/zipORtar"
-
-            if fileType == "zip":
-                path = shutil.make_archive(output_path, "zip", directory)
-            elif fileType == "tar":
-                path = shutil.make_archive(output_path, "tar", directory)
+        path = f"{cDIR}/zipORtar.{fileType}"
+        number_of_pages = await pool.submit(_pageCount, input_file)
+        if callbackQuery.data.endswith("A"):
+            imageList = list(range(1, number_of_pages + 1))
+        imageList = [i for i in imageList if int(i) <= int(number_of_pages)]
 
+        await dlMSG.edit(
+            text=text["_total"].format(len(imageList)), reply_markup=cancel
+        )
+        progress.display(token, dlMSG, text["_process"], cancel)
+        await progress.run(
+            token,
+            _archive,
+            input_file=input_file,
+            path=path,
+            fileType=fileType,
+            pgList=imageList,
+        )
         return True, path
 
+    except progress.Cancelled:
+        if os.path.exists(path):
+            os.remove(path)
+        await dlMSG.edit(
+            text=text["_canceledAT"].format(token.state()[0], len(imageList)),
+            reply_markup=canceled,
+        )
+        return "finished", "finished"
     except Exception as Error:
-        shutil.rmtree(f"{cDIR}/pgs")
         logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
         return False, Error
 
@@ -6,9 +6,12 @@ file_name = "ILovePDF/plugins/dm/callBack/file_process/zoomPDF.py"
 
 import fitz
 from logger import logger
+from plugins.utils import progress
 
 
-async def zoomPDF(input_file: str, cDIR: str) -> (bool, str):
+async def zoomPDF(
+    input_file: str, cDIR: str, token: progress.Token = progress.Token()
+) -> (bool, str):
     """
     Zooming in on a PDF can be helpful in many ways. It can make small or fine-print text easier to read,
     allow you to examine details more closely, and improve the readability of PDFs on small screens.
@@ -18,6 +21,7 @@ async def zoomPDF(input_file: str, cDIR: str) -> (bool, str):
     parameter:
         input_file : Here is the path of the file that the user entered
         cDIR       : This is the location of the directory that belongs to the specific user.
+        token      : Reports finished pages, stops the job when the user cancels it
 
     return:
         bool        : Return True when the request is successful
@@ -28,6 +32,7 @@ async def zoomPDF(input_file: str, cDIR: str) -> (bool, str):
         with fitz.open(input_file) as iNPUT:
             with fitz.open() as oUTPUT:  # empty output PDF
                 for pages in iNPUT:
+                    token.step(pages.number, iNPUT.page_count)
                     r = pages.rect
                     d = fitz.Rect(pages.cropbox_position, pages.cropbox_position)
                     r1 = r / 2  # top left rect
@@ -11,6 +11,7 @@ from configs.db import myID
 from configs.beta import BETA
 from configs.db import dataBASE
 from configs.config import dm, settings
+from .callBack.__recipe__ import recipeList
 
 if dataBASE.MONGODB_URI:
     from database import db
@@ -89,5 +90,21 @@ async def _betaMode(bot, message):
     except Exception as Error:
         logger.exception("🐞 %s : %s" % (file_name, Error))
 
+
+# 💾 SAVED RECIPES (/recipes) 💾
+@ILovePDF.on_message(filters.private & filters.command(["recipes"]) & filters.incoming)
+async def _recipes(bot, message):
+    try:
+        lang_code = await util.getLang(message.from_user.id)
+        CHUNK, _ = await util.translate(text="RECIPE", lang_code=lang_code)
+
+        if not dataBASE.MONGODB_URI:
+            return await message.reply_text(CHUNK["noDB"], quote=True)
+
+        text, markup = await recipeList(message.from_user.id, CHUNK)
+        await message.reply_text(text, reply_markup=markup, quote=True)
+    except Exception as Error:
+        logger.exception("🐞 %s : %s" % (file_name, Error))
+
 # If you have any questions or suggestions, please feel free to reach out.
 # Together, we can make this project even better, Happy coding!  XD
@@ -12,6 +12,8 @@ from PIL import Image
 from ..utils import *
 from configs import *
 from .photo import HD
+from .batch import BATCH, collect
+from .callBack import __recipe__
 from configs import beta
 
 try:
@@ -97,16 +99,20 @@ cnvrt_api_2PDF = [
     ".vstx",
 ]  # file to pdf (ConvertAPI limit)
 
-#  PYMUPDF FILES TO PDF 
+#  PYMUPDF FILES TO PDF [runs in a worker process, killed by the watchdog if it hangs]
+def _pymu(input_file, output_file):
+    with fitz.open(input_file) as doc:
+        with fitz.open("pdf", doc.convert_to_pdf()) as pdf:
+            pdf.save(
+                output_file,
+                garbage=4,
+                deflate=True,
+            )
+
+
 async def pymuConvert2PDF(cDIR, edit, input_file, lang_code):
     try:
-        with fitz.open(input_file) as doc:
-            with fitz.open("pdf", doc.convert_to_pdf()) as pdf:
-                pdf.save(
-                    f"{cDIR}/outPut.pdf",
-                    garbage=4,
-                    deflate=True,
-                )
+        await pool.submit(_pymu, input_file, f"{cDIR}/outPut.pdf")
         return True
     except Exception as e:
         tTXT, tBTN = await translate(text="DOCUMENT['error']", lang_code=lang_code)
@@ -122,11 +128,17 @@ async def cvApi2PDF(cDIR, edit, input_file, lang_code, API):
     try:
         convertapi.api_secret = API
         fileNm, fileExt = os.path.splitext(input_file)
-        convertapi.convert(
-            "pdf",
-            {"File": f"{input_file}"},
-            from_format=fileExt[1:],
-        ).save_files(f"{cDIR}/outPut.pdf")
+        # blocking http call: runs in a thread, abandoned by the watchdog if it hangs
+        await watchdog.guard(
+            "convertapi",
+            asyncio.to_thread(
+                lambda: convertapi.convert(
+                    "pdf",
+                    {"File": f"{input_file}"},
+                    from_format=fileExt[1:],
+                ).save_files(f"{cDIR}/outPut.pdf")
+            ),
+        )
         return True
     except Exception as e:
         tTXT, tBTN = await translate(text="DOCUMENT['error']", lang_code=lang_code)
@@ -135,10 +147,14 @@ async def cvApi2PDF(cDIR, edit, input_file, lang_code, API):
 
 
 #  WORD FILES TO PDF 
+def _word(input_file, output_file):
+    doc = word.Document(input_file)
+    doc.save(output_file)
+
+
 async def word2PDF(cDIR, edit, input_file, lang_code):
     try:
-        doc = word.Document(input_file)
-        doc.save(f"{cDIR}/outPut.pdf")
+        await pool.submit(_word, input_file, f"{cDIR}/outPut.pdf")
         return True
     except Exception as e:
         tTXT, tBTN = await translate(text="DOCUMENT['error']", lang_code=lang_code)
@@ -155,6 +171,12 @@ async def documents(bot, message):
             await message.reply_chat_action(enums.ChatAction.TYPING)
         except Exception:
             pass
+        # batch mode collects the pdfs [/batch, plugins/dm/batch.py]
+        if (
+            message.chat.id in BATCH
+            and os.path.splitext(message.document.file_name or "")[1].lower() == ".pdf"
+        ):
+            return await collect(bot, message)
         lang_code = await util.getLang(message.chat.id)
         CHUNK, _ = await util.translate(text="DOCUMENT", lang_code=lang_code)
         if await work.work(message, "check", True):
@@ -185,6 +207,10 @@ async def documents(bot, message):
             tBTN = await util.createBUTTON(
                 CHUNK["replyCB"] if message.chat.id in beta.BETA else CHUNK["_replyCB"]
             )
+            # one-tap buttons of the saved recipes [plugins/utils/recipe.py]
+            tBTN.inline_keyboard.extend(
+                recipe.buttons(await recipe.get(message.from_user.id))
+            )
             await pdfMsgId.edit(
                 text=CHUNK["reply"].format(
                     message.document.file_name,
@@ -192,6 +218,8 @@ async def documents(bot, message):
                 ),
                 reply_markup=tBTN,
             )
+            # recipe applied to every pdf of the user [if any]
+            asyncio.ensure_future(__recipe__.apply(bot, message, pdfMsgId))
             logFile = message
 
         # IMAGE AS FILES (ADDS TO PDF FILE)
@@ -201,7 +201,10 @@ async def _status(bot, callbackQuery):
                 lang_code=lang_code,
             )
             return await callbackQuery.edit_message_caption(
-                caption=tTXT.format(total_users, total_chats), reply_markup=tBTN
+                caption=tTXT.format(
+                    total_users, total_chats, db.profiles.hits, db.profiles.misses
+                ),
+                reply_markup=tBTN,
             )
 
         elif __ == "server":
@@ -306,7 +309,8 @@ async def _status(bot, callbackQuery):
 @ILovePDF.on_callback_query(filters.regex("^close"))
 async def _close(bot, callbackQuery):
     try:
-        _, data = callbackQuery.data.split("|")
+        # close|me|<part> stops a single file of a batch [plugins/dm/batch.py]
+        _, data, *part = callbackQuery.data.split("|")
         if data == "admin":
             if callbackQuery.from_user.id in dm.ADMINS:
                 await util.try_delete_message(callbackQuery.message)
@@ -318,8 +322,17 @@ async def _close(bot, callbackQuery):
             return
 
         if data == "me":  # deletes message & current work
-            await util.try_delete_message(callbackQuery.message)
-            return await work.work(callbackQuery, "delete", False)
+            if part:
+                callbackQuery.part = int(part[0])
+            await jobqueue.cancel(callbackQuery)
+            if await work.work(callbackQuery, "delete", False) is False:
+                # a running batch, only the files of it can be cancelled
+                lang_code = await util.getLang(callbackQuery.from_user.id)
+                _, __ = await util.translate(
+                    text="PROGRESS['workInP']", lang_code=lang_code
+                )
+                return await callbackQuery.answer(_)
+            return await util.try_delete_message(callbackQuery.message)
         elif data == "hd":
             await util.try_delete_message(callbackQuery.message)
             del HD[callbackQuery.message.chat.id]
@@ -218,7 +218,13 @@ async def _url(bot, message):
 
                     elif not directDlLink:
                         outputName = pattern.sub(r"\3", url)
-                        pdfkit.from_url(url, f"{cDIR}/{message.id}.pdf")
+                        # wkhtmltopdf runs in the external program manager, not in the event loop
+                        isSuccess, stderr = await external.run(
+                            pdfkit.PDFKit(url, "url").command(f"{cDIR}/{message.id}.pdf"),
+                            token=progress.get(cDIR),
+                        )
+                        if not os.path.exists(f"{cDIR}/{message.id}.pdf"):
+                            raise Exception(stderr)
 
                     tTXT, tBTN = await util.translate(
                         text="URL['done']", button="URL['close']", lang_code=lang_code
@@ -18,9 +18,9 @@ iLovePDF = r'''
                          ❤ Telegram: @nabilanavab
 '''
 
-from . import work, render, fncta, util, caption
+from . import admission, work, render, fncta, util, caption, pool, scheduler, progress, external, jobqueue, watchdog, drain, recipe, cache, inputs, catalog, ranged
 
-__all__ = ["work", "render", "fncta", "util", "caption"]
+__all__ = ["admission", "work", "render", "fncta", "util", "caption", "pool", "scheduler", "progress", "external", "jobqueue", "watchdog", "drain", "recipe", "cache", "inputs", "catalog", "ranged"]
 
 
 # If you have any questions or suggestions, please feel free to reach out.
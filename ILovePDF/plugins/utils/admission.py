@@ -0,0 +1,147 @@
+# This module is part of https://github.com/nabilanavab/ilovepdf
+# Feel free to use and contribute to this project. Your contributions are welcome!
+# copyright ©️ 2021 nabilanavab
+
+
+file_name = "ILovePDF/plugins/utils/admission.py"
+
+import time
+import psutil
+from configs.config import settings
+
+MB = 1024 * 1024
+
+# operation → (memory, disk) needed per byte of the input file, the disk
+# always holds the input, the output and the temporary files
+PER_BYTE = {
+    "merge": (2.0, 12.0),      # up to 10 more files of the same size
+    "compress": (1.0, 2.5),
+    "ocr": (2.0, 4.0),
+    "aio": (2.0, 4.0),         # several operations, one output after the other
+    "p2img": (1.0, 3.0),
+}
+
+# operation → (memory, disk) needed per page, for the jobs rendering pages
+PER_PAGE = {
+    "ocr": (60 * MB, 2 * MB),
+    "baw": (25 * MB, 1 * MB),
+    "sat": (25 * MB, 1 * MB),
+    "inv": (25 * MB, 1 * MB),
+    "p2img": (25 * MB, 3 * MB),
+    "preview": (25 * MB, 3 * MB),
+}
+
+# every job needs at least this much [interpreter, fitz buffers..]
+BASE = (50 * MB, 1 * MB)
+
+# pages assumed when the page count is still unknown
+PAGES = 20
+
+# seconds a started job takes to allocate what it needs, meanwhile its
+# estimate fades out as the live usage takes it over
+SETTLE = 30
+
+# job key → ((memory, disk) estimated, time.time() of the admission), the
+# jobs didn't allocate it yet when the next job asks for admission
+_reserved: dict = {}
+
+
+def estimate(data: str, size: int, pages: int = 0) -> tuple:
+    """
+    estimates the memory and disk a job needs
+
+    parameter:
+        data  : operation [callback data without #]
+        size  : size of the input file in bytes
+        pages : number of pages [0 if unknown]
+
+    return:
+        (memory, disk) in bytes
+    """
+    memory, disk = BASE
+    operation = next(
+        (key for key in PER_BYTE if data.startswith(key)), None
+    )
+    perByte = PER_BYTE.get(operation, (1.0, 2.0))
+    memory += size * perByte[0]
+    disk += size * perByte[1]
+
+    operation = next(
+        (key for key in PER_PAGE if data.startswith(key)), None
+    )
+    if operation is not None:
+        # pages are rendered one after the other per worker process
+        perPage = PER_PAGE[operation]
+        memory += perPage[0] * min(pages or PAGES, settings.WORKERS)
+        disk += perPage[1] * (pages or PAGES)
+    return int(memory), int(disk)
+
+
+def _budget() -> tuple:
+    """returns the memory and scratch disk the jobs may use in total"""
+    ram = psutil.virtual_memory().total * settings.MAX_RAM / 100
+    disk = psutil.disk_usage(settings.WORK_DISK).total * settings.MAX_DISK / 100
+    return ram, disk
+
+
+def possible(need: tuple) -> bool:
+    """False if the job doesn't fit even into an idle server"""
+    ram, disk = _budget()
+    return need[0] <= ram and need[1] <= disk
+
+
+def _booked() -> tuple:
+    """
+    returns the part of the estimates the admitted jobs didn't allocate yet
+    [psutil already counts what the running jobs use, counting their whole
+    estimate too would count them twice]
+    """
+    now = time.time()
+    memory = disk = 0
+    for need, admitted in _reserved.values():
+        left = max(0.0, 1 - (now - admitted) / SETTLE)
+        memory += need[0] * left
+        disk += need[1] * left
+    return memory, disk
+
+
+def fits(need: tuple) -> bool:
+    """True if admitting the job keeps the server below the thresholds"""
+    ram, disk = _budget()
+    memory = psutil.virtual_memory()
+    usedRam = memory.total - memory.available
+    usedDisk = psutil.disk_usage(settings.WORK_DISK).used
+    reservedRam, reservedDisk = _booked()
+    return (
+        usedRam + reservedRam + need[0] <= ram
+        and usedDisk + reservedDisk + need[1] <= disk
+    )
+
+
+def reserve(key: str, need: tuple) -> None:
+    """books the estimate of an admitted job"""
+    _reserved[key] = (need, time.time())
+
+
+def release(key: str) -> None:
+    """frees the estimate of a finished job"""
+    _reserved.pop(key, None)
+
+
+def status() -> dict:
+    """returns the current usage and the booked estimates in MB"""
+    ram, disk = _budget()
+    memory = psutil.virtual_memory()
+    reservedRam, reservedDisk = _booked()
+    return {
+        "ram": int((memory.total - memory.available) / MB),
+        "disk": int(psutil.disk_usage(settings.WORK_DISK).used / MB),
+        "reservedRam": int(reservedRam / MB),
+        "reservedDisk": int(reservedDisk / MB),
+        "ramLimit": int(ram / MB),
+        "diskLimit": int(disk / MB),
+    }
+
+
+# If you have any questions or suggestions, please feel free to reach out.
+# Together, we can make this project even better, Happy coding!  XD
@@ -0,0 +1,82 @@
+# This module is part of https://github.com/nabilanavab/ilovepdf
+# Feel free to use and contribute to this project. Your contributions are welcome!
+# copyright ©️ 2021 nabilanavab
+
+
+file_name = "ILovePDF/plugins/utils/cache.py"
+
+import json
+import hashlib
+from logger import logger
+from configs.db import dataBASE
+from configs.config import settings
+
+if dataBASE.MONGODB_URI:
+    from database import db
+
+# operations sending a single file that only depends on the pdf and the
+# answers of the user [no passwords, no second file, no album]
+CACHEABLE = (
+    "compress", "ocr", "baw", "sat", "gray", "inv", "urlRemover", "draw",
+    "zoom", "1-format", "2-format", "3-format", "4-format", "rot", "header",
+    "footer", "split", "deletePg", "p2img|zip", "p2img|tar", "spP",
+    "textT", "textH", "textJ",
+)
+
+# the ttl index is created by the first lookup
+_indexed = False
+
+
+def enabled(data: str) -> bool:
+    """returns True if the result of the operation may come from the cache"""
+    return bool(
+        dataBASE.MONGODB_URI and settings.CACHE_ENTRIES and data.startswith(CACHEABLE)
+    )
+
+
+def key(file_unique_id: str, data: str, params: dict, *extra) -> str:
+    """
+    key of a result: the pdf [telegram's file_unique_id is the same for every
+    copy of a file], the operation, the answers of the user and whatever else
+    the sent file depends on [file name, thumbnail]
+    """
+    return hashlib.sha1(
+        json.dumps(
+            [file_unique_id, data, params, extra], sort_keys=True, default=str
+        ).encode()
+    ).hexdigest()
+
+
+async def get(key: str) -> dict:
+    """
+    returns the cached result [file_id, result of the operation] or None
+    """
+    global _indexed
+    try:
+        if not _indexed:
+            await db.cache_index(settings.CACHE_TTL)
+            _indexed = True
+        return await db.get_result(key)
+    except Exception as Error:
+        logger.debug("🚫 %s: %s" % (file_name, Error))
+
+
+async def save(key: str, file_id: str, result) -> None:
+    """stores the file_id of a sent result, the least used ones are evicted"""
+    try:
+        await db.set_result(key, file_id, result)
+        await db.evict_results(settings.CACHE_ENTRIES)
+    except Exception as Error:
+        logger.debug("🚫 %s: %s" % (file_name, Error))
+
+
+async def drop(key: str) -> None:
+    """forgets a result telegram doesn't send anymore"""
+    try:
+        await db.drop_result(key)
+    except Exception as Error:
+        logger.debug("🚫 %s: %s" % (file_name, Error))
+
+
+# If you have any questions or suggestions, please feel free to reach out.
+# Together, we can make this project even better, Happy coding!  XD
@@ -0,0 +1,127 @@
+# This module is part of https://github.com/nabilanavab/ilovepdf
+# Feel free to use and contribute to this project. Your contributions are welcome!
+# copyright ©️ 2021 nabilanavab
+
+
+file_name = "ILovePDF/plugins/utils/catalog.py"
+
+import time
+import fitz
+from . import pool, ranged
+from logger import logger
+from configs.db import dataBASE
+
+if dataBASE.MONGODB_URI:
+    from database import db
+
+# seconds a pdf the ranged read failed on isn't read from ranges again
+# [every button of a malformed big pdf would fetch them again]
+FAILED_TTL = 900
+
+# file_unique_id → time.time() of the failed ranged read
+_failed: dict = {}
+
+
+def _scan(file_path: str) -> dict:
+    """
+    fingerprint of a pdf [runs in a worker process]
+
+    return:
+        pages, encrypted, metadata, version and for readable pdfs the number
+        of images and fonts and whether a page has a text layer
+    """
+    with fitz.open(file_path) as doc:
+        metadata = {key: value for key, value in (doc.metadata or {}).items() if value}
+        entry = {
+            "pages": doc.page_count,
+            "encrypted": bool(doc.is_encrypted),
+            "metadata": metadata,
+            "version": metadata.get("format", ""),
+        }
+        if doc.needs_pass:
+            return entry
+
+        images, fonts, text = set(), set(), False
+        for page in doc:
+            images.update(image[0] for image in page.get_images())
+            fonts.update(font[0] for font in page.get_fonts())
+            # scanned pdfs have pages without any text [ocr]
+            text = text or bool(page.get_text("text").strip())
+        entry.update(images=len(images), fonts=len(fonts), text=text)
+    return entry
+
+
+def metadata(entry: dict) -> str:
+    """metadata of a fingerprint as shown below the pdf message"""
+    return "".join(f"`{key} : {value}`\n" for key, value in entry["metadata"].items())
+
+
+async def get(file_unique_id: str) -> dict:
+    """returns the fingerprint of a pdf seen before [None if unknown]"""
+    if not dataBASE.MONGODB_URI:
+        return None
+    try:
+        return await db.get_fingerprint(file_unique_id)
+    except Exception as Error:
+        logger.debug("🚫 %s: %s" % (file_name, Error))
+
+
+async def scan(file_path: str, file_unique_id: str = None) -> dict:
+    """
+    fingerprints a downloaded pdf and records it for the next requests of
+    the same file [telegram's file_unique_id], raises if it isn't a pdf
+    """
+    entry = await pool.submit(_scan, file_path)
+    if file_unique_id and dataBASE.MONGODB_URI:
+        try:
+            await db.set_fingerprint(file_unique_id, entry)
+        except Exception as Error:
+            logger.debug("🚫 %s: %s" % (file_name, Error))
+    return entry
+
+
+async def refresh(file_path: str, file_unique_id: str) -> None:
+    """
+    replaces the partial fingerprint of a pdf [inspect()] by the full one
+    once a job downloaded it
+    """
+    entry = await get(file_unique_id)
+    if entry is None or not entry.get("partial"):
+        return
+    try:
+        await scan(file_path, file_unique_id)
+    except Exception as Error:
+        logger.debug("🚫 %s: %s" % (file_name, Error))
+
+
+async def inspect(bot, message) -> dict:
+    """
+    fingerprints a big pdf from the few ranges holding its structure, without
+    downloading it [ranged.py], and records it
+
+    return:
+        the fingerprint [partial], None if the pdf has to be downloaded
+    """
+    now = time.time()
+    for key, failed in list(_failed.items()):
+        if now - failed > FAILED_TTL:
+            del _failed[key]
+    if message.document.file_unique_id in _failed:
+        return None
+
+    try:
+        entry = await ranged.inspect(bot, message)
+    except Exception as Error:
+        logger.debug("🚫 %s: %s" % (file_name, Error))
+        _failed[message.document.file_unique_id] = now
+        return None
+    if dataBASE.MONGODB_URI:
+        try:
+            await db.set_fingerprint(message.document.file_unique_id, entry)
+        except Exception as Error:
+            logger.debug("🚫 %s: %s" % (file_name, Error))
+    return entry
+
+
+# If you have any questions or suggestions, please feel free to reach out.
+# Together, we can make this project even better, Happy coding!  XD
@@ -0,0 +1,193 @@
+# This module is part of https://github.com/nabilanavab/ilovepdf
+# Feel free to use and contribute to this project. Your contributions are welcome!
+# copyright ©️ 2021 nabilanavab
+
+
+file_name = "ILovePDF/plugins/utils/drain.py"
+
+import os
+import json
+import time
+import asyncio
+from logger import logger
+from configs.db import dataBASE
+from configs.config import settings
+from pyrogram.types import CallbackQuery
+from . import scheduler, progress, jobqueue, admission, work
+
+if dataBASE.MONGODB_URI:
+    from database import db
+
+# where the unfinished jobs wait for the next start without MongoDB
+# [work/nabilanavab is wiped on every start, this file is not]
+FILE = "work/resume.json"
+
+# callback query id → job of this process that didn't finish yet:
+# everything needed to start it again [file, operation, answers]
+_jobs: dict = {}
+
+
+class Replay(CallbackQuery):
+    """
+    callback query nobody tapped: a job started again after a restart or a
+    recipe applied on upload [the original query expired long ago or never
+    existed], so the answers are replied to the pdf instead
+    """
+
+    async def answer(self, text: str = None, *args, **kwargs) -> None:
+        if text:
+            try:
+                await self.message.reply_text(text, quote=True)
+            except Exception:
+                pass
+
+
+def track(callbackQuery, params: dict = None) -> None:
+    """
+    remembers a job until it finishes [work.work "delete"]
+
+    parameter:
+        callbackQuery : callback query of the job
+        params        : answers of the user, once asked [None: not asked yet,
+                        the questions are asked again after a restart]
+
+    passwords are never saved: those jobs ask their questions again too
+    """
+    if callbackQuery.message is None or getattr(callbackQuery, "part", None) is not None:
+        # inline messages can't be fetched again, the files of a batch
+        # are collected in memory [plugins/dm/batch.py]
+        return
+    if jobqueue.secret(params):
+        params = None
+    _jobs[callbackQuery.id] = {
+        "id": callbackQuery.id,
+        "chat": callbackQuery.message.chat.id,
+        "message": callbackQuery.message.id,
+        "data": callbackQuery.data,
+        "params": params,
+    }
+
+
+def forget(callbackQuery) -> None:
+    """the job finished, failed or got cancelled"""
+    _jobs.pop(callbackQuery.id, None)
+
+
+async def _save(jobs: list) -> None:
+    """stores the unfinished jobs for the next start"""
+    if dataBASE.MONGODB_URI:
+        return await db.save_resume(jobs)
+    with open(FILE, "w") as file:
+        json.dump(jobs, file)
+
+
+async def _load() -> list:
+    """returns and removes the jobs stored by the last shutdown"""
+    if dataBASE.MONGODB_URI:
+        return await db.load_resume()
+    if not os.path.exists(FILE):
+        return []
+    with open(FILE) as file:
+        jobs = json.load(file)
+    os.remove(FILE)
+    return jobs
+
+
+async def drain() -> None:
+    """
+    shutdown: refuses new jobs, gives the running ones settings.DRAIN_TIMEOUT
+    seconds to finish and saves every job that didn't [workers hand them back
+    to the shared job queue instead]
+    """
+    scheduler.drain()
+    started = time.time()
+    while scheduler.running() and time.time() - started < settings.DRAIN_TIMEOUT:
+        await asyncio.sleep(1)
+
+    try:
+        if settings.ROLE == "worker":
+            await jobqueue.release()
+        elif _jobs:
+            await _save(list(_jobs.values()))
+    except Exception as Error:
+        logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
+    logger.debug(
+        f"♻️ DRAIN: {len(_jobs)} unfinished jobs saved after {int(time.time() - started)}s"
+    )
+
+    # the handlers return, so the client can stop
+    scheduler.stop()
+    for key in scheduler.running():
+        progress.cancel(key)
+
+
+async def _resume(bot, job: dict) -> None:
+    """starts a saved job again"""
+    from plugins.dm.callBack import __index__ as index, __aio__ as aio, __recipe__
+
+    try:
+        message = await bot.get_messages(job["chat"], job["message"])
+        if message.empty or not getattr(message.reply_to_message, "document", None):
+            # the user deleted the pdf in the meantime
+            return
+
+        callbackQuery = Replay(
+            client=bot,
+            id=job["id"],
+            from_user=message.reply_to_message.from_user,
+            chat_instance=str(job["chat"]),
+            message=message,
+            data=job["data"],
+        )
+        if job["params"] is None:
+            # not started yet: the handler queues it and asks its questions again
+            handler = (
+                aio.__index__ if job["data"] == "processAIO"
+                else __recipe__.__index__ if job["data"].startswith("recipe")
+                else index.__index__
+            )
+            return await handler(bot, callbackQuery)
+
+        data = job["data"][1:]
+        need = admission.estimate(
+            data,
+            message.reply_to_message.document.file_size,
+            int(message.text.split("•")[1]) if "•" in message.text else 0,
+        )
+        cDIR = await work.work(
+            callbackQuery, "queue", False, lane=index.getLane(data), need=need
+        )
+        if not cDIR:
+            return
+        track(callbackQuery, job["params"])
+        await index.runJob(bot, callbackQuery, data, job["params"], cDIR)
+
+    except Exception as Error:
+        logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
+
+
+async def resume(bot) -> set:
+    """
+    starts the jobs saved by the last shutdown again, call it once after
+    the client started
+
+    return:
+        chat ids of the resumed jobs [they need no restart notice]
+    """
+    if settings.ROLE == "worker":
+        return set()
+    try:
+        jobs = await _load()
+    except Exception as Error:
+        logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
+        return set()
+
+    for job in jobs:
+        asyncio.ensure_future(_resume(bot, job))
+    if jobs:
+        logger.debug(f"♻️ DRAIN: {len(jobs)} jobs resumed")
+    return {job["chat"] for job in jobs}
+
+
+# If you have any questions or suggestions, please feel free to reach out.
+# Together, we can make this project even better, Happy coding!  XD
@@ -0,0 +1,155 @@
+# This module is part of https://github.com/nabilanavab/ilovepdf
+# Feel free to use and contribute to this project. Your contributions are welcome!
+# copyright ©️ 2021 nabilanavab
+
+
+file_name = "ILovePDF/plugins/utils/external.py"
+
+import os
+import time
+import signal
+import asyncio
+import resource
+from . import progress, watchdog
+from logger import logger
+from collections import deque
+from configs.config import settings
+
+# caps the external programs [ghostscript, wkhtmltopdf, tesseract..] running
+# at the same time, every other job keeps running while they wait
+_semaphore: asyncio.Semaphore = None
+
+# external programs running and waiting for the semaphore [for /jobs]
+_count: dict = {"running": 0, "waiting": 0}
+
+
+def _limits(cpu: int):
+    """returns the preexec_fn that caps the cpu time of the program"""
+
+    def preexec() -> None:
+        # SIGXCPU at the soft limit, SIGKILL by the kernel at the hard limit
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu + 5))
+
+    return preexec
+
+
+def _kill(process) -> None:
+    """kills the program and everything it started"""
+    if process.returncode is None:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+
+async def _lines(stream, onLine=None, buffer: deque = None) -> None:
+    """reads a pipe line by line until the program closes it"""
+    while True:
+        line = await stream.readline()
+        if not line:
+            return
+        line = line.decode(errors="replace").rstrip()
+        if buffer is not None:
+            buffer.append(line)
+        if onLine is not None:
+            onLine(line)
+
+
+def status() -> dict:
+    """returns the number of running and waiting external programs"""
+    return {**_count, "limit": settings.MAX_PROCESSES}
+
+
+async def run(
+    command: list,
+    token: progress.Token = progress.Token(),
+    onLine=None,
+    timeout: int = None,
+    cpu: int = None,
+) -> (bool, str):
+    """
+    runs an external program without blocking the event loop
+
+    parameter:
+        command : program and its arguments [eg: ["gs", "-dBATCH", ..]]
+        token   : token of the job, the program is killed when the user cancels it
+        onLine  : optional function called with every line the program prints
+        timeout : wall clock limit in seconds [watchdog.TIMEOUTS of the program]
+        cpu     : cpu time limit in seconds [settings.PROCESS_CPU]
+
+    return:
+        bool    : True when the program exited with 0
+        stderr  : last lines of the error output or the reason it got killed
+                  raises progress.Cancelled if the user cancelled the job
+    """
+    global _semaphore
+
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(settings.MAX_PROCESSES)
+
+    timeout = timeout or watchdog.budget(os.path.basename(command[0]))
+    cpu = cpu or settings.PROCESS_CPU
+    stderr, killed = deque(maxlen=20), None
+
+    _count["waiting"] += 1
+    try:
+        await _semaphore.acquire()
+    finally:
+        _count["waiting"] -= 1
+    _count["running"] += 1
+    try:
+        if token.cancelled:
+            raise progress.Cancelled(token.key)
+
+        started = time.time()
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            preexec_fn=_limits(cpu),
+            start_new_session=True,
+        )
+        job = asyncio.gather(
+            _lines(process.stdout, onLine),
+            _lines(process.stderr, buffer=stderr),
+            process.wait(),
+        )
+        try:
+            while not job.done():
+                await asyncio.wait({job}, timeout=1)
+                if job.done():
+                    break
+                if token.cancelled:
+                    raise progress.Cancelled(token.key)
+                if time.time() - started > timeout:
+                    killed = f"killed after {timeout}s"
+                    _kill(process)
+                    await asyncio.wait({job})
+            job.result()
+        finally:
+            # cancelled, timed out or onLine failed: never leave it running
+            _kill(process)
+            await asyncio.wait({job})
+            if not job.cancelled():
+                job.exception()
+            await process.wait()
+    finally:
+        _count["running"] -= 1
+        _semaphore.release()
+    logger.debug("⏱ %s: %.1fs / %ss" % (command[0], time.time() - started, timeout))
+
+    if stderr:
+        logger.debug(
+            "⚙️ %s [%s]: %s" % (command[0], token.key, "\n".join(stderr))
+        )
+    if killed is None and process.returncode in (-signal.SIGXCPU, -signal.SIGKILL):
+        killed = f"killed, cpu limit {cpu}s"
+    if killed is not None:
+        stderr.append(killed)
+        logger.debug("⚙️ %s [%s]: %s" % (command[0], token.key, killed))
+    return process.returncode == 0, "\n".join(stderr)
+
+
+# If you have any questions or suggestions, please feel free to reach out.
+# Together, we can make this project even better, Happy coding!  XD
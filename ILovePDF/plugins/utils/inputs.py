@@ -0,0 +1,98 @@
+# This module is part of https://github.com/nabilanavab/ilovepdf
+# Feel free to use and contribute to this project. Your contributions are welcome!
+# copyright ©️ 2021 nabilanavab
+
+
+file_name = "ILovePDF/plugins/utils/inputs.py"
+
+import os
+import uuid
+import shutil
+import asyncio
+from logger import logger
+from configs.config import settings
+
+# downloaded pdfs by file_unique_id, next to the work directories so a job
+# gets a hard link instead of a copy [kept across restarts]
+DIRECTORY = "work/inputs"
+
+
+def _link(source: str, path: str) -> None:
+    """hard link of source at path, a copy on file systems without links"""
+    try:
+        os.link(source, path)
+    except OSError:
+        shutil.copyfile(source, path)
+
+
+def _evict(budget: int) -> None:
+    """removes the least recently used pdfs until the cache fits the budget"""
+    files = []
+    for name in os.listdir(DIRECTORY):
+        path = f"{DIRECTORY}/{name}"
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, path))
+
+    size = sum(file[1] for file in files)
+    for _, fileSize, path in sorted(files):
+        if size <= budget:
+            break
+        # jobs using it keep their own link
+        os.remove(path)
+        size -= fileSize
+
+
+def _add(path: str, cached: str) -> None:
+    os.makedirs(DIRECTORY, exist_ok=True)
+    # two jobs may cache the same pdf at once
+    part = f"{cached}.{uuid.uuid4().hex}"
+    _link(path, part)
+    os.replace(part, cached)
+    _evict(settings.INPUT_CACHE * 1024 * 1024)
+
+
+async def download(bot, document, path: str, **kwargs) -> str:
+    """
+    puts the pdf of a document message at path: a hard link of the copy
+    downloaded by an earlier job of the same file, or a fresh download that
+    is cached for the next jobs [settings.INPUT_CACHE MB, least recently
+    used evicted first]
+
+    parameter:
+        document : document of the message [file_id, file_unique_id, file_size]
+        path     : where the job wants the pdf [in its work directory]
+        kwargs   : progress, progress_args of bot.download_media
+
+    return:
+        path of the pdf [None if the download got cancelled]
+    """
+    cached = f"{DIRECTORY}/{document.file_unique_id}"
+    if settings.INPUT_CACHE:
+        try:
+            if os.path.getsize(cached) == document.file_size:
+                await asyncio.to_thread(_link, cached, path)
+                # marks it as recently used
+                os.utime(cached)
+                return path
+        except OSError:
+            pass
+
+    path = await bot.download_media(message=document.file_id, file_name=path, **kwargs)
+    if (
+        settings.INPUT_CACHE
+        and path
+        and os.path.getsize(path) == document.file_size
+        and document.file_size <= settings.INPUT_CACHE * 1024 * 1024
+    ):
+        try:
+            await asyncio.to_thread(_add, path, cached)
+        except Exception as Error:
+            logger.debug("🚫 %s: %s" % (file_name, Error))
+    return path
+
+
+# If you have any questions or suggestions, please feel free to reach out.
+# Together, we can make this project even better, Happy coding!  XD
@@ -0,0 +1,214 @@
+# This module is part of https://github.com/nabilanavab/ilovepdf
+# Feel free to use and contribute to this project. Your contributions are welcome!
+# copyright ©️ 2021 nabilanavab
+
+
+file_name = "ILovePDF/plugins/utils/jobqueue.py"
+
+import asyncio
+from logger import logger
+from configs.db import dataBASE
+from configs.config import settings
+from pyrogram.types import CallbackQuery
+from . import work, util, progress, scheduler, admission
+
+if dataBASE.MONGODB_URI:
+    from database import db
+
+# operations that never leave the front process [merge keeps the sizes of
+# the files in MERGEsize, metadata has nothing to process]
+LOCAL = ("merge", "metadata")
+
+# answers that never get stored in the shared queue: jobs asking for them
+# run in the process of the user who typed them [encrypt, decrypt]
+SECRETS = ("password",)
+
+# seconds a worker sleeps when there is nothing to claim
+POLL = 2
+
+# lane → jobs claimed by this worker and not finished yet
+_busy: dict = {lane: 0 for lane in scheduler.LANES}
+
+# job id → jobs claimed by this worker and not finished yet
+_claimed: dict = {}
+
+
+def secret(params: dict) -> bool:
+    """True if the answers of the user hold a password"""
+    return bool(params) and any(key in params for key in SECRETS)
+
+
+def remote(data: str, params: dict = None) -> bool:
+    """True if the job is handed to the worker processes [front role]"""
+    return (
+        settings.ROLE == "front"
+        and bool(dataBASE.MONGODB_URI)
+        and not data.startswith(LOCAL)
+        and not secret(params)
+    )
+
+
+async def push(
+    callbackQuery, path: str, data: str, params: dict,
+    lane: str = "normal", notify=None
+) -> None:
+    """
+    queues a job for the worker processes
+
+    parameter:
+        callbackQuery : callback query of the job, the workers fetch its message again
+        path          : work directory of the job, used for cancelling it
+        data          : operation [callback data without #]
+        params        : answers of the user, must be storable in MongoDB [no
+                        passwords, see remote()]
+        lane          : latency class of the job ["fast", "normal", "heavy"]
+        notify        : optional scheduler.Notify showing the position of the job
+    """
+    if secret(params):
+        raise ValueError("passwords are not stored in the shared job queue")
+    job = {
+        "chat": callbackQuery.message.chat.id,
+        "message": callbackQuery.message.id,
+        "path": path,
+        "data": data,
+        "params": params,
+        "lane": lane,
+        "notice": None,
+    }
+    if notify is not None:
+        position = (await db.count_jobs(lane)).get("queued", 0) + 1
+        await notify(position, scheduler.eta(position, lane))
+        if notify.msg is not None:
+            job["notice"] = notify.msg.id
+    await db.add_job(job)
+
+
+async def cancel(callbackQuery) -> None:
+    """cancels the queued or running worker job of the chat [front role]"""
+    if settings.ROLE == "front" and dataBASE.MONGODB_URI:
+        await db.cancel_job(await work.work(callbackQuery, "path", False))
+
+
+async def status() -> dict:
+    """returns the number of jobs in the shared queue by status"""
+    if not dataBASE.MONGODB_URI:
+        return {}
+    return await db.count_jobs()
+
+
+async def release() -> None:
+    """worker role: hands the unfinished jobs back to the shared queue [shutdown]"""
+    for job in list(_claimed.values()):
+        await db.ack_job(job["_id"], settings.WORKER_ID, done=False)
+    _claimed.clear()
+
+
+async def _heartbeat(job: dict, callbackQuery) -> None:
+    """renews the lease of a running job, stops it when the lease is lost"""
+    while True:
+        await asyncio.sleep(settings.JOB_LEASE / 3)
+        try:
+            if not await db.renew_job(
+                job["_id"], settings.WORKER_ID, settings.JOB_LEASE
+            ):
+                # cancelled by the user or claimed by another worker
+                return progress.cancel(
+                    await work.work(callbackQuery, "job", False)
+                )
+        except Exception as Error:
+            logger.debug("🚫 %s: %s" % (file_name, Error))
+
+
+async def _run(bot, job: dict) -> None:
+    """downloads, processes and uploads a claimed job"""
+    from plugins.dm.callBack.__index__ import runJob
+
+    beat = None
+    _claimed[job["_id"]] = job
+    try:
+        if job["notice"]:
+            await util.try_delete_message(
+                await bot.get_messages(job["chat"], job["notice"])
+            )
+        message = await bot.get_messages(job["chat"], job["message"])
+        if message.empty or not getattr(message.reply_to_message, "document", None):
+            # the user deleted the pdf in the meantime
+            return await db.ack_job(job["_id"], settings.WORKER_ID)
+
+        callbackQuery = CallbackQuery(
+            client=bot,
+            id=str(job["_id"]),
+            from_user=message.reply_to_message.from_user,
+            chat_instance=str(job["chat"]),
+            message=message,
+            data=f"#{job['data']}",
+        )
+        # the lease is kept while the job waits in the local queue too
+        beat = asyncio.ensure_future(_heartbeat(job, callbackQuery))
+        need = admission.estimate(
+            job["data"],
+            message.reply_to_message.document.file_size,
+            int(message.text.split("•")[1]) if "•" in message.text else 0,
+        )
+        cDIR = await work.work(
+            callbackQuery, "queue", False, lane=job["lane"], need=need
+        )
+        if not cDIR:
+            # local queue of this worker is full [or it shuts down], hand it to another one
+            return await db.ack_job(job["_id"], settings.WORKER_ID, done=False)
+
+        await runJob(bot, callbackQuery, job["data"], job["params"], cDIR)
+        await db.ack_job(job["_id"], settings.WORKER_ID)
+
+    except Exception as Error:
+        # not acked: retried by the next worker once the lease expires
+        logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
+
+    finally:
+        if beat is not None:
+            beat.cancel()
+        _claimed.pop(job["_id"], None)
+        _busy[job["lane"]] -= 1
+
+
+async def _failed(bot, job: dict) -> None:
+    """tells the user that every attempt of the job died with its worker"""
+    try:
+        lang_code = await util.getLang(job["chat"])
+        CHUNK, _ = await util.translate(text="INDEX", lang_code=lang_code)
+        await bot.send_message(
+            chat_id=job["chat"],
+            text=CHUNK["error"].format(f"{job['attempts']} workers lost"),
+            reply_to_message_id=job["message"],
+        )
+    except Exception as Error:
+        logger.debug("🚫 %s: %s" % (file_name, Error))
+
+
+async def serve(bot) -> None:
+    """
+    worker role: claims the jobs of the shared queue as long as this process
+    has free slots in their lanes, call it once after the client started
+    """
+    logger.debug(f"❤ WORKER {settings.WORKER_ID}: waiting for jobs")
+    while not scheduler.draining():
+        try:
+            for job in await db.dead_jobs(settings.JOB_RETRIES):
+                if job["status"] == "running":
+                    asyncio.ensure_future(_failed(bot, job))
+
+            lanes = [lane for lane in scheduler.LANES if _busy[lane] < scheduler.LANES[lane]]
+            job = lanes and await db.claim_job(
+                settings.WORKER_ID, lanes, settings.JOB_LEASE, settings.JOB_RETRIES
+            )
+            if job:
+                _busy[job["lane"]] += 1
+                asyncio.ensure_future(_run(bot, job))
+                continue
+        except Exception as Error:
+            logger.exception("🐞 %s: %s" % (file_name, Error), exc_info=True)
+        await asyncio.sleep(POLL)
+
+
+# If you have any questions or suggestions, please feel free to reach out.
+# Together, we can make this project even better, Happy coding!  XD
@@ -0,0 +1,200 @@
+# This module is part of https://github.com/nabilanavab/ilovepdf
+# Feel free to use and contribute to this project. Your contributions are welcome!
+# copyright ©️ 2021 nabilanavab
+
+
+file_name = "ILovePDF/plugins/utils/pool.py"
+
+import os
+import time
+import uuid
+import signal
+import asyncio
+import functools
+import importlib
+import multiprocessing
+from . import watchdog
+from logger import logger
+from configs.config import settings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# every PyMuPDF/PIL job runs in one of these worker processes, so the
+# telegram event loop only ever waits on I/O. OCR shards get a pool of their
+# own, so a long OCR job never starves the pdf jobs
+POOLS = {"pdf": settings.WORKERS, "ocr": settings.OCR_WORKERS}
+
+# pool name → ProcessPoolExecutor
+_executors: dict = {}
+
+# process holding the state shared by the bot and the worker processes
+_manager = None
+
+# job id → (pid of the worker process running it, time.time() it started),
+# so the watchdog can kill it and only counts the time it runs
+_pids = None
+
+# modules imported by each worker before the first job arrives
+PRELOAD = ["fitz", "PIL.Image"]
+
+
+def _warm() -> None:
+    """
+    initializer of every worker process: imports the heavy libraries and
+    all file_process modules once, so the first job doesn't pay for it
+    """
+    for module in PRELOAD:
+        try:
+            importlib.import_module(module)
+        except Exception as Error:
+            logger.debug("🐞 %s: %s" % (file_name, Error))
+
+    try:
+        from plugins.dm.callBack.file_process import __all__ as processes
+
+        for process in processes:
+            importlib.import_module(
+                f"plugins.dm.callBack.file_process.{process}"
+            )
+    except Exception as Error:
+        logger.debug("🐞 %s: %s" % (file_name, Error))
+
+
+def _ping() -> int:
+    """returns the pid of the worker, used for pre-warming"""
+    return os.getpid()
+
+
+def _call(func, args: tuple, kwargs: dict, job: str = None, pids=None):
+    """
+    runs inside the worker process
+
+    file_process functions are declared `async` but never await any I/O,
+    so they are driven to completion by a private event loop in the worker
+    """
+    if pids is not None:
+        pids[job] = (os.getpid(), time.time())
+    try:
+        if asyncio.iscoroutinefunction(func):
+            return asyncio.run(func(*args, **kwargs))
+        return func(*args, **kwargs)
+    finally:
+        if pids is not None:
+            pids.pop(job, None)
+
+
+def manager():
+    """returns the process holding the shared state, starting it if needed"""
+    global _manager, _pids
+
+    if _manager is None:
+        _manager = multiprocessing.Manager()
+        _pids = _manager.dict()
+    return _manager
+
+
+def _kill(name: str, job: str) -> None:
+    """kills the worker stuck in job, the pool gets replaced on its next use"""
+    running = _pids.get(job) if _pids is not None else None
+    if running is None:
+        return
+    pid = running[0]
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    _executors.pop(name, None)
+
+
+def _started(job: str) -> float:
+    """time.time() the worker started job, None while it waits in the pool"""
+    running = _pids.get(job)
+    return running[1] if running else None
+
+
+def executor(name: str = "pdf") -> ProcessPoolExecutor:
+    """returns the process pool called name, creating it if needed"""
+    if name not in _executors:
+        _executors[name] = ProcessPoolExecutor(
+            max_workers=POOLS[name], initializer=_warm
+        )
+    return _executors[name]
+
+
+async def start() -> None:
+    """
+    creates the pools and waits until every worker is up and warm
+
+    call this before the pyrogram client starts, so the workers are forked
+    from a process without open connections
+    """
+    manager()
+    loop = asyncio.get_running_loop()
+    for name, workers in POOLS.items():
+        pids = await asyncio.gather(
+            *[
+                loop.run_in_executor(executor(name), _ping)
+                for _ in range(workers)
+            ]
+        )
+        logger.debug(f"❤ WORKERS [{name}]: {len(set(pids))} process(es) ready")
+
+
+async def submit(func, *args, **kwargs):
+    """
+    submits a job to the worker pool and returns its result
+
+    parameter:
+        func   : module level function (sync or async) to execute, must be picklable
+        args   : positional arguments for func (picklable)
+        kwargs : keyword arguments for func (picklable)
+
+    return:
+        whatever func returns, raised exceptions are re-raised here
+    """
+    return await submitTo("pdf", func, *args, **kwargs)
+
+
+async def submitTo(name: str, func, *args, **kwargs):
+    """
+    like submit(), but runs func in the pool called name [see POOLS]
+
+    the watchdog kills the worker when func runs out of its time budget
+    [watchdog.TIMEOUTS], which raises watchdog.Timeout here. the budget
+    starts when a worker picks func up, not while it waits in the pool
+    """
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        job = uuid.uuid4().hex
+        pool = executor(name)
+        try:
+            return await watchdog.guard(
+                func.__name__,
+                loop.run_in_executor(
+                    pool, functools.partial(_call, func, args, kwargs, job, _pids)
+                ),
+                onTimeout=functools.partial(_kill, name, job),
+                started=functools.partial(_started, job) if _pids is not None else None,
+            )
+        except BrokenProcessPool:
+            # a worker of the pool got killed while this job was running in
+            # another one of its workers: run it once more on a new pool
+            if _executors.get(name) is pool:
+                _executors.pop(name)
+            if attempt:
+                raise
+
+
+def shutdown(wait: bool = True) -> None:
+    """stops all worker processes and the shared state"""
+    global _manager, _pids
+
+    for name in list(_executors):
+        _executors.pop(name).shutdown(wait=wait, cancel_futures=True)
+    if _manager is not None:
+        _manager.shutdown()
+        _manager, _pids = None, None
+
+
+# If you have any questions or suggestions, please feel free to reach out.
+# Together, we can make this project even better, Happy coding!  XD
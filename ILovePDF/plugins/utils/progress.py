@@ -0,0 +1,211 @@
+# This module is part of https://github.com/nabilanavab/ilovepdf
+# Feel free to use and contribute to this project. Your contributions are welcome!
+# copyright ©️ 2021 nabilanavab
+
+
+file_name = "ILovePDF/plugins/utils/progress.py"
+
+import asyncio
+from . import pool
+from logger import logger
+
+# process holding the state shared by the bot and the worker processes
+_manager = None
+
+# job key → True, set by the bot process when the user cancels the job
+_cancelled = None
+
+# job key → (done, total) pages, set by the process running the job
+_progress = None
+
+# job key → (message, text, reply_markup) showing the progress
+_display: dict = {}
+
+
+class Cancelled(BaseException):
+    """
+    raised inside a job as soon as its token got cancelled
+
+    derived from BaseException [like asyncio.CancelledError], so the generic
+    `except Exception` of the file_process functions doesn't swallow it
+    """
+
+
+class Token:
+    """
+    cancellation token and progress channel of a job, shared between the bot
+    process and the worker process running it [a token without key is idle]
+
+    file_process functions report every finished page with step(), which
+    raises Cancelled when the user pressed cancel in the meantime [a shard
+    has the part it reports, "1|3" for the part 3 of the shard 1]
+    """
+
+    def __init__(
+        self, key: str = None, cancelled=None, progress=None, part: str = None
+    ) -> None:
+        self.key = key
+        self.part = part
+        self._cancelled = cancelled
+        self._progress = progress
+
+    @property
+    def _slot(self) -> str:
+        return self.key if self.part is None else f"{self.key}|{self.part}"
+
+    @property
+    def cancelled(self) -> bool:
+        if self._cancelled is None:
+            return False
+        return self._cancelled.get(self.key, False)
+
+    def step(self, done: int, total: int) -> None:
+        """reports done/total pages and stops the job if it got cancelled"""
+        if self._cancelled is None:
+            return
+        if self._cancelled.get(self.key, False):
+            raise Cancelled(self.key)
+        self._progress[self._slot] = (done, total)
+
+    def state(self) -> tuple:
+        """returns the last reported (done, total) pages"""
+        if self._progress is None:
+            return 0, 0
+        return self._progress.get(self._slot, (0, 0))
+
+    def shard(self, part: int) -> "Token":
+        """
+        token for one part of a job split across worker processes [eg: ocr],
+        cancelled together with the job but reporting its own pages [a shard
+        of a shard keeps the part of its parent, so their slots never collide]
+        """
+        if self.part is not None:
+            part = f"{self.part}|{part}"
+        return Token(self.key, self._cancelled, self._progress, part)
+
+    def forget(self) -> None:
+        """drops the reported pages of a shard"""
+        if self._progress is not None:
+            self._progress.pop(self._slot, None)
+
+
+def start() -> None:
+    """
+    creates the shared state of the tokens [in the process of pool.manager()]
+
+    call this before the pyrogram client starts, like pool.start()
+    """
+    global _manager, _cancelled, _progress
+
+    if _manager is None:
+        _manager = pool.manager()
+        _cancelled, _progress = _manager.dict(), _manager.dict()
+
+
+def shutdown() -> None:
+    """forgets the shared state [the process is stopped by pool.shutdown()]"""
+    global _manager, _cancelled, _progress
+
+    _manager, _cancelled, _progress = None, None, None
+
+
+def reset(key: str) -> None:
+    """forgets the state of a job [the previous job of a work directory]"""
+    _display.pop(key, None)
+    if _manager is not None:
+        _cancelled.pop(key, None)
+        _progress.pop(key, None)
+
+
+def cancel(key: str) -> None:
+    """cancels the running job of a key [if any]"""
+    if _manager is not None:
+        _cancelled[key] = True
+
+
+def release(key: str) -> None:
+    """
+    cancels a finished job and forgets its state a minute later [the keys of
+    queued jobs are never used again], so a worker still running one of its
+    parts stops at the next page first
+    """
+    cancel(key)
+    _display.pop(key, None)
+    asyncio.get_running_loop().call_later(60, reset, key)
+
+
+def get(key: str) -> Token:
+    """returns the token of a job [work.work "job"]"""
+    if _manager is None:
+        return Token()
+    return Token(key, _cancelled, _progress)
+
+
+def display(token: Token, message, text: str, reply_markup=None) -> None:
+    """
+    shows the progress of a job in message
+
+    parameter:
+        token        : token of the job
+        message      : progress message
+        text         : progress text with two placeholders [done, total]
+        reply_markup : buttons of the progress message [cancel]
+    """
+    _display[token.key] = (message, text, reply_markup)
+
+
+async def _follow(token: Token, job: asyncio.Future):
+    """
+    edits the progress message of the token until job is done [only the
+    token of the job itself, the shards running beside it don't take turns]
+    """
+    last = (0, 0)
+    try:
+        while not job.done():
+            await asyncio.wait({job}, timeout=3)
+            if token.part is not None or token.key not in _display:
+                continue
+            done, total = token.state()
+            if job.done() or (done, total) == last:
+                continue
+            last = (done, total)
+            message, text, reply_markup = _display[token.key]
+            try:
+                await message.edit(
+                    text=text.format(done, total), reply_markup=reply_markup
+                )
+            except Exception as Error:
+                logger.debug("🚫 %s: %s" % (file_name, Error))
+    finally:
+        # the job stops with the task awaiting it [eg: a cancelled pipeline]
+        job.cancel()
+    return job.result()
+
+
+async def submit(token: Token, func, *args, **kwargs):
+    """
+    runs func(*args, token=token, **kwargs) in the worker pool, the pages it
+    reports are shown in the progress message of the token [see display()]
+
+    parameter:
+        token  : token of the job
+        func   : file_process function with a token parameter
+
+    return:
+        whatever func returns, raises Cancelled if the user cancelled the job
+    """
+    job = asyncio.ensure_future(pool.submit(func, *args, token=token, **kwargs))
+    return await _follow(token, job)
+
+
+async def run(token: Token, func, *args, **kwargs):
+    """
+    like submit(), but awaits func in the event loop of the bot [for the
+    file_process functions that only wait on an external program]
+    """
+    job = asyncio.ensure_future(func(*args, token=token, **kwargs))
+    return await _follow(token, job)
+
+
+# If you have any questions or suggestions, please feel free to reach out.
+# Together, we can make this project even better, Happy coding!  XD
@@ -0,0 +1,412 @@
+# This module is part of https://github.com/nabilanavab/ilovepdf
+# Feel free to use and contribute to this project. Your contributions are welcome!
+# copyright ©️ 2021 nabilanavab
+
+
+file_name = "ILovePDF/plugins/utils/ranged.py"
+
+import re
+import zlib
+from collections import namedtuple
+from configs.config import settings
+
+# telegram streams files in chunks of 1 MB [stream_media offsets and limits]
+MB = 1024 * 1024
+
+# indirect reference of a pdf object
+Ref = namedtuple("Ref", "num gen")
+
+# entries of the document information dictionary → keys of fitz's metadata
+INFO = {
+    "Title": "title",
+    "Author": "author",
+    "Subject": "subject",
+    "Keywords": "keywords",
+    "Creator": "creator",
+    "Producer": "producer",
+    "CreationDate": "creationDate",
+    "ModDate": "modDate",
+    "Trapped": "trapped",
+}
+
+_WHITE = b" \t\r\n\f\x00"
+_DELIMITER = b"()<>[]{}/%"
+_REF = re.compile(rb"\s+(\d+)\s+R(?![^\s()<>\[\]{}/%])")
+_OBJ = re.compile(rb"\s*(\d+)\s+(\d+)\s+obj")
+_ESCAPE = {b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f"}
+
+
+class Unreadable(Exception):
+    """the structure can't be read from a few ranges, the pdf gets downloaded"""
+
+
+class Name(str):
+    """pdf name [/Name]"""
+
+
+class RangeFile:
+    """
+    lazy, range backed view of a telegram document: the 1 MB chunks a read
+    needs are streamed on demand and fetched once, at most
+    settings.INSPECT_CHUNKS of them
+    """
+
+    def __init__(self, bot, message, size: int) -> None:
+        self.bot = bot
+        self.message = message
+        self.size = size
+        self._chunks = {}
+
+    async def _chunk(self, index: int) -> bytes:
+        if index not in self._chunks:
+            if len(self._chunks) >= settings.INSPECT_CHUNKS:
+                raise Unreadable("too many ranges")
+            data = b""
+            async for part in self.bot.stream_media(self.message, offset=index, limit=1):
+                data += part
+            self._chunks[index] = data
+        return self._chunks[index]
+
+    async def read(self, start: int, length: int) -> bytes:
+        """bytes start..start+length of the file [less at the end of the file]"""
+        start, end = max(0, start), min(self.size, start + length)
+        if end <= start:
+            return b""
+        first, last = start // MB, (end - 1) // MB
+        data = b"".join([await self._chunk(index) for index in range(first, last + 1)])
+        return data[start - first * MB : end - first * MB]
+
+
+def _skip(data: bytes, pos: int) -> int:
+    """position of the next token [white space and comments skipped]"""
+    while pos < len(data):
+        if data[pos] in _WHITE:
+            pos += 1
+        elif data[pos : pos + 1] == b"%":
+            while pos < len(data) and data[pos] not in b"\r\n":
+                pos += 1
+        else:
+            break
+    return pos
+
+
+def _literal(data: bytes, pos: int) -> (bytes, int):
+    """(string) starting at pos [nested parentheses and escapes]"""
+    output, depth, pos = bytearray(), 1, pos + 1
+    while pos < len(data):
+        char = data[pos : pos + 1]
+        if char == b"\\":
+            following = data[pos + 1 : pos + 2]
+            if following in _ESCAPE:
+                output += _ESCAPE[following]
+                pos += 2
+            elif following in b"\r\n":
+                # line continuation
+                pos += 3 if data[pos + 1 : pos + 3] == b"\r\n" else 2
+            elif following and following in b"01234567":
+                octal = re.match(rb"[0-7]{1,3}", data[pos + 1 : pos + 4]).group()
+                output.append(int(octal, 8) & 0xFF)
+                pos += 1 + len(octal)
+            else:
+                output += following
+                pos += 2
+            continue
+        if char == b"(":
+            depth += 1
+        elif char == b")":
+            depth -= 1
+            if depth == 0:
+                return bytes(output), pos + 1
+        output += char
+        pos += 1
+    raise Unreadable("unterminated string")
+
+
+def _value(data: bytes, pos: int):
+    """
+    parses the pdf object starting at pos
+
+    return:
+        dict, list, bytes [strings], Name, int, float, bool, None or Ref and
+        the position after it
+    """
+    pos = _skip(data, pos)
+    if data.startswith(b"<<", pos):
+        result, pos = {}, pos + 2
+        while True:
+            pos = _skip(data, pos)
+            if data.startswith(b">>", pos):
+                return result, pos + 2
+            if pos >= len(data):
+                raise Unreadable("unterminated dictionary")
+            key, pos = _value(data, pos)
+            result[key], pos = _value(data, pos)
+    char = data[pos : pos + 1]
+    if char == b"[":
+        result, pos = [], pos + 1
+        while True:
+            pos = _skip(data, pos)
+            if data.startswith(b"]", pos):
+                return result, pos + 1
+            if pos >= len(data):
+                raise Unreadable("unterminated array")
+            item, pos = _value(data, pos)
+            result.append(item)
+    if char == b"(":
+        return _literal(data, pos)
+    if char == b"<":
+        end = data.index(b">", pos)
+        digits = re.sub(rb"\s", b"", data[pos + 1 : end])
+        return bytes.fromhex((digits + b"0" * (len(digits) % 2)).decode()), end + 1
+
+    end = pos + 1
+    while end < len(data) and data[end] not in _WHITE and data[end] not in _DELIMITER:
+        end += 1
+    token = data[pos:end]
+    if char == b"/":
+        name = re.sub(rb"#([0-9A-Fa-f]{2})", lambda hexa: bytes.fromhex(hexa.group(1).decode()), token[1:])
+        return Name(name.decode("latin-1")), end
+    if re.fullmatch(rb"[+-]?\d+", token):
+        ref = _REF.match(data, end)
+        if ref:
+            return Ref(int(token), int(ref.group(1))), ref.end()
+        return int(token), end
+    if re.fullmatch(rb"[+-]?(\d+\.?\d*|\.\d+)", token):
+        return float(token), end
+    if token in (b"true", b"false"):
+        return token == b"true", end
+    if token == b"null":
+        return None, end
+    raise Unreadable(f"unexpected token {token[:20]!r}")
+
+
+def _text(value) -> str:
+    """text string of the info dictionary [utf-16 with bom or pdfdoc]"""
+    if isinstance(value, bytes):
+        if value.startswith(b"\xfe\xff"):
+            return value[2:].decode("utf-16-be", "replace")
+        return value.decode("latin-1")
+    return str(value)
+
+
+def _decode(stream: bytes, info: dict) -> bytes:
+    """flate decoded stream [png predictors of xref streams]"""
+    filters = info.get("Filter")
+    filters = filters if isinstance(filters, list) else [filters] if filters else []
+    if any(name != "FlateDecode" for name in filters):
+        raise Unreadable(f"filter {filters}")
+    if filters:
+        stream = zlib.decompress(stream)
+
+    parms = info.get("DecodeParms") or {}
+    if isinstance(parms, list):
+        parms = parms[0] or {}
+    if parms.get("Predictor", 1) < 10:
+        return stream
+
+    columns = parms.get("Columns", 1)
+    output, previous = bytearray(), bytearray(columns)
+    for row in range(0, len(stream), columns + 1):
+        kind, line = stream[row], bytearray(stream[row + 1 : row + 1 + columns])
+        for i in range(len(line)):
+            left = line[i - 1] if i else 0
+            up, corner = previous[i], previous[i - 1] if i else 0
+            if kind == 1:
+                line[i] = (line[i] + left) & 0xFF
+            elif kind == 2:
+                line[i] = (line[i] + up) & 0xFF
+            elif kind == 3:
+                line[i] = (line[i] + (left + up) // 2) & 0xFF
+            elif kind == 4:
+                estimate = left + up - corner
+                nearest = min(
+                    (abs(estimate - left), left),
+                    (abs(estimate - up), up),
+                    (abs(estimate - corner), corner),
+                    key=lambda candidate: candidate[0],
+                )[1]
+                line[i] = (line[i] + nearest) & 0xFF
+        output += line
+        previous = line
+    return bytes(output)
+
+
+class Inspector:
+    """reads the structure of a pdf [xref, trailer, a few objects] from ranges"""
+
+    def __init__(self, file: RangeFile) -> None:
+        self.file = file
+        # object number → (type, field 2, field 3) of the xref
+        self.entries = {}
+        self.trailer = {}
+
+    async def _raw(self, offset: int, size: int = 64 * 1024) -> (dict, bytes):
+        """the object at offset: its value and its stream [None without one]"""
+        data = await self.file.read(offset, size)
+        head = _OBJ.match(data)
+        if not head:
+            raise Unreadable(f"no object at {offset}")
+        value, pos = _value(data, head.end())
+        pos = _skip(data, pos)
+        if not data.startswith(b"stream", pos):
+            return value, None
+
+        start = pos + 6
+        start += 2 if data[start : start + 2] == b"\r\n" else 1
+        length = value.get("Length")
+        if isinstance(length, Ref):
+            length = await self.resolve(length)
+        if not isinstance(length, int):
+            raise Unreadable("stream without length")
+        if start + length > len(data):
+            if size >= self.file.size:
+                raise Unreadable("truncated stream")
+            return await self._raw(offset, start + length + 64)
+        return value, data[start : start + length]
+
+    async def _table(self, offset: int) -> dict:
+        """reads a cross reference table, returns its trailer"""
+        data = await self.file.read(offset, 64 * 1024)
+        pos = _skip(data, 4)
+        while True:
+            section = re.match(rb"(\d+)\s+(\d+)[ \t]*\r?\n?", data[pos:])
+            if not section:
+                break
+            first, count = int(section.group(1)), int(section.group(2))
+            pos += section.end()
+            rows = await self.file.read(offset + pos, count * 20)
+            for i in range(count):
+                row = rows[i * 20 : i * 20 + 20].split()
+                if len(row) == 3 and first + i not in self.entries:
+                    self.entries[first + i] = (
+                        1 if row[2] == b"n" else 0, int(row[0]), int(row[1])
+                    )
+            offset, pos = offset + pos + count * 20, 0
+            data = await self.file.read(offset, 64 * 1024)
+            pos = _skip(data, 0)
+        if not data.startswith(b"trailer", pos):
+            raise Unreadable("no trailer")
+        trailer, _ = _value(data, pos + 7)
+        return trailer
+
+    async def _stream(self, offset: int) -> dict:
+        """reads a cross reference stream, returns its dictionary"""
+        info, stream = await self._raw(offset)
+        if info.get("Type") != "XRef" or stream is None:
+            raise Unreadable("no cross reference")
+        widths = info["W"]
+        rows = _decode(stream, info)
+        index = info.get("Index", [0, info["Size"]])
+        size, pos = sum(widths), 0
+        for first, count in zip(index[::2], index[1::2]):
+            for num in range(first, first + count):
+                fields, at = [], pos
+                for width in widths:
+                    fields.append(int.from_bytes(rows[at : at + width], "big"))
+                    at += width
+                pos += size
+                if widths[0] == 0:
+                    fields[0] = 1
+                if num not in self.entries:
+                    self.entries[num] = tuple(fields)
+        return info
+
+    async def xref(self, offset: int) -> None:
+        """reads the cross reference chain starting at offset [newest first]"""
+        seen = set()
+        while offset is not None and offset not in seen and len(seen) < 32:
+            seen.add(offset)
+            data = await self.file.read(offset, 16)
+            pos = _skip(data, 0)
+            if data.startswith(b"xref", pos):
+                trailer = await self._table(offset + pos)
+                if isinstance(trailer.get("XRefStm"), int):
+                    await self._stream(trailer["XRefStm"])
+            else:
+                trailer = await self._stream(offset)
+            for key, value in trailer.items():
+                self.trailer.setdefault(key, value)
+            offset = trailer.get("Prev")
+
+    async def resolve(self, value):
+        """the value of an indirect reference [anything else as it is]"""
+        if not isinstance(value, Ref):
+            return value
+        kind, field, index = self.entries.get(value.num, (0, 0, 0))
+        if kind == 1:
+            return (await self._raw(field))[0]
+        if kind == 2:
+            # object inside a compressed object stream
+            info, stream = await self._raw(self.entries[field][1])
+            data = _decode(stream, info)
+            header = data[: info["First"]].split()
+            for num, at in zip(header[::2], header[1::2]):
+                if int(num) == value.num:
+                    return _value(data, info["First"] + int(at))[0]
+        return None
+
+
+async def inspect(bot, message) -> dict:
+    """
+    fingerprint of a pdf document message from the few ranges holding its
+    structure, without downloading it: the linearization dictionary [page
+    count hint of the first page] or the trailer at the end of the file,
+    the cross reference and the objects of the catalog and the info
+
+    return:
+        pages, encrypted, metadata and version [like catalog._scan, without
+        the image, font and text statistics], raises Unreadable
+    """
+    file = RangeFile(bot, message, message.document.file_size)
+    inspector = Inspector(file)
+
+    head = await file.read(0, 1024)
+    version = re.search(rb"%PDF-(\d\.\d)", head)
+    if not version:
+        raise Unreadable("not a pdf")
+
+    pages, start = None, None
+    linearized = _OBJ.search(head)
+    if linearized and b"/Linearized" in head:
+        hint, after = _value(head, linearized.end())
+        if isinstance(hint, dict) and hint.get("L") == file.size:
+            pages = hint.get("N")
+            # first page cross reference right after the dictionary
+            data = await file.read(0, 64 * 1024)
+            end = data.find(b"endobj", after)
+            if end != -1:
+                start = _skip(data, end + 6)
+
+    if start is None:
+        tail = await file.read(file.size - 1024, 1024)
+        startxref = re.findall(rb"startxref\s+(\d+)", tail)
+        if not startxref:
+            raise Unreadable("no startxref")
+        start = int(startxref[-1])
+
+    await inspector.xref(start)
+    if not isinstance(pages, int):
+        root = await inspector.resolve(inspector.trailer.get("Root"))
+        tree = await inspector.resolve(root.get("Pages"))
+        pages = await inspector.resolve(tree.get("Count"))
+
+    encrypted = inspector.trailer.get("Encrypt") is not None
+    metadata = {"format": f"PDF {version.group(1).decode()}"}
+    info = await inspector.resolve(inspector.trailer.get("Info"))
+    if isinstance(info, dict) and not encrypted:
+        for key, value in info.items():
+            value = _text(await inspector.resolve(value))
+            if key in INFO and value:
+                metadata[INFO[key]] = value
+    return {
+        "pages": int(pages),
+        "encrypted": encrypted,
+        "metadata": metadata,
+        "version": metadata["format"],
+        # only the structure was read [catalog.py]
+        "partial": True,
+    }
+
+
+# If you have any questions or suggestions, please feel free to reach out.
+# Together, we can make this project even better, Happy coding!  XD
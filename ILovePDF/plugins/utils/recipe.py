@@ -0,0 +1,137 @@
+# This module is part of https://github.com/nabilanavab/ilovepdf
+# Feel free to use and contribute to this project. Your contributions are welcome!
+# copyright ©️ 2021 nabilanavab
+
+
+file_name = "ILovePDF/plugins/utils/recipe.py"
+
+from configs.db import dataBASE
+from pyrogram.types import InlineKeyboardButton
+
+if dataBASE.MONGODB_URI:
+    from database import db
+
+# aio option → values a recipe may store for it [True: switch, str: any text]
+OPTIONS = {
+    "metadata": (True,),
+    "preview": (True,),
+    "compress": (True,),
+    "text": ("text", "html", "json"),
+    "rotate": ("rot90", "rot180", "rot270"),
+    "format": ("format1", "format2v", "format2h", "format3v", "format3h", "format4"),
+    "encrypt": str,
+    "watermark": str,
+    "rename": str,
+}
+
+# recipes a user can keep
+MAX = 5
+
+# longest name in bytes [the name is part of the callback data, 64 bytes max]
+NAME = 40
+
+
+def fromWorks(WORKS: dict) -> dict:
+    """
+    recipe of the aio options [__aio__.parseAIO]: only the options switched on
+
+    return:
+        option → value, empty if no option is switched on
+    """
+    return {option: value for option, value in WORKS.items() if value and option in OPTIONS}
+
+
+def compile(recipe: dict) -> dict:
+    """
+    checks a stored recipe and builds the aio options out of it, so it
+    runs through __aio__.runAIO like the aio keyboard does
+
+    return:
+        WORKS : every aio option, False if it is switched off
+                [None if the recipe is broken or does nothing]
+    """
+    WORKS = {option: False for option in OPTIONS}
+    for option, value in (recipe or {}).items():
+        allowed = OPTIONS.get(option)
+        if allowed is None:
+            return None
+        if allowed is str:
+            if not isinstance(value, str) or not value:
+                return None
+        elif value not in allowed:
+            return None
+        WORKS[option] = value
+    return WORKS if any(WORKS.values()) else None
+
+
+def validName(name: str) -> bool:
+    """names can't break the callback data [recipe|run|name]"""
+    return bool(name) and len(name.encode()) <= NAME and not name.startswith("/")
+
+
+async def get(user_id: int) -> dict:
+    """
+    return:
+        name → recipe of the user [empty without a database]
+    """
+    if not dataBASE.MONGODB_URI:
+        return {}
+    try:
+        return await db.get_key(user_id, "recipes") or {}
+    except Exception:
+        # user not in the database yet
+        return {}
+
+
+async def save(user_id: int, name: str, recipe: dict) -> bool:
+    """
+    stores a recipe of the user [replaces the one with the same name]
+
+    return:
+        False if the user already has MAX recipes
+    """
+    recipes = await get(user_id)
+    if name not in recipes and len(recipes) >= MAX:
+        return False
+    recipes[name] = recipe
+    await db.set_key(user_id, "recipes", recipes)
+    return True
+
+
+async def delete(user_id: int, name: str) -> None:
+    """removes a recipe of the user [and the default, if it was the default]"""
+    recipes = await get(user_id)
+    recipes.pop(name, None)
+    await db.set_key(user_id, "recipes", recipes or None)
+    if await default(user_id) == name:
+        await db.set_key(user_id, "recipe", None)
+
+
+async def default(user_id: int) -> str:
+    """
+    return:
+        name of the recipe applied to every pdf of the user [None if not set]
+    """
+    if not dataBASE.MONGODB_URI:
+        return None
+    try:
+        return await db.get_key(user_id, "recipe")
+    except Exception:
+        return None
+
+
+async def setDefault(user_id: int, name: str = None) -> None:
+    """applies the recipe to every pdf of the user [None: to none of them]"""
+    await db.set_key(user_id, "recipe", name)
+
+
+def buttons(recipes: dict) -> list:
+    """
+    rows of one-tap buttons applying the recipes to a pdf [pdf reply keyboard]
+    """
+    row = [InlineKeyboardButton(f"⚡ {name}", f"recipe|run|{name}") for name in recipes]
+    return [row[i : i + 2] for i in range(0, len(row), 2)]
+
+
+# If you have any questions or suggestions, please feel free to reach out.
+# Together, we can make this project even better, Happy coding!  XD
@@ -5,7 +5,7 @@
 
 file_name = "ILovePDF/plugins/utils/render.py"
 
-import fitz
+from . import catalog
 from .util import *
 from plugins import *
 from .work import work
@@ -119,7 +119,8 @@ async def gSF(b: int, factor: int = 2**10, suffix: str = "B") -> str:
 
 # CHECKS PDF CODEC, IS ENCRYPTED OR NOT
 async def checkPdf(
-    file_path: str, callbackQuery, lang_code: str = settings.DEFAULT_LANG
+    file_path: str, callbackQuery, lang_code: str = settings.DEFAULT_LANG,
+    file_unique_id: str = None, entry: dict = None,
 ):
     """
     Check if the PDF file is encrypted and extract its metadata.
@@ -128,61 +129,69 @@ async def checkPdf(
         file_path (str): Path to the PDF file.
         callbackQuery: Callback query object for editing messages.
         lang_code (str): Language code for translation (default is set in config).
+        file_unique_id (str): Records the fingerprint of the file in the catalog.
+        entry (dict): Fingerprint from the catalog, the file isn't needed then
+            [checked before the job is queued: the work directory of the chat
+            is left alone, it may hold a running job].
         
     Returns:
         tuple: A tuple containing the status ("encrypted", "pass", or "notPdf") and page count or error message.
     """
+    # a job checking the pdf it downloaded cleans up after a failed check
+    inJob = entry is None
     try:
         # Translate message chunks
         CHUNK, _ = await translate(text = "PDF_MESSAGE", lang_code = lang_code)
 
         replyMessage = callbackQuery.message.reply_to_message
 
-        # open pdf file from file_path
-        with fitz.open(file_path) as doc:
-            pdfMetaData = (
-                "".join(
-                    f"`{i} : {doc.metadata[i]}`\n"
-                    for i in doc.metadata
-                    if doc.metadata[i] != ""
+        # fingerprint of the pdf [plugins/utils/catalog.py]
+        if entry is None:
+            entry = await catalog.scan(file_path, file_unique_id)
+        pdfMetaData = catalog.metadata(entry)
+
+        if entry["encrypted"]:
+            text = (
+                CHUNK["encrypt"].format(
+                    replyMessage.document.file_name,
+                    await gSF(replyMessage.document.file_size),
                 )
-                if doc.metadata
-                else ""
+                + "\n\n" + CHUNK["pg"].format(entry["pages"])
+                + "\n\n" + pdfMetaData
             )
+            try:
+                await callbackQuery.edit_message_text(
+                    text = text,
+                    reply_markup = await createBUTTON(CHUNK["encryptCB"], order = 11),
+                )
+                # the checks of __index__ read the page count from the message
+                callbackQuery.message.text = text
 
-            if doc.is_encrypted:
-                try:
-                    await callbackQuery.edit_message_text(
-                        text = CHUNK["encrypt"].format(
-                            replyMessage.document.file_name,
-                            await gSF(replyMessage.document.file_size),
-                        )
-                        + "\n\n" + CHUNK["pg"].format(doc.page_count)
-                        + "\n\n" + pdfMetaData,
-                        reply_markup = await createBUTTON(CHUNK["encryptCB"], order = 11),
-                    )
+            except Exception:
+                pass
 
-                except Exception:
-                    pass
+            if inJob and callbackQuery.data != "work|decrypt":
+                await work(callbackQuery, "delete", False)
 
-                if callbackQuery.data != "work|decrypt":
-                    await work(callbackQuery, "delete", False)
+            return "encrypted", entry["pages"]
 
-                return "encrypted", doc.page_count
-            
-            else:
-                if callbackQuery.data != "#merge":
-                    await callbackQuery.edit_message_text(
-                        text = CHUNK["pdf"].format(
-                            replyMessage.document.file_name,
-                            await gSF(replyMessage.document.file_size),
-                        )
-                        + "\n\n" + CHUNK["pg"].format(doc.page_count)
-                        + "\n\n" + pdfMetaData,
-                        reply_markup = callbackQuery.message.reply_markup,
+        else:
+            if callbackQuery.data != "#merge":
+                text = (
+                    CHUNK["pdf"].format(
+                        replyMessage.document.file_name,
+                        await gSF(replyMessage.document.file_size),
                     )
+                    + "\n\n" + CHUNK["pg"].format(entry["pages"])
+                    + "\n\n" + pdfMetaData
+                )
+                await callbackQuery.edit_message_text(
+                    text = text,
+                    reply_markup = callbackQuery.message.reply_markup,
+                )
+                callbackQuery.message.text = text
 
-                return "pass", doc.page_count
+            return "pass", entry["pages"]
             
     # CODEC ERROR
     except Exception as Error:
@@ -191,7 +200,8 @@ async def checkPdf(
             text = CHUNK["error"],
             reply_markup = await createBUTTON(CHUNK["errorCB"], order = 11),
         )
-        await work(callbackQuery, "delete", False)
+        if inJob:
+            await work(callbackQuery, "delete", False)
         return "notPdf", "🚫"
 
 
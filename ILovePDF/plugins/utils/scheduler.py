@@ -0,0 +1,367 @@
+# This module is part of https://github.com/nabilanavab/ilovepdf
+# Feel free to use and contribute to this project. Your contributions are welcome!
+# copyright ©️ 2021 nabilanavab
+
+
+file_name = "ILovePDF/plugins/utils/scheduler.py"
+
+import os
+import math
+import time
+import asyncio
+from . import admission
+from logger import logger
+from configs.config import settings
+from collections import OrderedDict, deque
+
+# latency classes, every lane has its own queue and concurrency budget so
+# a cheap structural job never waits behind a long rasterising job
+LANES = {
+    "fast": settings.FAST_JOBS,
+    "normal": settings.MAX_JOBS,
+    "heavy": settings.HEAVY_JOBS,
+}
+
+# lane → chat → jobs waiting for a slot. the order of the chats is the
+# round-robin order, a chat that just got a slot is moved to the end
+_waiting: dict = {lane: OrderedDict() for lane in LANES}
+
+# job key → [work directory, lane, time.time() when the job got its slot]
+_running: dict = {}
+
+# lane → moving average of the job duration in seconds, used for the ETA
+_average: dict = {"fast": 5.0, "normal": 30.0, "heavy": 120.0}
+
+# seconds a job held back by the admission control may be overtaken by
+# smaller jobs, after that nothing else starts until it fits
+HOLD = 120
+
+# seconds a job may be held back by the admission control at all, then it
+# gets the "server too busy" reply instead of waiting forever
+HOLD_TIMEOUT = 900
+
+# seconds a job waits for a work directory no job of the queue holds [a job
+# outside the queue, eg: images to pdf, or left by a crash], then it gets
+# the "work in progress" reply
+DIRECTORY_WAIT = 60
+
+# job key → why join() refused the job [INDEX text: queueFull, draining,
+# inWork, overloaded]
+_refused: dict = {}
+
+# shutdown [plugins/utils/drain.py]: 1 no job gets a slot anymore, the
+# running jobs finish, 2 the waiting jobs give up their place too
+_draining = 0
+
+
+class Job:
+    """
+    a job waiting in the queue, identified by its own key [jobs of a chat
+    share the work directory, one after the other]
+    """
+
+    def __init__(
+        self, path: str, lane: str, need: tuple = (0, 0), key: str = None
+    ) -> None:
+        self.path = path
+        self.key = key or path
+        self.lane = lane
+        self.need = need
+        self.owner = path.split("/")[2]
+        self.ready = asyncio.Event()
+        # time.time() since the job waits for memory/disk [0: it doesn't]
+        self.blocked = 0
+        # time.time() since its directory exists without a running job
+        self.stale = 0
+
+
+class Notify:
+    """
+    keeps a single "queued" message updated with the position and ETA of a job
+
+    parameter:
+        message : message the queue status is replied to
+        text    : queue status text with two placeholders [position, eta]
+        busy    : optional text shown instead while the server is short of
+                  memory or disk [same placeholders]
+    """
+
+    def __init__(self, message, text: str, busy: str = None) -> None:
+        self.message = message
+        self.text = text
+        self.busy = busy
+        self.queued = False
+        self.msg = None
+
+    async def __call__(self, position: int, eta: int, busy: bool = False) -> None:
+        self.queued = True
+        minutes, seconds = divmod(eta, 60)
+        text = (self.busy if busy and self.busy else self.text).format(
+            position, f"{minutes}m, {seconds}s" if minutes else f"{seconds}s"
+        )
+        try:
+            if self.msg is None:
+                self.msg = await self.message.reply_text(text, quote=True)
+            else:
+                await self.msg.edit(text)
+        except Exception:
+            pass
+
+    async def close(self) -> None:
+        if self.msg is not None:
+            try:
+                await self.msg.delete()
+            except Exception:
+                pass
+
+
+def _count(lane: str) -> int:
+    """number of running jobs in a lane"""
+    return sum(1 for running in _running.values() if running[1] == lane)
+
+
+def _admit(job: Job, held: Job) -> bool:
+    """True if the server has the memory and disk the job needs"""
+    need = job.need
+    if held is not None and held is not job:
+        # others only start if the held job would still fit after them
+        need = tuple(a + b for a, b in zip(job.need, held.need))
+    if admission.fits(need):
+        job.blocked = 0
+        return True
+    job.blocked = job.blocked or time.time()
+    return False
+
+
+def _dispatch() -> None:
+    """hands out free slots of every lane to the waiting jobs, one chat at a time"""
+    for key, (path, lane, started) in list(_running.items()):
+        # work directory is removed without leave() [eg: bot.stop_transmission]
+        if not os.path.exists(path) and time.time() - started > 10:
+            del _running[key]
+            admission.release(key)
+
+    if _draining:
+        return
+
+    # the oldest job held back by the admission control for too long
+    held = min(
+        (
+            job
+            for waiting in _waiting.values()
+            for queue in waiting.values()
+            for job in queue
+            if job.blocked and time.time() - job.blocked > HOLD
+        ),
+        key=lambda job: job.blocked,
+        default=None,
+    )
+
+    for lane, waiting in _waiting.items():
+        served = True
+        while served and waiting and _count(lane) < LANES[lane]:
+            served = False
+            for owner in list(waiting):
+                if _count(lane) >= LANES[lane]:
+                    break
+                queue = waiting[owner]
+                busy = {running[0] for running in _running.values()}
+                for job in queue:
+                    # a chat never runs two jobs at once, they share a directory
+                    if job.path in busy:
+                        job.stale = 0
+                    elif os.path.exists(job.path):
+                        job.stale = job.stale or time.time()
+                    else:
+                        job.stale = 0
+                        if not _admit(job, held):
+                            # server busy: the next chat may have a smaller job
+                            break
+                        queue.remove(job)
+                        _running[job.key] = [job.path, lane, time.time()]
+                        admission.reserve(job.key, job.need)
+                        job.ready.set()
+                        waiting.move_to_end(owner)
+                        served = True
+                        break
+                if not queue:
+                    del waiting[owner]
+
+
+def position(job: Job) -> int:
+    """position of the job in the queue of its lane, starting from 1"""
+    waiting = _waiting[job.lane]
+    index = waiting[job.owner].index(job)
+    # every chat is served once per round, so all jobs of earlier rounds
+    # and the chats in front of this one in its own round are ahead
+    ahead = sum(min(len(queue), index) for queue in waiting.values())
+    for owner, queue in waiting.items():
+        if owner == job.owner:
+            break
+        ahead += len(queue) > index
+    return ahead + 1
+
+
+def eta(position: int, lane: str = "normal") -> int:
+    """estimated waiting time in seconds for a position in the queue of a lane"""
+    return int(math.ceil(position / LANES[lane]) * _average[lane])
+
+
+def status() -> dict:
+    """returns the current load of every lane"""
+    return {
+        lane: {
+            "running": _count(lane),
+            "waiting": sum(len(queue) for queue in _waiting[lane].values()),
+            "chats": len(_waiting[lane]),
+            "limit": LANES[lane],
+            "average": int(_average[lane]),
+        }
+        for lane in LANES
+    }
+
+
+def drain() -> None:
+    """stops handing out slots, the running jobs keep theirs"""
+    global _draining
+    _draining = max(_draining, 1)
+
+
+def stop() -> None:
+    """lets the waiting jobs return from join() [without a slot]"""
+    global _draining
+    _draining = 2
+
+
+def draining() -> bool:
+    """True once the shutdown started"""
+    return bool(_draining)
+
+
+def running() -> list:
+    """keys of the jobs holding a slot, in any lane"""
+    return list(_running)
+
+
+def holds(key: str) -> bool:
+    """True if the job got its slot and didn't leave() yet"""
+    return key in _running
+
+
+def holder(path: str) -> str:
+    """key of the job running in a work directory [None if there is none]"""
+    for key, running in _running.items():
+        if running[0] == path:
+            return key
+    return None
+
+
+def setLimit(limit: int, lane: str = "normal") -> None:
+    """changes the concurrency budget of a lane, waiting jobs are started if possible"""
+    LANES[lane] = max(1, int(limit))
+    _dispatch()
+
+
+async def join(
+    path: str, notify=None, lane: str = "normal", need: tuple = (0, 0),
+    key: str = None
+) -> bool:
+    """
+    waits until the job gets a slot in its lane
+
+    parameter:
+        path   : work directory of the job [work/<root>/<chat>[/<user>], work.ROOT]
+        key    : key of the job, unique even among the jobs of a chat [path]
+        notify : optional coroutine function called with (position, eta, busy)
+                 whenever the position of the job or its busy state changes
+        lane   : latency class of the job ["fast", "normal", "heavy"]
+        need   : estimated (memory, disk) of the job [admission.estimate]
+
+    return:
+        True   : when the job got a slot, leave(key) must be called afterwards
+        False  : when the queue is full, the bot shuts down, the work
+                 directory stays busy or the server stays short of memory
+                 or disk [the reason: refusal(key)]
+    """
+    key = key or path
+    if _draining:
+        _refused[key] = "draining"
+        return False
+
+    owner = path.split("/")[2]
+    waiting = sum(
+        len(queue) for chats in _waiting.values() for queue in chats.values()
+    )
+    chat = sum(len(chats.get(owner, ())) for chats in _waiting.values())
+    if waiting >= settings.QUEUE_SIZE or chat >= settings.CHAT_QUEUE_SIZE:
+        _refused[key] = "queueFull"
+        return False
+
+    job = Job(path, lane, need, key)
+    _waiting[lane].setdefault(owner, deque()).append(job)
+    _dispatch()
+
+    last = None
+    try:
+        while not job.ready.is_set():
+            now = position(job), bool(job.blocked)
+            if notify is not None and now != last:
+                last = now
+                await notify(now[0], eta(now[0], lane), now[1])
+            try:
+                await asyncio.wait_for(job.ready.wait(), 5)
+            except asyncio.TimeoutError:
+                _dispatch()
+            if job.ready.is_set():
+                break
+            if _draining == 2:
+                return _refuse(job, "draining")
+            if job.stale and time.time() - job.stale > DIRECTORY_WAIT:
+                return _refuse(job, "inWork")
+            if job.blocked and time.time() - job.blocked > HOLD_TIMEOUT:
+                return _refuse(job, "overloaded")
+    except BaseException:
+        # handler got cancelled while waiting in the queue
+        if job.ready.is_set():
+            leave(job.key)
+        elif job in _waiting[lane].get(owner, ()):
+            _waiting[lane][owner].remove(job)
+            if not _waiting[lane][owner]:
+                del _waiting[lane][owner]
+        raise
+    return True
+
+
+def _refuse(job: Job, reason: str) -> bool:
+    """takes a waiting job out of the queue, join() returns False"""
+    _waiting[job.lane][job.owner].remove(job)
+    if not _waiting[job.lane][job.owner]:
+        del _waiting[job.lane][job.owner]
+    _refused[job.key] = reason
+    return False
+
+
+def refusal(key: str) -> str:
+    """why join() refused the job of key [an INDEX text], forgets it"""
+    return _refused.pop(key, "queueFull")
+
+
+def leave(key: str) -> None:
+    """
+    releases the slot of a job, call it once its work directory is removed:
+    the next job of the chat only starts in a directory that doesn't exist
+    """
+    running = _running.pop(key, None)
+    admission.release(key)
+    if running is not None:
+        _, lane, started = running
+        _average[lane] = 0.8 * _average[lane] + 0.2 * (time.time() - started)
+        logger.debug(
+            f"⏳ QUEUE [{lane}]: {_count(lane)} running, "
+            f"{sum(len(queue) for queue in _waiting[lane].values())} waiting"
+        )
+    _dispatch()
+
+
+# If you have any questions or suggestions, please feel free to reach out.
+# Together, we can make this project even better, Happy coding!  XD
@@ -0,0 +1,106 @@
+# This module is part of https://github.com/nabilanavab/ilovepdf
+# Feel free to use and contribute to this project. Your contributions are welcome!
+# copyright ©️ 2021 nabilanavab
+
+
+file_name = "ILovePDF/plugins/utils/watchdog.py"
+
+import os
+import time
+import asyncio
+from logger import logger
+from configs.config import settings
+
+# operation → seconds it may run before the watchdog kills or abandons it.
+# operations are the worker functions [func.__name__] and the external
+# programs/services, everything else gets "default". override any of them
+# by TIMEOUTS="ocrPDF=3600 gs=600"
+TIMEOUTS = {
+    "default": 300,
+    # single-shot structural saves
+    "encryptPDF": 120,
+    "decryptPDF": 120,
+    "deletePDFPg": 120,
+    "pdfHeader": 120,
+    "stampPDF": 120,
+    "_pageCount": 60,
+    "_split": 120,
+    # page by page rasterising
+    "blackAndWhitePdf": 900,
+    "saturatePDF": 900,
+    "invertPDF": 900,
+    "aioPDF": 900,
+    "_render": 900,
+    "_stitch": 600,
+    "_ocr": 900,           # a single shard of ocrPDF
+    # external programs and services
+    "gs": 900,
+    "wkhtmltopdf": 120,
+    "convertapi": 180,
+    "_word": 300,
+    "_pymu": 300,
+}
+for override in os.environ.get("TIMEOUTS", "").split():
+    operation, _, seconds = override.partition("=")
+    if seconds.isdigit():
+        TIMEOUTS[operation] = int(seconds)
+
+
+class Timeout(Exception):
+    """raised when an operation ran out of its time budget"""
+
+    def __init__(self, operation: str, seconds: int) -> None:
+        super().__init__(f"{operation} took longer than {seconds}s")
+        self.operation = operation
+        self.seconds = seconds
+
+
+def budget(operation: str) -> int:
+    """returns the time budget of an operation in seconds"""
+    return TIMEOUTS.get(operation, TIMEOUTS["default"])
+
+
+async def guard(operation: str, job, onTimeout=None, started=None):
+    """
+    awaits job within the time budget of operation and logs how long it took
+
+    parameter:
+        operation : key of the TIMEOUTS table
+        job       : awaitable running the operation
+        onTimeout : optional function called when the budget is exceeded,
+                    to kill what still runs [the awaitable is abandoned]
+        started   : optional function returning the time.time() the job began
+                    to run, None while it waits [in the queue of a pool]: the
+                    budget only counts the time it runs
+
+    return:
+        whatever job returns, raises Timeout when the budget is exceeded
+    """
+    seconds = budget(operation)
+    job = asyncio.ensure_future(job)
+    began = None if started else time.time()
+    try:
+        while True:
+            began = began or started()
+            # waiting jobs are asked again every second
+            timeout = 1 if began is None else began + seconds - time.time()
+            if timeout <= 0:
+                raise asyncio.TimeoutError()
+            done, _ = await asyncio.wait({job}, timeout=timeout)
+            if done:
+                return job.result()
+    except asyncio.TimeoutError:
+        logger.debug("⏱ %s: %s killed after %ss" % (file_name, operation, seconds))
+        if onTimeout is not None:
+            onTimeout()
+        raise Timeout(operation, seconds)
+    finally:
+        # the job stops with the task awaiting it [like asyncio.wait_for]
+        job.cancel()
+        elapsed = time.time() - began if began else 0
+        if elapsed > 1:
+            logger.debug("⏱ %s: %.1fs / %ss" % (operation, elapsed, seconds))
+
+
+# If you have any questions or suggestions, please feel free to reach out.
+# Together, we can make this project even better, Happy coding!  XD
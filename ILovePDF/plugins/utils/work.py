@@ -5,12 +5,26 @@
 
 file_name = "ILovePDF/plugins/utils/work.py"
 
+import uuid
 from plugins import *
+from . import scheduler, progress, drain
 from pyrogram import enums
+from configs.config import settings
+
+# work directories of the running /batch jobs, every file of a batch runs in
+# a directory of its own and gets cancelled on its own [plugins/dm/batch.py]
+BATCHES: set = set()
+
+# work root of this process, every worker of a host gets its own one so that
+# a restart wipes only the directories of its own jobs [__main__.py]
+ROOT = (
+    f"work/{settings.WORKER_ID}" if settings.ROLE == "worker" else "work/nabilanavab"
+)
 
 
 async def work(
-    message, work: str = "check", mtype: bool = True
+    message, work: str = "check", mtype: bool = True,
+    notify = None, lane: str = "normal", need: tuple = (0, 0)
 ) -> str:
     """
     program will now create a brand new directory to store all of your
@@ -18,38 +32,50 @@ async def work(
 
     Parameters:
     - message: The message or callback query from the user.
-    - work: Action to perform: 'create', 'check', or 'delete'.
-    - mtype: True if the message is a regular message, False if it's a callback query.
+    - work: Action to perform: 'create', 'queue', 'check', 'path', 'job' or 'delete'.
+    - mtype: True if the message is a regular message, False if it's a callback query
+      [a callback query with a part attribute works on one file of a batch].
+    - notify: For 'queue', coroutine called with the position and ETA of the job.
+    - lane: For 'queue', latency class of the job: 'fast', 'normal' or 'heavy'.
+    - need: For 'queue', estimated (memory, disk) of the job [admission.estimate].
 
     Returns:
     - The path of the directory if created or checked, otherwise False.
+    - For 'job', the key of the job [its progress token, see progress.get].
+    - For 'queue', False only if the global job queue is full, the bot shuts down,
+      the directory or the server stays busy [message.refused: the INDEX text telling why].
+    - For 'delete', False if a running batch holds the directory [nothing is removed].
     """
     if mtype:
         
         if message.chat.type == enums.ChatType.PRIVATE:
             # Create a path for private chats
-            path = f"work/nabilanavab/{message.chat.id}"
+            path = f"{ROOT}/{message.chat.id}"
         
         else:
             # Create a path for group chats including user ID
-            pat = f"work/nabilanavab/{message.chat.id}"
-            path = f"work/nabilanavab/{message.chat.id}/{message.from_user.id}"
+            pat = f"{ROOT}/{message.chat.id}"
+            path = f"{ROOT}/{message.chat.id}/{message.from_user.id}"
     
     else:
         
         # If the message is a callback query
         if message.message is None:
             # inline query download cant get message from callback
-            path = f"work/nabilanavab/inline{message.data.split('|')[2]}"
+            path = f"{ROOT}/inline{message.data.split('|')[2]}"
         
         elif message.message.chat.type == enums.ChatType.PRIVATE:
             # Create a path for private chats in callback queries
-            path = f"work/nabilanavab/{message.message.chat.id}"
+            path = f"{ROOT}/{message.message.chat.id}"
         
         else:
             # Create a path for group chats including user ID
-            pat = f"work/nabilanavab/{message.message.chat.id}"
-            path = f"work/nabilanavab/{message.message.chat.id}/{message.message.from_user.id}"
+            pat = f"{ROOT}/{message.message.chat.id}"
+            path = f"{ROOT}/{message.message.chat.id}/{message.message.from_user.id}"
+        
+        # every file of a batch gets a directory of its own [plugins/dm/batch.py]
+        if getattr(message, "part", None) is not None:
+            path = f"{path}/{message.part}"
     
     if work == "create":
         
@@ -58,34 +84,92 @@ async def work(
             return False   # Return False if the path already exists
         
         os.makedirs(path)  # Create the directory
+        progress.reset(path)
         return path        # Return the path of the created directory
     
+    elif work == "queue":
+        
+        # Saved on shutdown until it finishes, resumed by the next start [drain.py]
+        if not mtype:
+            drain.track(message)
+        
+        # jobs of a chat wait for the same directory, the key tells them apart
+        message.job = f"{path}#{uuid.uuid4().hex[:8]}"
+        
+        # Wait for a free slot in the global job queue [plugins/utils/scheduler.py]
+        if not await scheduler.join(path, notify, lane, need, message.job):
+            if not mtype and not scheduler.draining():
+                drain.forget(message)
+            # INDEX text telling why [queueFull, draining, inWork]
+            message.refused = scheduler.refusal(message.job)
+            return False   # Return False if the queue is full or the bot restarts
+        
+        os.makedirs(path, exist_ok = True)
+        progress.reset(message.job)
+        return path
+    
     elif work == "check":
         # Check if the path exists
         return path if os.path.exists(path) else False
     
+    elif work == "path":
+        # Path of the directory, even if it doesn't exist [eg: jobs of a worker]
+        return path
+    
+    elif work == "job":
+        # Queued jobs have a key of their own, the others use their directory
+        return getattr(message, "job", None) or path
+    
     elif work == "delete":
         
+        job = getattr(message, "job", None)
+        if job is not None:
+            # A queued job cleaning up after itself: until it got its slot the
+            # directory belongs to the job the chat is running [if any]
+            owner = scheduler.holds(job)
+            progress.release(job)
+        elif path in BATCHES:
+            # Only the batch removes its directory, the cancel button of a
+            # file carries its part [plugins/dm/start.py]
+            return False
+        else:
+            # The user stops the running job [if any] of the chat
+            job, owner = scheduler.holder(path), True
+            progress.cancel(path)
+            if job is not None:
+                progress.cancel(job)
+        if not mtype:
+            drain.forget(message)
+        
         # Handle directory deletion based on the context
-        if (
+        if not owner:
+            pass
+        
+        elif (
             mtype
             and message.chat.type != enums.ChatType.PRIVATE
             and len(os.listdir(pat)) == 1
         ):
-            return shutil.rmtree(pat, ignore_errors = True)
+            shutil.rmtree(pat, ignore_errors = True)
         
         elif not mtype and message.message is None:
             # inline message
-            return shutil.rmtree(path, ignore_errors = True)
+            shutil.rmtree(path, ignore_errors = True)
         
         elif (
             not mtype
             and message.message.chat.type != enums.ChatType.PRIVATE
             and len(os.listdir(pat)) == 1
         ):
-            return shutil.rmtree(pat, ignore_errors = True)
+            shutil.rmtree(pat, ignore_errors = True)
+        
+        else:
+            shutil.rmtree(path, ignore_errors = True)
         
-        return shutil.rmtree(path, ignore_errors = True)
+        # Release the slot once the directory is gone, so the next job of
+        # the chat starts right away [not at the next poll of the queue]
+        if job is not None:
+            scheduler.leave(job)
 
 
 # If you have any questions or suggestions, please feel free to reach out.